@@ -7,9 +7,18 @@ that has been scraped and stored in the database.
 
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status
+)
 from sqlalchemy.orm import Session
 from backend.database.db import get_session
+from backend.database.repositories.report import DEFAULT_SORT, SORT_FIELDS
 from backend.database.repositories import (
     ReportRepository,
     FinancialDataCoordinator,
@@ -28,6 +37,7 @@ from backend.schemas import (
     IncomeStatementItemResponse,
     CashFlowItemResponse
 )
+from backend.services.processors import ReportFingerprintStore
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +46,8 @@ router = APIRouter(prefix="/financial", tags=["financial"])
 
 @router.get("/reports", response_model=List[FinancialReportResponse])
 async def get_reports(
+    request: Request,
+    response: Response,
     symbol: Optional[str] = Query(
         None, description="Filter by stock symbol"
     ),
@@ -45,45 +57,95 @@ async def get_reports(
     report_year: Optional[int] = Query(
         None, description="Filter by report year"
     ),
+    report_quarter: Optional[int] = Query(
+        None, ge=1, le=4, description="Filter by report quarter"
+    ),
+    is_audited: Optional[bool] = Query(
+        None, description="Filter by audit status"
+    ),
+    is_reviewed: Optional[bool] = Query(
+        None, description="Filter by review status"
+    ),
+    sort: str = Query(
+        ",".join(DEFAULT_SORT),
+        description=(
+            "Comma-separated sort fields, '-' for descending: "
+            f"{', '.join(SORT_FIELDS)}"
+        )
+    ),
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of results"
     ),
     offset: int = Query(
         0, ge=0, description="Number of results to skip"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "X-Next-Cursor of the previous page; pages the default sort "
+            "without an offset"
+        )
+    ),
     db: Session = Depends(get_session)
 ) -> List[FinancialReportResponse]:
-    """Get financial reports with optional filtering and pagination.
+    """Get financial reports with optional filtering, sorting and paging.
+
+    Filters, sorting and paging are applied by the database. The body is
+    the page as a list, as before; the total number of matching reports
+    is sent in the ``X-Total-Count`` header. In the default order, a full
+    page also sends the cursor of the next one in ``X-Next-Cursor`` and
+    a ``Link: <...>; rel="next"`` header. Cursor pages stay as fast as
+    the first page however deep they go.
 
     Args:
+        request: Incoming request, for the next page link
+        response: Outgoing response, for the paging headers
         symbol: Filter by stock symbol
         report_type: Filter by report type (annual/quarterly)
         report_year: Filter by report year
+        report_quarter: Filter by report quarter
+        is_audited: Filter by audit status
+        is_reviewed: Filter by review status
+        sort: Comma-separated sort fields
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor of the next page from a previous response
         db: Database session
 
     Returns:
-        List of financial reports
+        One page of financial reports
+
+    Raises:
+        HTTPException: If a sort field is not supported or the cursor is
+            invalid
     """
     repository = ReportRepository(db)
 
-    if symbol:
-        reports = repository.get_by_symbol(symbol)
-    else:
-        reports = repository.get_all(limit=limit, offset=offset)
-
-    if report_type:
-        reports = [
-            r for r in reports
-            if getattr(r, 'report_type', None) == report_type
-        ]
+    try:
+        reports, total, next_cursor = repository.search(
+            limit=limit,
+            offset=offset,
+            sort=[field.strip() for field in sort.split(",") if field.strip()],
+            cursor=cursor,
+            symbol=symbol,
+            report_type=report_type,
+            report_year=report_year,
+            report_quarter=report_quarter,
+            is_audited=is_audited,
+            is_reviewed=is_reviewed
+        )
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        ) from error
 
-    if report_year:
-        reports = [
-            r for r in reports
-            if getattr(r, 'report_year', None) == report_year
-        ]
+    response.headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        next_url = request.url.remove_query_params("offset")
+        next_url = next_url.include_query_params(cursor=next_cursor)
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
 
     return [FinancialReportResponse.model_validate(r) for r in reports]
 
@@ -157,6 +219,8 @@ async def delete_report(
         HTTPException: If report not found
     """
     repository = ReportRepository(db)
+    report = repository.get_by_id(report_id)
+    symbol = report.symbol if report else None
     deleted = repository.delete(report_id)
 
     if not deleted:
@@ -165,6 +229,9 @@ async def delete_report(
             detail=f"Report with ID {report_id} not found"
         )
 
+    # The next scrape must re-insert the deleted row
+    ReportFingerprintStore().invalidate(symbol)
+
     return {"message": f"Report {report_id} deleted successfully"}
 
 
@@ -184,6 +251,7 @@ async def delete_reports_by_symbol(
     """
     repository = ReportRepository(db)
     count = repository.delete_by_symbol(symbol)
+    ReportFingerprintStore().invalidate(symbol)
 
     return {
         "message": f"Deleted {count} reports for symbol {symbol}",
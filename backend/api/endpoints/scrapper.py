@@ -3,50 +3,95 @@ Scrapper API endpoints.
 
 This module provides REST API endpoints for scraping financial reports:
 - Single symbol scraping
-- Bulk symbol scraping
+- Bulk symbol scraping with bounded concurrency, optionally streamed
+  per symbol as NDJSON or Server-Sent Events
+- Incremental updates that skip unchanged report rows
+- Background scrape jobs with status and result endpoints
+- Failure handling statistics and no-data cache management
 - Integration with database storage
+
+Scraping and database work is blocking, so it runs in worker threads
+rather than on the event loop.
 """
 
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from pydantic import ValidationError
-from backend.database.db import get_session
+from backend.core import settings
+from backend.database.db import get_session, create_session
 from backend.database.repositories import ReportRepository
 from backend.schemas import (
     ScrapperRequest,
+    ReportChangeSummary,
     ScrapperResponse,
     BulkScrapperRequest,
+    BulkScrapeSummary,
     BulkScrapperResponse,
-    FinancialReportCreate,
-    FinancialReportResponse
+    BulkScrapeStreamRecord,
+    ScrapeJobResponse,
+    StreamFormat,
+    dump_reports,
+    report_responses,
+    validate_reports
+)
+from backend.services.scrappers import (
+    BulkScrapeEngine,
+    CircuitOpenError,
+    TabbedCafeFScraper,
+    fetch_reports,
+    driver_pool_stats,
+    exchange_stats,
+    get_no_data_cache,
+    readiness_stats,
+    resilience_stats,
+    traffic_stats
+)
+from backend.services.cache import http_cache_stats
+from backend.services.jobs import (
+    STATUS_QUEUED,
+    get_job_manager,
+    register_handler
+)
+from backend.services.processors import (
+    ReportFingerprintStore,
+    process_reports
 )
-from backend.services.scrappers import CafeFScraper
-from backend.services.processors import process_reports
+from backend.services.records import RawReport
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/scrapper", tags=["scrapper"])
 
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
 
-@router.post("/scrape", response_model=ScrapperResponse)
-async def scrape_symbol(
+
+def _scrape_and_store(
     request: ScrapperRequest,
-    db: Session = Depends(get_session)
+    db: Session,
+    prefetched: Optional[Tuple[List[RawReport], str]] = None
 ) -> ScrapperResponse:
-    """Scrape financial reports for a single stock symbol.
+    """Scrape, process and store financial reports for one symbol.
 
-    This endpoint:
+    This function:
     1. Scrapes report metadata from CafeF website
-    2. Processes and validates the data
-    3. Saves to database (always enabled)
-    4. Returns the scraped reports
+    2. In incremental mode (opt-in), compares the rows with the last
+       scrape and keeps only the report periods that changed
+    3. Processes and validates the data
+    4. Saves to database (always enabled)
+    5. Returns the scraped reports
 
     Args:
         request (ScrapperRequest): Scraping configuration
         db (Session): Database session
+        prefetched (tuple, optional): Raw reports and their source when
+            the listing was already fetched, e.g. by a multi-tab browser
 
     Returns:
         ScrapperResponse: Scraping results with statistics
@@ -54,68 +99,87 @@ async def scrape_symbol(
     Raises:
         HTTPException: If scraping fails or validation errors occur
     """
-    logger.info("Scraping symbol: %s", request.symbol)
+    logger.info(
+        "Scraping symbol: %s (fetch_mode=%s)",
+        request.symbol, request.fetch_mode
+    )
 
-    scraper = None
     try:
-        scraper = CafeFScraper(headless=request.headless)
-        scraper.init_webdriver()
-        raw_reports = scraper.scrape_symbol(request.symbol)
+        raw_reports, source = prefetched or fetch_reports(
+            request.symbol,
+            fetch_mode=request.fetch_mode,
+            headless=request.headless
+        )
 
         if not raw_reports:
             return ScrapperResponse(
                 success=True,
                 message=f"No reports found for symbol: {request.symbol}",
                 symbol=request.symbol,
-                reports_count=0
+                reports_count=0,
+                source=source
             )
 
+        # Full scrapes refresh the fingerprints too, so a later
+        # incremental scrape compares with what is stored
+        fingerprints = ReportFingerprintStore()
+        changes = fingerprints.diff(request.symbol, raw_reports)
+        summary = None
+        if request.incremental:
+            summary = ReportChangeSummary(**changes.summary())
+
+            if not changes.has_changes:
+                logger.info("No report changes for %s", request.symbol)
+                return ScrapperResponse(
+                    success=True,
+                    message=f"No changes for symbol: {request.symbol}",
+                    symbol=request.symbol,
+                    reports_count=0,
+                    source=source,
+                    changes=summary
+                )
+            raw_reports = changes.affected_reports
+
         processed_reports = process_reports(raw_reports)
         if not processed_reports:
+            fingerprints.commit(changes)
             return ScrapperResponse(
                 success=True,
                 message=f"""
                     All reports filtered out for symbol: {request.symbol}
                 """,
                 symbol=request.symbol,
-                reports_count=0
+                reports_count=0,
+                source=source,
+                changes=summary
             )
 
-        validated_reports = []
-        validation_errors = []
-        for report in processed_reports:
-            try:
-                validated = FinancialReportCreate(**report)
-                validated_reports.append(validated)
-            except ValidationError as error:
-                logger.warning("Validation error for report: %s", error)
-                validation_errors.append(str(error))
+        validated_reports, validation_errors = validate_reports(
+            [report._asdict() for report in processed_reports]
+        )
+        for failure in validation_errors:
+            logger.warning(
+                "Validation error for report %d of %s: %s",
+                failure.index, request.symbol, "; ".join(failure.errors)
+            )
 
         if not validated_reports:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail={
                     "message": "All reports failed validation",
-                    "errors": validation_errors
+                    "errors": [
+                        failure.model_dump() for failure in validation_errors
+                    ]
                 }
             )
 
-        created_count = 0
-        updated_count = 0
-        saved_reports = []
-        repository = ReportRepository(db)
-
-        for validated_report in validated_reports:
-            report_dict = validated_report.model_dump()
-            saved_report, created = repository.upsert(report_dict)
-            if created:
-                created_count += 1
-            else:
-                updated_count += 1
-
-            saved_reports.append(
-                FinancialReportResponse.model_validate(saved_report)
-            )
+        report_rows = dump_reports(validated_reports)
+        stored = ReportRepository(db).upsert_bulk(report_rows)
+        saved_reports = report_responses(report_rows, stored['ids'])
+
+        if not validation_errors:
+            fingerprints.commit(changes)
 
         return ScrapperResponse(
             success=True,
@@ -125,9 +189,12 @@ async def scrape_symbol(
             """,
             symbol=request.symbol,
             reports_count=len(validated_reports),
-            created_count=created_count,
-            updated_count=updated_count,
-            reports=saved_reports
+            created_count=stored['created'],
+            updated_count=stored['updated'],
+            source=source,
+            changes=summary,
+            reports=saved_reports,
+            validation_errors=validation_errors or None
         )
 
     except ValueError as error:
@@ -137,6 +204,24 @@ async def scrape_symbol(
             detail=f"Failed to scrape {request.symbol}: {str(error)}"
         ) from error
 
+    except CircuitOpenError as error:
+        logger.warning("Scraping paused for %s: %s", request.symbol, error)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(error),
+            headers={"Retry-After": str(max(1, round(error.retry_after)))}
+        ) from error
+
+    except TimeoutError as error:
+        logger.error("No WebDriver available for %s", request.symbol)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Scraper busy, retry later: {str(error)}"
+        ) from error
+
+    except HTTPException:
+        raise
+
     except Exception as error:
         logger.error(
             "Unexpected error scraping %s: %s",
@@ -147,86 +232,552 @@ async def scrape_symbol(
             detail=f"Internal server error: {str(error)}"
         ) from error
 
+
+@router.post("/scrape", response_model=ScrapperResponse)
+async def scrape_symbol(
+    request: ScrapperRequest,
+    db: Session = Depends(get_session)
+) -> ScrapperResponse:
+    """Scrape financial reports for a single stock symbol.
+
+    Args:
+        request (ScrapperRequest): Scraping configuration
+        db (Session): Database session
+
+    Returns:
+        ScrapperResponse: Scraping results with statistics
+
+    Raises:
+        HTTPException: If scraping fails or validation errors occur
+    """
+    return await run_in_threadpool(_scrape_and_store, request, db)
+
+
+def _scrape_symbol_task(
+    symbol: str,
+    request: BulkScrapperRequest,
+    prefetched: Optional[Tuple[List[RawReport], str]] = None
+) -> ScrapperResponse:
+    """Scrape one symbol of a bulk request in its own database session.
+
+    Errors are reported in the returned response instead of being raised,
+    so one failing symbol never aborts the batch.
+
+    Args:
+        symbol (str): Stock symbol to scrape
+        request (BulkScrapperRequest): Bulk scraping configuration
+        prefetched (tuple, optional): Already fetched raw reports and
+            their source
+
+    Returns:
+        ScrapperResponse: Result for the symbol
+    """
+    session_factory = create_session()
+    db = session_factory()
+    try:
+        single_request = ScrapperRequest(
+            symbol=symbol,
+            headless=request.headless,
+            fetch_mode=request.fetch_mode,
+            incremental=request.incremental
+        )
+        return _scrape_and_store(single_request, db, prefetched)
+
+    except HTTPException as error:
+        logger.warning("Failed to scrape %s: %s", symbol, error.detail)
+        return ScrapperResponse(
+            success=False,
+            message=str(error.detail),
+            symbol=symbol,
+            reports_count=0
+        )
+
+    except Exception as error:
+        logger.error("Unexpected error scraping %s: %s", symbol, error)
+        return ScrapperResponse(
+            success=False,
+            message=f"Unexpected error: {str(error)}",
+            symbol=symbol,
+            reports_count=0
+        )
+
     finally:
-        if scraper:
-            scraper.quit()
+        db.close()
+
+
+def _store_tabbed(
+    symbol: str,
+    request: BulkScrapperRequest,
+    fetched: Tuple[Optional[list], Optional[Exception]]
+) -> ScrapperResponse:
+    """Process and store one listing fetched by the multi-tab browser.
+
+    Args:
+        symbol (str): Stock symbol
+        request (BulkScrapperRequest): Bulk scraping configuration
+        fetched (Tuple[list or None, Exception or None]): The symbol's
+            reports and the error if fetching failed
+
+    Returns:
+        ScrapperResponse: Result of the symbol
+    """
+    reports, error = fetched
+    if error is not None:
+        return ScrapperResponse(
+            success=False,
+            message=f"Failed to scrape {symbol}: {str(error)}",
+            symbol=symbol,
+            reports_count=0
+        )
+    return _scrape_symbol_task(symbol, request, (reports, "browser"))
+
+
+def _iter_tabbed(
+    request: BulkScrapperRequest
+) -> Iterator[Tuple[str, ScrapperResponse]]:
+    """Fetch listings in one multi-tab browser, then process and store.
+
+    The tabs are polled on their own thread and every finished listing
+    goes to a worker, so storing one symbol never stalls the others'
+    polling while their readiness timeouts run.
+
+    Args:
+        request (BulkScrapperRequest): Bulk scraping configuration
+
+    Yields:
+        Tuple[str, ScrapperResponse]: Symbol and its result, in completion
+        order
+    """
+    with TabbedCafeFScraper(
+        headless=request.headless,
+        lean=settings.SCRAPER_LEAN_PROFILE,
+        tabs=request.tabs
+    ) as scraper:
+        listings = (
+            (symbol, (reports, error))
+            for symbol, reports, error
+            in scraper.iter_symbols(request.symbols)
+        )
+        yield from BulkScrapeEngine(max_workers=request.max_workers).process(
+            listings,
+            lambda symbol, fetched: _store_tabbed(symbol, request, fetched)
+        )
+
+
+def _iter_bulk(
+    request: BulkScrapperRequest
+) -> Iterator[Tuple[str, ScrapperResponse]]:
+    """Scrape all symbols of a bulk request, yielding each when done.
+
+    Args:
+        request (BulkScrapperRequest): Bulk scraping configuration
+
+    Yields:
+        Tuple[str, ScrapperResponse]: Symbol and its result, in completion
+        order
+    """
+    if request.tabs and request.fetch_mode == "browser":
+        return _iter_tabbed(request)
+    return BulkScrapeEngine(max_workers=request.max_workers).run(
+        request.symbols,
+        lambda symbol: _scrape_symbol_task(symbol, request)
+    )
+
+
+class _BulkTally:
+    """Running totals of a bulk scrape."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.done = 0
+        self.successful = 0
+        self.failed = 0
+        self.reports = 0
+        self.created = 0
+        self.updated = 0
+
+    def add(self, result: ScrapperResponse) -> None:
+        """Count the result of one symbol."""
+        self.done += 1
+        if result.success:
+            self.successful += 1
+            self.reports += result.reports_count
+            self.created += result.created_count
+            self.updated += result.updated_count
+        else:
+            self.failed += 1
+
+    def summary(self) -> BulkScrapeSummary:
+        """Build the summary of the symbols counted so far."""
+        return BulkScrapeSummary(
+            success=self.failed == 0,
+            message=f"""
+            Processed {self.total} symbols: {self.successful}
+            succeeded, {self.failed} failed
+            """,
+            total_symbols=self.total,
+            successful_symbols=self.successful,
+            failed_symbols=self.failed,
+            total_reports=self.reports,
+            total_created=self.created,
+            total_updated=self.updated
+        )
+
+
+def _run_bulk(
+    request: BulkScrapperRequest,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> BulkScrapperResponse:
+    """Scrape all symbols of a bulk request concurrently.
+
+    Args:
+        request (BulkScrapperRequest): Bulk scraping configuration
+        progress (Callable, optional): Called with (done, total) after
+            each symbol finishes
+
+    Returns:
+        BulkScrapperResponse: Aggregated results for all symbols
+    """
+    results_by_symbol: Dict[str, ScrapperResponse] = {}
+    tally = _BulkTally(len(request.symbols))
+
+    for symbol, result in _iter_bulk(request):
+        results_by_symbol[symbol] = result
+        tally.add(result)
+
+        if progress is not None:
+            progress(tally.done, tally.total)
+
+    return BulkScrapperResponse(
+        **tally.summary().model_dump(),
+        results=[results_by_symbol[symbol] for symbol in request.symbols]
+    )
+
+
+def _encode_record(record: BulkScrapeStreamRecord, fmt: str) -> str:
+    """Serialize a stream record as an NDJSON line or an SSE event."""
+    data = record.model_dump_json(exclude_none=True)
+    if fmt == "sse":
+        return f"event: {record.type}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+def _stream_bulk(request: BulkScrapperRequest, fmt: str) -> Iterator[str]:
+    """Scrape a bulk request and emit one record per finished symbol.
+
+    Only running totals are kept, so memory does not grow with the
+    number of symbols. The stream ends with a summary record, or with an
+    error record if the run aborts.
+
+    Args:
+        request (BulkScrapperRequest): Bulk scraping configuration
+        fmt (str): 'ndjson' or 'sse'
+
+    Yields:
+        str: Encoded records
+    """
+    tally = _BulkTally(len(request.symbols))
+
+    try:
+        for _, result in _iter_bulk(request):
+            tally.add(result)
+            yield _encode_record(
+                BulkScrapeStreamRecord(
+                    type="result",
+                    done=tally.done,
+                    total=tally.total,
+                    result=result
+                ),
+                fmt
+            )
+    except Exception as error:
+        logger.error("Streamed bulk scrape aborted: %s", error, exc_info=True)
+        yield _encode_record(
+            BulkScrapeStreamRecord(
+                type="error",
+                done=tally.done,
+                total=tally.total,
+                error=str(error)
+            ),
+            fmt
+        )
+        return
+
+    yield _encode_record(
+        BulkScrapeStreamRecord(
+            type="summary",
+            done=tally.done,
+            total=tally.total,
+            summary=tally.summary()
+        ),
+        fmt
+    )
 
 
 @router.post("/scrape-bulk", response_model=BulkScrapperResponse)
 async def scrape_bulk(
-    request: BulkScrapperRequest,
-    db: Session = Depends(get_session)
+    request: BulkScrapperRequest
 ) -> BulkScrapperResponse:
     """Scrape financial reports for multiple stock symbols.
 
-    This endpoint processes multiple symbols sequentially,
-    providing individual results for each symbol.
+    Symbols are processed by a bounded pool of workers, each using its
+    own database session, while a per-host rate limit caps the combined
+    request rate. Results are returned in the order of the request.
 
     Args:
         request (BulkScrapperRequest): Bulk scraping configuration
-        db (Session): Database session
 
     Returns:
         BulkScrapperResponse: Aggregated results for all symbols
     """
     logger.info("Bulk scraping %d symbols", len(request.symbols))
 
-    results: List[ScrapperResponse] = []
-    total_reports = 0
-    total_created = 0
-    total_updated = 0
-    successful_count = 0
-    failed_count = 0
-
-    for symbol in request.symbols:
-        try:
-            single_request = ScrapperRequest(
-                symbol=symbol,
-                headless=request.headless
-            )
-            result = await scrape_symbol(single_request, db)
-            results.append(result)
-
-            if result.success:
-                successful_count += 1
-                total_reports += result.reports_count
-                total_created += result.created_count
-                total_updated += result.updated_count
-            else:
-                failed_count += 1
-
-        except HTTPException as error:
-            logger.warning("Failed to scrape %s: %s", symbol, error.detail)
-            failed_count += 1
-            results.append(ScrapperResponse(
-                success=False,
-                message=str(error.detail),
-                symbol=symbol,
-                reports_count=0
-            ))
-
-        except Exception as error:
-            logger.error("Unexpected error scraping %s: %s", symbol, error)
-            failed_count += 1
-
-            results.append(ScrapperResponse(
-                success=False,
-                message=f"Unexpected error: {str(error)}",
-                symbol=symbol,
-                reports_count=0
-            ))
+    return await run_in_threadpool(_run_bulk, request)
 
-    return BulkScrapperResponse(
-        success=failed_count == 0,
-        message=f"""
-        Processed {len(request.symbols)} symbols: {successful_count}
-        succeeded, {failed_count} failed
-        """,
-        total_symbols=len(request.symbols),
-        successful_symbols=successful_count,
-        failed_symbols=failed_count,
-        total_reports=total_reports,
-        total_created=total_created,
-        total_updated=total_updated,
-        results=results
+
+@router.post("/scrape-bulk/stream")
+async def scrape_bulk_stream(
+    request: BulkScrapperRequest,
+    fmt: StreamFormat = Query("ndjson", alias="format")
+) -> StreamingResponse:
+    """Scrape multiple stock symbols, streaming each result as it is done.
+
+    The response is newline-delimited JSON (``format=ndjson``) or
+    Server-Sent Events (``format=sse``) of ``BulkScrapeStreamRecord``: one
+    'result' record per symbol in completion order, then a 'summary'
+    record.
+
+    Args:
+        request (BulkScrapperRequest): Bulk scraping configuration
+        fmt (str): Stream format, 'ndjson' or 'sse'
+
+    Returns:
+        StreamingResponse: The record stream
+    """
+    logger.info("Streaming bulk scrape of %d symbols", len(request.symbols))
+
+    # A sync iterator is consumed in a worker thread by StreamingResponse
+    return StreamingResponse(
+        _stream_bulk(request, fmt),
+        media_type=STREAM_MEDIA_TYPES[fmt],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/stats")
+async def get_scrapper_stats() -> dict:
+    """Get runtime statistics of the scraping subsystem.
+
+    Returns:
+        dict: WebDriver pool counters, page readiness timings,
+        per-profile network traffic, exchange resolution, HTTP cache
+        counters, circuit breaker states, retries and no-data cache
+        counters
+    """
+    return {
+        "driver_pools": driver_pool_stats(),
+        "exchange_resolution": exchange_stats(),
+        "http_cache": http_cache_stats(),
+        "readiness": readiness_stats(),
+        "resilience": resilience_stats(),
+        "traffic": traffic_stats()
+    }
+
+
+@router.delete("/no-data/{symbol}")
+async def forget_no_data_symbol(symbol: str) -> dict:
+    """Remove a symbol from the no-data cache so it is scraped again.
+
+    Args:
+        symbol (str): Stock symbol
+
+    Returns:
+        dict: Success message
+
+    Raises:
+        HTTPException: If the symbol is not in the cache
+    """
+    removed = await run_in_threadpool(
+        get_no_data_cache().invalidate, symbol
+    )
+    if not removed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Symbol {symbol} is not in the no-data cache"
+        )
+    return {"message": f"Symbol {symbol} removed from the no-data cache"}
+
+
+def _scrape_job(
+    payload: Dict[str, Any],
+    progress: Callable[[int, int], None]
+) -> Dict[str, Any]:
+    """Job handler running a single-symbol scrape.
+
+    Args:
+        payload (dict): Serialized ScrapperRequest
+        progress (Callable): Progress callback
+
+    Returns:
+        dict: Serialized ScrapperResponse
+
+    Raises:
+        RuntimeError: If the scrape fails
+    """
+    request = ScrapperRequest(**payload)
+    session_factory = create_session()
+    db = session_factory()
+    try:
+        result = _scrape_and_store(request, db)
+    except HTTPException as error:
+        raise RuntimeError(str(error.detail)) from error
+    finally:
+        db.close()
+
+    progress(1, 1)
+    return result.model_dump(mode="json")
+
+
+def _scrape_bulk_job(
+    payload: Dict[str, Any],
+    progress: Callable[[int, int], None]
+) -> Dict[str, Any]:
+    """Job handler running a bulk scrape.
+
+    Args:
+        payload (dict): Serialized BulkScrapperRequest
+        progress (Callable): Progress callback
+
+    Returns:
+        dict: Serialized BulkScrapperResponse
+    """
+    request = BulkScrapperRequest(**payload)
+    return _run_bulk(request, progress).model_dump(mode="json")
+
+
+register_handler("scrape", _scrape_job)
+register_handler("scrape-bulk", _scrape_bulk_job)
+
+
+@router.post(
+    "/jobs/scrape",
+    response_model=ScrapeJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_scrape_job(request: ScrapperRequest) -> ScrapeJobResponse:
+    """Queue a background scrape of a single symbol.
+
+    Args:
+        request (ScrapperRequest): Scraping configuration
+
+    Returns:
+        ScrapeJobResponse: The queued job; poll it for the result
+    """
+    job = await run_in_threadpool(
+        get_job_manager().submit, "scrape", request.model_dump(), 1
+    )
+    return ScrapeJobResponse(**job)
+
+
+@router.post(
+    "/jobs/scrape-bulk",
+    response_model=ScrapeJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_scrape_bulk_job(
+    request: BulkScrapperRequest
+) -> ScrapeJobResponse:
+    """Queue a background scrape of multiple symbols.
+
+    Args:
+        request (BulkScrapperRequest): Bulk scraping configuration
+
+    Returns:
+        ScrapeJobResponse: The queued job; poll it for progress and result
+    """
+    job = await run_in_threadpool(
+        get_job_manager().submit,
+        "scrape-bulk",
+        request.model_dump(),
+        len(request.symbols)
+    )
+    return ScrapeJobResponse(**job)
+
+
+@router.get("/jobs", response_model=List[ScrapeJobResponse])
+async def list_scrape_jobs(
+    job_status: Optional[str] = Query(
+        None, alias="status", description="Filter by job status"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Maximum jobs")
+) -> List[ScrapeJobResponse]:
+    """List background scrape jobs, newest first.
+
+    Args:
+        job_status: Filter by job status
+        limit: Maximum number of jobs
+
+    Returns:
+        List of jobs
+    """
+    jobs = await run_in_threadpool(
+        get_job_manager().store.list, job_status, limit
+    )
+    return [ScrapeJobResponse(**job) for job in jobs]
+
+
+@router.get("/jobs/{job_id}", response_model=ScrapeJobResponse)
+async def get_scrape_job(job_id: str) -> ScrapeJobResponse:
+    """Get the status, progress and result of a background scrape job.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        The job
+
+    Raises:
+        HTTPException: If the job is not found
+    """
+    job = await run_in_threadpool(get_job_manager().store.get, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+    return ScrapeJobResponse(**job)
+
+
+@router.delete("/jobs/{job_id}", response_model=ScrapeJobResponse)
+async def cancel_scrape_job(job_id: str) -> ScrapeJobResponse:
+    """Cancel a background scrape job that has not started yet.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        The cancelled job
+
+    Raises:
+        HTTPException: If the job is not found or no longer queued
+    """
+    store = get_job_manager().store
+    job = await run_in_threadpool(store.get, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    cancelled = (
+        job["status"] == STATUS_QUEUED
+        and await run_in_threadpool(store.cancel, job_id)
     )
+    if not cancelled:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} is {job['status']} and cannot be cancelled"
+        )
+
+    job = await run_in_threadpool(store.get, job_id)
+    return ScrapeJobResponse(**job)
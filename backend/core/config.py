@@ -50,6 +50,105 @@ class Settings(BaseSettings):
     LM_STUDIO_URL: str = Field(..., description="LM Studio API URL")
     LM_STUDIO_MODEL: str = Field(..., description="Local model for LM Studio")
 
+    # Scraper Settings
+    CAFEF_BASE_URL: str = Field(
+        "https://cafef.vn",
+        description="CafeF origin, overridable to point at a local stand-in"
+    )
+    SCRAPER_POOL_SIZE: int = Field(
+        2, description="Maximum number of pooled WebDriver instances"
+    )
+    SCRAPER_POOL_WARMUP: int = Field(
+        1, description="WebDriver instances started when the app boots"
+    )
+    SCRAPER_MAX_PAGES: int = Field(
+        100, description="Pages a pooled WebDriver loads before recycling"
+    )
+    SCRAPER_MAX_AGE: int = Field(
+        1800, description="Seconds a pooled WebDriver lives before recycling"
+    )
+    SCRAPER_LEASE_TIMEOUT: int = Field(
+        120, description="Seconds to wait for a free pooled WebDriver"
+    )
+    SCRAPER_MAX_RSS_MB: int = Field(
+        1024,
+        description="Memory of a pooled browser's processes before recycling"
+    )
+    SCRAPER_LEAN_PROFILE: bool = Field(
+        False,
+        description="Block images, fonts and ad networks in pooled browsers"
+    )
+    SCRAPER_CAPTURE_TRAFFIC: bool = Field(
+        False,
+        description="Measure per-page browser traffic and lean savings"
+    )
+    SCRAPER_TABS_PER_BROWSER: int = Field(
+        4, description="Default tab count of a multi-tab browser"
+    )
+    SCRAPER_BULK_WORKERS: int = Field(
+        4, description="Worker threads used by bulk scraping"
+    )
+    SCRAPER_HOST_RATE: float = Field(
+        2.0, description="Maximum requests per second sent to one host"
+    )
+    SCRAPER_HOST_BURST: int = Field(
+        4, description="Requests allowed back to back before rate limiting"
+    )
+    SCRAPER_EXCHANGE_TTL: int = Field(
+        2592000, description="Seconds a learned symbol exchange is cached"
+    )
+    SCRAPER_EXCHANGE_NEGATIVE_TTL: int = Field(
+        86400, description="Seconds an unresolved symbol is skipped"
+    )
+    SCRAPER_NO_DATA_TTL: int = Field(
+        86400, description="Seconds a symbol without report data is skipped"
+    )
+    SCRAPER_RETRY_ATTEMPTS: int = Field(
+        3, description="Attempts of a browser scrape on transient errors"
+    )
+    SCRAPER_RETRY_BACKOFF: float = Field(
+        1.0, description="Base delay in seconds between scrape retries"
+    )
+    SCRAPER_BREAKER_ERROR_RATE: float = Field(
+        0.5, description="Failure share that pauses scraping of a host"
+    )
+    SCRAPER_BREAKER_MIN_CALLS: int = Field(
+        10, description="Requests in the window before the breaker may open"
+    )
+    SCRAPER_BREAKER_WINDOW: int = Field(
+        60, description="Seconds of request outcomes the breaker considers"
+    )
+    SCRAPER_BREAKER_COOLDOWN: int = Field(
+        60, description="Seconds scraping of a host pauses once it trips"
+    )
+
+    # LOCAL STATE
+    STATE_DIR: str = Field(
+        ".state", description="Directory for local scraper state (SQLite)"
+    )
+
+    # HTTP CACHE
+    HTTP_CACHE_ENABLED: bool = Field(
+        True, description="Cache fetched pages and report files on disk"
+    )
+    HTTP_CACHE_MAX_MB: int = Field(
+        512, description="Maximum size of the on-disk HTTP cache in MiB"
+    )
+    HTTP_CACHE_PAGE_TTL: int = Field(
+        900, description="Seconds cached listing pages stay fresh"
+    )
+    HTTP_CACHE_FILE_TTL: int = Field(
+        2592000, description="Seconds cached report files stay fresh"
+    )
+
+    # BACKGROUND JOBS
+    SCRAPER_JOB_WORKERS: int = Field(
+        2, description="Worker threads executing background scrape jobs"
+    )
+    SCRAPER_JOB_RETENTION: int = Field(
+        604800, description="Seconds finished jobs are kept before purging"
+    )
+
     @field_validator("DB_PASSWORD", "SECRET_KEY")
     @classmethod
     def validate_not_empty(cls, value: str) -> str:
@@ -68,7 +167,29 @@ class Settings(BaseSettings):
             )
         return value
 
-    @field_validator("ACCESS_TOKEN_EXPIRE_MINUTES")
+    @field_validator(
+        "ACCESS_TOKEN_EXPIRE_MINUTES",
+        "SCRAPER_POOL_SIZE",
+        "SCRAPER_MAX_PAGES",
+        "SCRAPER_MAX_AGE",
+        "SCRAPER_LEASE_TIMEOUT",
+        "SCRAPER_MAX_RSS_MB",
+        "SCRAPER_TABS_PER_BROWSER",
+        "SCRAPER_BULK_WORKERS",
+        "SCRAPER_HOST_BURST",
+        "SCRAPER_EXCHANGE_TTL",
+        "SCRAPER_EXCHANGE_NEGATIVE_TTL",
+        "SCRAPER_NO_DATA_TTL",
+        "SCRAPER_RETRY_ATTEMPTS",
+        "SCRAPER_BREAKER_MIN_CALLS",
+        "SCRAPER_BREAKER_WINDOW",
+        "SCRAPER_BREAKER_COOLDOWN",
+        "HTTP_CACHE_MAX_MB",
+        "HTTP_CACHE_PAGE_TTL",
+        "HTTP_CACHE_FILE_TTL",
+        "SCRAPER_JOB_WORKERS",
+        "SCRAPER_JOB_RETENTION"
+    )
     @classmethod
     def validate_positive(cls, value: int) -> int:
         """Validate that value is positive."""
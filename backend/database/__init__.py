@@ -3,11 +3,13 @@
 from backend.database.base import Base
 from backend.database.maintenance import (
     DatabaseExistence,
-    DatabaseMaintenance
+    DatabaseMaintenance,
+    QueryPlanCheck
 )
 
 __all__ = [
     "Base",
     "DatabaseExistence",
-    "DatabaseMaintenance"
+    "DatabaseMaintenance",
+    "QueryPlanCheck"
 ]
@@ -37,9 +37,9 @@ def get_engine() -> Engine:
             echo=False,
             isolation_level="READ COMMITTED",
             implicit_returning=False,
-            connect_args={
-                "fast_executemany": True,
-            }
+            # A dialect option: as a connect argument pyodbc only appends
+            # it to the connection string and executemany stays row by row
+            fast_executemany=True
         )
 
     return _engine
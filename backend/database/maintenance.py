@@ -2,21 +2,46 @@
 Database maintenance utilities.
 
 This module provides utilities for database cleanup and recreation,
-especially useful when tables are created in wrong database.
+especially useful when tables are created in wrong database, and a check
+that the hot report queries are answered by index seeks.
 """
 
 import logging
 import sys
-from sqlalchemy import create_engine, text
+from typing import List, Optional, Tuple
+from xml.etree import ElementTree
+from sqlalchemy import create_engine, delete, func, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import NullPool
 from backend.core.config import settings
 from backend.database.base import Base
+from backend.database.models import FinancialReport
+from backend.database.repositories.report import (
+    DEFAULT_SORT,
+    ReportRepository,
+    seek_after
+)
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SHOWPLAN_NAMESPACE = (
+    "{http://schemas.microsoft.com/sqlserver/2004/07/showplan}"
+)
+
+# Plan operators that read a whole table or index, or sort rows an index
+# should already deliver in order
+SQLSERVER_FULL_PASSES = {
+    "Table Scan",
+    "Index Scan",
+    "Clustered Index Scan",
+    "Sort",
+}
+SQLITE_FULL_PASSES = ("SCAN ", "USE TEMP B-TREE")
+
 
 class DatabaseExistence:
     """Class to check database and table existence."""
@@ -314,6 +339,164 @@ class DatabaseMaintenance:
             self.target_engine.dispose()
 
 
+class QueryPlanCheck:
+    """Check that the hot report queries seek indexes instead of scanning.
+
+    Each query the repository runs per symbol or per period is compiled
+    and explained without being executed (``SET SHOWPLAN_XML`` on SQL
+    Server, ``EXPLAIN QUERY PLAN`` on SQLite). A query fails the check
+    if its plan scans a table or index or sorts rows. Run it against a
+    populated database: on a nearly empty table a scan may be cheapest.
+    """
+
+    SAMPLE_SYMBOL = "fpt"
+
+    def __init__(self, engine: Optional[Engine] = None):
+        """Initialize with an engine, by default the target database.
+
+        Args:
+            engine (Engine, optional): Database to check
+        """
+        self.owns_engine = engine is None
+        self.engine = engine or create_engine(
+            settings.get_database_url(),
+            poolclass=NullPool,
+            echo=False,
+        )
+
+    def hot_queries(self, session: Session) -> List[Tuple[str, object]]:
+        """The repository queries to check, by repository method.
+
+        Args:
+            session (Session): Session to build the queries with
+
+        Returns:
+            list: (method name, statement) pairs
+        """
+        repository = ReportRepository(session)
+        by_symbol = repository.symbol_query(self.SAMPLE_SYMBOL)
+        return [
+            (
+                "find_duplicate",
+                repository.natural_key_query(
+                    self.SAMPLE_SYMBOL, "quarterly", 2024, 1
+                ).limit(1).statement
+            ),
+            (
+                "get_by_symbol",
+                by_symbol.order_by(
+                    FinancialReport.report_year.desc(),
+                    FinancialReport.report_quarter
+                ).statement
+            ),
+            (
+                "count_by_symbol",
+                by_symbol.with_entities(func.count()).statement
+            ),
+            (
+                "delete_by_symbol",
+                delete(FinancialReport).where(by_symbol.whereclause)
+            ),
+            (
+                "search (cursor page)",
+                repository.sort_query(
+                    session.query(FinancialReport), DEFAULT_SORT
+                ).filter(
+                    seek_after((self.SAMPLE_SYMBOL, 2024, 1, 1))
+                ).limit(100).statement
+            ),
+        ]
+
+    @staticmethod
+    def plan_operators(connection: Connection, statement) -> List[str]:
+        """Explain a statement without running it.
+
+        Args:
+            connection (Connection): Connection to explain on
+            statement: SQLAlchemy statement
+
+        Returns:
+            list: Plan operators (SQL Server) or plan steps (SQLite)
+
+        Raises:
+            ValueError: If the database is neither SQL Server nor SQLite
+        """
+        sql = str(statement.compile(
+            dialect=connection.dialect,
+            compile_kwargs={"literal_binds": True}
+        ))
+        dialect = connection.dialect.name
+
+        if dialect == "mssql":
+            connection.exec_driver_sql("SET SHOWPLAN_XML ON")
+            try:
+                plan = connection.exec_driver_sql(sql).scalar()
+            finally:
+                connection.exec_driver_sql("SET SHOWPLAN_XML OFF")
+            return [
+                operator.get("PhysicalOp")
+                for operator in ElementTree.fromstring(plan).iter(
+                    f"{SHOWPLAN_NAMESPACE}RelOp"
+                )
+            ]
+
+        if dialect == "sqlite":
+            return [
+                row[-1] for row in connection.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {sql}"
+                )
+            ]
+
+        raise ValueError(f"Query plans are not supported on {dialect}")
+
+    @staticmethod
+    def full_passes(operators: List[str]) -> List[str]:
+        """Operators of a plan that scan or sort.
+
+        Args:
+            operators (list): Output of ``plan_operators``
+
+        Returns:
+            list: The offending operators, empty if the plan only seeks
+        """
+        return [
+            operator for operator in operators
+            if operator in SQLSERVER_FULL_PASSES
+            or operator.startswith(SQLITE_FULL_PASSES)
+        ]
+
+    def run(self) -> bool:
+        """Explain every hot query and log its plan.
+
+        Returns:
+            bool: True if no query scans or sorts, False otherwise
+        """
+        passed = True
+        try:
+            with self.engine.connect() as conn:
+                with Session(bind=conn) as session:
+                    queries = self.hot_queries(session)
+
+                for name, statement in queries:
+                    operators = self.plan_operators(conn, statement)
+                    offending = self.full_passes(operators)
+                    if offending:
+                        passed = False
+                        logger.error(
+                            "%s does not seek: %s",
+                            name, ", ".join(offending)
+                        )
+                    else:
+                        logger.info(
+                            "%s seeks: %s", name, ", ".join(operators)
+                        )
+        finally:
+            if self.owns_engine:
+                self.engine.dispose()
+
+        return passed
+
+
 def main():
     """Run database maintenance."""
     maintenance = DatabaseMaintenance()
@@ -323,13 +506,19 @@ def main():
 
         if command == "Delete":
             maintenance.factory_reset()
+        elif command == "CheckPlans":
+            if not QueryPlanCheck().run():
+                sys.exit(1)
         else:
             print(
-                "Unknown command. Use: Delete"
+                "Unknown command. Use: Delete, CheckPlans"
             )
             sys.exit(1)
     else:
-        print("Usage: python -m backend.database.maintenance Delete")
+        print(
+            "Usage: python -m backend.database.maintenance "
+            "Delete|CheckPlans"
+        )
         sys.exit(1)
 
 
@@ -6,6 +6,7 @@ from sqlalchemy import (
     String,
     Boolean,
     CheckConstraint,
+    Index,
     Unicode
 )
 from sqlalchemy.orm import relationship
@@ -50,4 +51,20 @@ class FinancialReport(Base):
             "(report_type = 'quarterly' AND report_quarter BETWEEN 1 AND 4)",
             name="chk_report_quarter"
         ),
+        # One row per period. SQL Server treats NULLs as equal in unique
+        # indexes, so this also holds for annual reports (quarter NULL).
+        Index(
+            "ux_financial_reports_natural_key",
+            "symbol", "report_type", "report_year", "report_quarter",
+            unique=True
+        ),
+        # Per-symbol listings, newest first, answered from the index alone
+        Index(
+            "ix_financial_reports_listing",
+            symbol, report_year.desc(), report_quarter,
+            mssql_include=[
+                "company_name", "report_name", "report_type",
+                "is_audited", "is_reviewed", "report_url"
+            ]
+        ),
     )
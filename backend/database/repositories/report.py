@@ -1,10 +1,246 @@
 """Repository for Financial Report database operations."""
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+import base64
+import binascii
+import json
+import logging
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy.orm import Query, Session
+from sqlalchemy import and_, func, or_
 from backend.database.models import FinancialReport
 
+logger = logging.getLogger(__name__)
+
+# Columns a listing may be sorted by; '-' before a name sorts descending
+SORT_FIELDS = {
+    name: getattr(FinancialReport, name)
+    for name in (
+        "id",
+        "symbol",
+        "report_type",
+        "report_year",
+        "report_quarter",
+        "is_audited",
+        "is_reviewed",
+    )
+}
+
+# The order of get_all, served by ix_financial_reports_listing. Cursors
+# page through this order only.
+DEFAULT_SORT = ("symbol", "-report_year", "report_quarter")
+
+CursorPosition = Tuple[str, int, Optional[int], int]
+
+
+def encode_cursor(report: FinancialReport) -> str:
+    """Opaque token for the position just after a report.
+
+    Args:
+        report (FinancialReport): Last report of a page in the default
+            order
+
+    Returns:
+        str: URL-safe token encoding (symbol, year, quarter, id)
+    """
+    position = [
+        report.symbol, report.report_year, report.report_quarter, report.id
+    ]
+    return base64.urlsafe_b64encode(
+        json.dumps(position, separators=(",", ":")).encode()
+    ).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> CursorPosition:
+    """Position encoded by ``encode_cursor``.
+
+    Args:
+        token (str): Cursor token
+
+    Returns:
+        tuple: (symbol, year, quarter, id)
+
+    Raises:
+        ValueError: If the token is not a valid cursor
+    """
+    try:
+        symbol, year, quarter, report_id = json.loads(
+            base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+
+    valid = (
+        isinstance(symbol, str)
+        and isinstance(year, int)
+        and (quarter is None or isinstance(quarter, int))
+        and isinstance(report_id, int)
+    )
+    if not valid:
+        raise ValueError("Invalid cursor")
+    return symbol, year, quarter, report_id
+
+
+def seek_after(position: CursorPosition):
+    """Seek predicate: rows after a position in the default order.
+
+    The order is symbol, year descending, quarter (NULL, the annual
+    report, first as SQL Server and SQLite sort it) and id. The leading
+    ``symbol >=`` bound lets the database seek the listing index to the
+    position instead of reading the rows before it.
+    """
+    symbol, year, quarter, report_id = position
+    if quarter is None:
+        after_quarter = or_(
+            FinancialReport.report_quarter.is_not(None),
+            FinancialReport.id > report_id
+        )
+    else:
+        after_quarter = or_(
+            FinancialReport.report_quarter > quarter,
+            and_(
+                FinancialReport.report_quarter == quarter,
+                FinancialReport.id > report_id
+            )
+        )
+
+    return and_(
+        FinancialReport.symbol >= symbol,
+        or_(
+            FinancialReport.symbol > symbol,
+            and_(
+                FinancialReport.symbol == symbol,
+                or_(
+                    FinancialReport.report_year < year,
+                    and_(
+                        FinancialReport.report_year == year,
+                        after_quarter
+                    )
+                )
+            )
+        )
+    )
+
+
+STAGING_TABLE = "#financial_reports_staging"
+
+STAGING_COLUMNS = (
+    "row_no",
+    "symbol",
+    "company_name",
+    "report_name",
+    "report_type",
+    "report_year",
+    "report_quarter",
+    "is_audited",
+    "is_reviewed",
+    "report_url",
+)
+
+# A pooled connection may still hold the table if an earlier upsert failed
+CREATE_STAGING_SQL = f"""
+IF OBJECT_ID('tempdb..{STAGING_TABLE}') IS NOT NULL
+    DROP TABLE {STAGING_TABLE};
+CREATE TABLE {STAGING_TABLE} (
+    row_no INT NOT NULL,
+    symbol VARCHAR(10) NOT NULL,
+    company_name NVARCHAR(255) NOT NULL,
+    report_name NVARCHAR(255) NOT NULL,
+    report_type VARCHAR(50) NOT NULL,
+    report_year INT NOT NULL,
+    report_quarter INT NULL,
+    is_audited BIT NOT NULL,
+    is_reviewed BIT NOT NULL,
+    report_url NVARCHAR(MAX) NOT NULL
+);
+"""
+
+INSERT_STAGING_SQL = (
+    f"INSERT INTO {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in STAGING_COLUMNS)})"
+)
+
+# Staged and stored rows of the same period
+STAGING_MATCH = """target.symbol = source.symbol
+    AND target.report_type = source.report_type
+    AND target.report_year = source.report_year
+    AND (
+        target.report_quarter = source.report_quarter
+        OR (target.report_quarter IS NULL AND source.report_quarter IS NULL)
+    )"""
+
+# Duplicates within the batch keep the audited, then reviewed, then first
+# row; the survivors insert by natural key, or replace a stored row of
+# equal or lower priority (a listing that lost its audited version must
+# not downgrade the stored one)
+MERGE_STAGING_SQL = f"""
+MERGE financial_reports WITH (HOLDLOCK) AS target
+USING (
+    SELECT symbol, company_name, report_name, report_type, report_year,
+           report_quarter, is_audited, is_reviewed, report_url
+    FROM (
+        SELECT *, ROW_NUMBER() OVER (
+            PARTITION BY symbol, report_type, report_year, report_quarter
+            ORDER BY is_audited DESC, is_reviewed DESC, row_no
+        ) AS priority_rank
+        FROM {STAGING_TABLE}
+    ) AS ranked
+    WHERE priority_rank = 1
+) AS source
+ON {STAGING_MATCH}
+WHEN MATCHED AND (
+    source.is_audited >= target.is_audited
+    AND (source.is_audited = 1 OR source.is_reviewed >= target.is_reviewed)
+) THEN UPDATE SET
+    company_name = source.company_name,
+    report_name = source.report_name,
+    is_audited = source.is_audited,
+    is_reviewed = source.is_reviewed,
+    report_url = source.report_url
+WHEN NOT MATCHED BY TARGET THEN INSERT (
+    symbol, company_name, report_name, report_type, report_year,
+    report_quarter, is_audited, is_reviewed, report_url
+) VALUES (
+    source.symbol, source.company_name, source.report_name,
+    source.report_type, source.report_year, source.report_quarter,
+    source.is_audited, source.is_reviewed, source.report_url
+)
+OUTPUT $action, inserted.id, inserted.symbol, inserted.report_type,
+    inserted.report_year, inserted.report_quarter;
+"""
+
+# IDs of the stored rows the MERGE left alone, by natural key
+KEPT_IDS_SQL = f"""
+SELECT DISTINCT target.id, target.symbol, target.report_type,
+    target.report_year, target.report_quarter
+FROM financial_reports AS target
+JOIN {STAGING_TABLE} AS source ON {STAGING_MATCH}
+"""
+
+DROP_STAGING_SQL = f"DROP TABLE {STAGING_TABLE}"
+
+
+def _natural_key(report_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Identity of a report: (symbol, type, year, quarter)."""
+    return (
+        report_data['symbol'].lower(),
+        report_data['report_type'],
+        report_data['report_year'],
+        report_data.get('report_quarter')
+    )
+
+
+def _priority(report_data: Dict[str, Any]) -> int:
+    """Rank among duplicates: audited > reviewed > regular."""
+    return (
+        int(bool(report_data.get('is_audited'))) * 2
+        + int(bool(report_data.get('is_reviewed')))
+    )
+
+
+def _stored_priority(report: FinancialReport) -> int:
+    """Rank of a stored report, as ``_priority``."""
+    return int(bool(report.is_audited)) * 2 + int(bool(report.is_reviewed))
+
 
 class ReportRepository:
     """Repository class for managing financial reports in the database."""
@@ -69,20 +305,34 @@ class ReportRepository:
             symbol (str): Stock symbol
 
         Returns:
-            list: List of financial reports
+            list: List of financial reports, newest period first
+        """
+        return self.symbol_query(symbol).order_by(
+            FinancialReport.report_year.desc(),
+            FinancialReport.report_quarter
+        ).all()
+
+    def symbol_query(self, symbol: str):
+        """Query for the reports of one symbol.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            Query: Reports of the symbol, unordered
         """
         return self.session.query(FinancialReport).filter(
             FinancialReport.symbol == symbol.lower()
-        ).all()
+        )
 
-    def find_duplicate(
+    def natural_key_query(
         self,
         symbol: str,
         report_type: str,
         report_year: int,
         report_quarter: Optional[int] = None
-    ) -> Optional[FinancialReport]:
-        """Find a duplicate report based on unique identifiers.
+    ):
+        """Query for the report of one period.
 
         Args:
             symbol (str): Stock symbol
@@ -91,24 +341,42 @@ class ReportRepository:
             report_quarter (int, optional): Quarter of the report (1-4)
 
         Returns:
-            FinancialReport or None: Existing report if found, None otherwise
+            Query: At most one report, by the natural key
         """
-        query = self.session.query(FinancialReport).filter(
+        query = self.symbol_query(symbol).filter(
             and_(
-                FinancialReport.symbol == symbol.lower(),
                 FinancialReport.report_type == report_type,
                 FinancialReport.report_year == report_year
             )
         )
 
         if report_quarter is not None:
-            query = query.filter(
+            return query.filter(
                 FinancialReport.report_quarter == report_quarter
             )
-        else:
-            query = query.filter(FinancialReport.report_quarter.is_(None))
+        return query.filter(FinancialReport.report_quarter.is_(None))
 
-        return query.first()
+    def find_duplicate(
+        self,
+        symbol: str,
+        report_type: str,
+        report_year: int,
+        report_quarter: Optional[int] = None
+    ) -> Optional[FinancialReport]:
+        """Find a duplicate report based on unique identifiers.
+
+        Args:
+            symbol (str): Stock symbol
+            report_type (str): Type of report ('annual' or 'quarterly')
+            report_year (int): Year of the report
+            report_quarter (int, optional): Quarter of the report (1-4)
+
+        Returns:
+            FinancialReport or None: Existing report if found, None otherwise
+        """
+        return self.natural_key_query(
+            symbol, report_type, report_year, report_quarter
+        ).first()
 
     def update(
         self,
@@ -170,31 +438,155 @@ class ReportRepository:
     def upsert_bulk(
         self,
         reports_data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
-        """Insert or update multiple reports in bulk.
+    ) -> Dict[str, Any]:
+        """Insert or update multiple reports in one transaction.
+
+        On SQL Server the batch is loaded into a temporary staging table
+        with one ``executemany`` (sent as parameter arrays when the engine
+        uses ``fast_executemany``) and applied with a single ``MERGE`` on
+        (symbol, report_type, report_year, report_quarter), whatever the
+        batch size. Other databases fall back to one lookup per report,
+        still committed once.
+
+        Duplicates within the batch keep the audited, then reviewed, then
+        first report, like ``process_reports``. A stored report is only
+        replaced by one of equal or higher priority, so a listing that
+        lost the audited version of a period does not downgrade it.
 
         Args:
             reports_data (list): List of dictionaries containing report fields
 
         Returns:
-            dict: Statistics with 'created' and 'updated' counts
+            dict: 'created' and 'updated' counts, 'total' reports given and
+            'ids', the database ID of each given report in input order
+            (duplicates, and reports outranked by the stored one, share
+            the ID of the report that was kept)
         """
-        created_count = 0
-        updated_count = 0
+        if not reports_data:
+            return {'created': 0, 'updated': 0, 'total': 0, 'ids': []}
 
-        for report_data in reports_data:
-            _, created = self.upsert(report_data)
-            if created:
-                created_count += 1
-            else:
-                updated_count += 1
+        if self.session.get_bind().dialect.name == 'mssql':
+            actions, ids_by_key = self._merge_staged(reports_data)
+        else:
+            actions, ids_by_key = self._upsert_rows(reports_data)
 
         return {
-            'created': created_count,
-            'updated': updated_count,
-            'total': len(reports_data)
+            'created': actions.count('INSERT'),
+            'updated': actions.count('UPDATE'),
+            'total': len(reports_data),
+            'ids': [
+                ids_by_key[_natural_key(report_data)]
+                for report_data in reports_data
+            ]
         }
 
+    def _merge_staged(
+        self,
+        reports_data: List[Dict[str, Any]]
+    ) -> Tuple[List[str], Dict[Tuple[Any, ...], int]]:
+        """Stage the batch and MERGE it into financial_reports.
+
+        Args:
+            reports_data (list): Reports to upsert
+
+        Returns:
+            tuple: The MERGE action of each written row and the ID of each
+            natural key
+        """
+        staged = [
+            (
+                row_no,
+                report_data['symbol'].lower(),
+                report_data['company_name'],
+                report_data['report_name'],
+                report_data['report_type'],
+                report_data['report_year'],
+                report_data.get('report_quarter'),
+                bool(report_data.get('is_audited')),
+                bool(report_data.get('is_reviewed')),
+                report_data['report_url']
+            )
+            for row_no, report_data in enumerate(reports_data)
+        ]
+
+        connection = self.session.connection()
+        try:
+            connection.exec_driver_sql(CREATE_STAGING_SQL)
+            connection.exec_driver_sql(INSERT_STAGING_SQL, staged)
+            written = connection.exec_driver_sql(
+                MERGE_STAGING_SQL
+            ).fetchall()
+            ids_by_key = {
+                (symbol, report_type, year, quarter): report_id
+                for _, report_id, symbol, report_type, year, quarter
+                in written
+            }
+            # Periods whose stored report outranks the staged one
+            keys = {_natural_key(report_data) for report_data in reports_data}
+            if len(ids_by_key) < len(keys):
+                ids_by_key.update(
+                    ((symbol, report_type, year, quarter), report_id)
+                    for report_id, symbol, report_type, year, quarter
+                    in connection.exec_driver_sql(KEPT_IDS_SQL)
+                )
+            connection.exec_driver_sql(DROP_STAGING_SQL)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        # Rows loaded earlier in this session may have been updated
+        self.session.expire_all()
+
+        logger.info(
+            "Merged %d reports (%d written)", len(staged), len(written)
+        )
+        return [row[0] for row in written], ids_by_key
+
+    def _upsert_rows(
+        self,
+        reports_data: List[Dict[str, Any]]
+    ) -> Tuple[List[str], Dict[Tuple[Any, ...], int]]:
+        """Upsert report by report, committing once.
+
+        Args:
+            reports_data (list): Reports to upsert
+
+        Returns:
+            tuple: 'INSERT' or 'UPDATE' for each written row and the ID of
+            each natural key; stored reports of higher priority are kept
+        """
+        kept: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        for report_data in reports_data:
+            key = _natural_key(report_data)
+            current = kept.get(key)
+            if current is None or _priority(report_data) > _priority(current):
+                kept[key] = {**report_data, 'symbol': key[0]}
+
+        actions = []
+        reports: Dict[Tuple[Any, ...], FinancialReport] = {}
+        try:
+            for key, report_data in kept.items():
+                report = self.find_duplicate(*key)
+                if report is None:
+                    report = FinancialReport(**report_data)
+                    self.session.add(report)
+                    actions.append('INSERT')
+                elif _priority(report_data) >= _stored_priority(report):
+                    for field, value in report_data.items():
+                        if hasattr(report, field) and field != 'id':
+                            setattr(report, field, value)
+                    actions.append('UPDATE')
+                reports[key] = report
+
+            self.session.flush()
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return actions, {key: report.id for key, report in reports.items()}
+
     def delete(self, report_id: int) -> bool:
         """Delete a financial report by ID.
 
@@ -220,12 +612,154 @@ class ReportRepository:
         Returns:
             int: Number of reports deleted
         """
-        count = self.session.query(FinancialReport).filter(
-            FinancialReport.symbol == symbol.lower()
-        ).delete()
+        count = self.symbol_query(symbol).delete()
         self.session.commit()
         return count
 
+    def filter_query(
+        self,
+        symbol: Optional[str] = None,
+        report_type: Optional[str] = None,
+        report_year: Optional[int] = None,
+        report_quarter: Optional[int] = None,
+        is_audited: Optional[bool] = None,
+        is_reviewed: Optional[bool] = None
+    ) -> Query:
+        """Query for the reports matching every given filter.
+
+        Filters left as None are not applied.
+
+        Args:
+            symbol (str, optional): Stock symbol
+            report_type (str, optional): 'annual' or 'quarterly'
+            report_year (int, optional): Year of the report
+            report_quarter (int, optional): Quarter of the report (1-4)
+            is_audited (bool, optional): Audit status
+            is_reviewed (bool, optional): Review status
+
+        Returns:
+            Query: Matching reports, unordered
+        """
+        query = (
+            self.symbol_query(symbol) if symbol
+            else self.session.query(FinancialReport)
+        )
+        filters = {
+            FinancialReport.report_type: report_type,
+            FinancialReport.report_year: report_year,
+            FinancialReport.report_quarter: report_quarter,
+            FinancialReport.is_audited: is_audited,
+            FinancialReport.is_reviewed: is_reviewed,
+        }
+        conditions = [
+            column == value for column, value in filters.items()
+            if value is not None
+        ]
+        if conditions:
+            query = query.filter(and_(*conditions))
+        return query
+
+    @staticmethod
+    def sort_query(query: Query, sort: Sequence[str]) -> Query:
+        """Order a query by the given fields, then by ID.
+
+        The trailing ID makes the order total, so pages never overlap.
+
+        Args:
+            query (Query): Query to order
+            sort (Sequence[str]): Field names from ``SORT_FIELDS``, each
+                optionally prefixed with '-' for descending order
+
+        Returns:
+            Query: The ordered query
+
+        Raises:
+            ValueError: If a field cannot be sorted by
+        """
+        order = []
+        for field in sort:
+            name = field.lstrip('-')
+            if name not in SORT_FIELDS:
+                raise ValueError(
+                    f"Cannot sort by '{name}'; use one of "
+                    f"{', '.join(SORT_FIELDS)}"
+                )
+            column = SORT_FIELDS[name]
+            order.append(column.desc() if field.startswith('-') else column)
+
+        if 'id' not in (field.lstrip('-') for field in sort):
+            order.append(FinancialReport.id)
+        return query.order_by(*order)
+
+    def search(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        sort: Sequence[str] = DEFAULT_SORT,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+        **filters: Any
+    ) -> Tuple[List[FinancialReport], Optional[int], Optional[str]]:
+        """Get one page of filtered, sorted reports and the total count.
+
+        Filtering, ordering and paging all run in the database. Pages are
+        addressed by offset or, in the default order, by a cursor from
+        the previous page. A cursor page seeks straight to its first row,
+        so deep pages cost as much as the first one, and rows inserted
+        before the cursor do not shift the pages after it.
+
+        The count is a second query, skipped when the page itself shows
+        that it is the last one.
+
+        Args:
+            limit (int, optional): Maximum number of reports to return
+            offset (int): Number of reports to skip
+            sort (Sequence[str]): Sort fields, see ``sort_query``
+            cursor (str, optional): ``next_cursor`` of the previous page
+            with_total (bool): Whether to count the matching reports
+            **filters: Filters accepted by ``filter_query``
+
+        Returns:
+            tuple: (reports on the page, total matching reports or None,
+            cursor of the next page or None on the last page)
+
+        Raises:
+            ValueError: If a sort field cannot be sorted by, or the cursor
+                is invalid or combined with an offset or another order
+        """
+        keyset = tuple(sort) == DEFAULT_SORT
+        filtered = self.filter_query(**filters)
+        query = self.sort_query(filtered, sort)
+        if cursor:
+            if not keyset:
+                raise ValueError("Cursors page the default order only")
+            if offset:
+                raise ValueError("Use either a cursor or an offset")
+            query = query.filter(seek_after(decode_cursor(cursor)))
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        reports = query.all()
+
+        next_cursor = (
+            encode_cursor(reports[-1])
+            if keyset and limit and len(reports) == limit else None
+        )
+        if not with_total:
+            return reports, None, next_cursor
+
+        if (
+            not cursor and (reports or not offset)
+            and (not limit or len(reports) < limit)
+        ):
+            return reports, offset + len(reports), next_cursor
+
+        total = filtered.with_entities(
+            func.count(FinancialReport.id)
+        ).scalar()
+        return reports, total, next_cursor
+
     def get_all(
         self,
         limit: Optional[int] = None,
@@ -270,6 +804,4 @@ class ReportRepository:
         Returns:
             int: Count of reports for the symbol
         """
-        return self.session.query(FinancialReport).filter(
-            FinancialReport.symbol == symbol.lower()
-        ).count()
+        return self.symbol_query(symbol).count()
@@ -9,6 +9,7 @@ This module initializes and configures the FastAPI application with:
 """
 
 import logging
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
@@ -20,6 +21,14 @@ from backend.core.config import settings
 from backend.database.initiation import InitDatabase
 from backend.database.db import close_engine
 from backend.api.api import api_router
+from backend.services.cache import close_stores, close_http_cache
+from backend.services.jobs import get_job_manager, close_job_manager
+from backend.services.scrappers import (
+    get_driver_pool,
+    close_driver_pools,
+    close_http_client,
+    reap_orphans
+)
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +45,9 @@ async def lifespan(fastapi_app: FastAPI):
 
     This context manager handles:
     - Database initialization on startup
+    - Reaping of browsers orphaned by a previous process
+    - WebDriver pool warm-up in the background
+    - Background job workers, resuming jobs left unfinished
     - Resource cleanup on shutdown
 
     Args:
@@ -52,9 +64,26 @@ async def lifespan(fastapi_app: FastAPI):
         logger.error("Failed to initialize database: %s", e)
         raise
 
+    reap_orphans()
+
+    if settings.SCRAPER_POOL_WARMUP > 0:
+        threading.Thread(
+            target=get_driver_pool(headless=True).warm_up,
+            args=(settings.SCRAPER_POOL_WARMUP,),
+            name="webdriver-warmup",
+            daemon=True
+        ).start()
+
+    get_job_manager().start()
+
     yield
 
     logger.info("Shutting down application...")
+    close_job_manager()
+    close_driver_pools()
+    close_http_client()
+    close_http_cache()
+    close_stores()
     close_engine()
     logger.info("Application shutdown complete")
 
@@ -73,6 +102,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Paging metadata of GET /financial/reports
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "Link"],
 )
 
 app.include_router(api_router)
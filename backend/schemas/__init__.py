@@ -5,10 +5,19 @@ from backend.schemas.scrapper import (
     FinancialReportCreate,
     FinancialReportInDB,
     FinancialReportResponse,
+    ReportValidationError,
     ScrapperRequest,
+    ReportChangeSummary,
     ScrapperResponse,
     BulkScrapperRequest,
+    BulkScrapeSummary,
     BulkScrapperResponse,
+    BulkScrapeStreamRecord,
+    ScrapeJobResponse,
+    StreamFormat,
+    dump_reports,
+    report_responses,
+    validate_reports,
 )
 
 from backend.schemas.financial import (
@@ -27,10 +36,19 @@ __all__ = [
     "FinancialReportCreate",
     "FinancialReportInDB",
     "FinancialReportResponse",
+    "ReportValidationError",
     "ScrapperRequest",
+    "ReportChangeSummary",
     "ScrapperResponse",
     "BulkScrapperRequest",
+    "BulkScrapeSummary",
     "BulkScrapperResponse",
+    "BulkScrapeStreamRecord",
+    "ScrapeJobResponse",
+    "StreamFormat",
+    "dump_reports",
+    "report_responses",
+    "validate_reports",
     "BalanceSheetItemCreate",
     "BalanceSheetItemResponse",
     "IncomeStatementItemCreate",
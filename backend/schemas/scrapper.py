@@ -4,18 +4,41 @@ Scrapper schemas for data validation.
 This module defines Pydantic schemas for validating scraped financial report
 data before insertion into the database. It ensures data integrity and type
 safety.
+
+Reports are validated, dumped and turned into responses a whole batch at a
+time through ``TypeAdapter``s, so the per-row work stays inside
+pydantic-core.
 """
 
-from typing import Optional, List
+from datetime import datetime
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Optional,
+    List,
+    Literal,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union
+)
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    TypeAdapter,
+    ValidationError,
     field_validator,
     model_validator
 )
 
 
+FetchMode = Literal["auto", "http", "browser"]
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+StreamFormat = Literal["ndjson", "sse"]
+
+
 class FinancialReportBase(BaseModel):
     """Base schema for financial report."""
     model_config = ConfigDict(from_attributes=True)
@@ -98,6 +121,102 @@ class FinancialReportResponse(FinancialReportInDB):
     """Schema for API response."""
 
 
+class ReportValidationError(BaseModel):
+    """Schema for the validation failure of one report in a batch."""
+    index: int = Field(..., description="Position of the report in the batch")
+    errors: List[str] = Field(..., description="Validation error messages")
+
+
+REPORT_CREATE_LIST = TypeAdapter(List[FinancialReportCreate])
+REPORT_RESPONSE_LIST = TypeAdapter(List[FinancialReportResponse])
+# Valid rows become models; invalid ones fall through to ``Any`` unchanged
+# instead of failing the whole list
+REPORT_CREATE_OR_RAW_LIST = TypeAdapter(List[Annotated[
+    Union[FinancialReportCreate, Any], Field(union_mode="left_to_right")
+]])
+
+
+def _error_messages(error: ValidationError) -> List[str]:
+    """Format the errors of one report as 'field: message'."""
+    messages = []
+    for detail in error.errors():
+        field = ".".join(str(part) for part in detail["loc"])
+        messages.append(
+            f"{field}: {detail['msg']}" if field else detail["msg"]
+        )
+    return messages
+
+
+def validate_reports(
+    rows: Sequence[Mapping[str, Any]]
+) -> Tuple[List[FinancialReportCreate], List[ReportValidationError]]:
+    """Validate a batch of processed reports in one call.
+
+    Invalid rows are reported by index and left out; they never abort the
+    rest of the batch. Only the invalid rows are validated again, one by
+    one, to collect their error messages.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): Report fields per row
+
+    Returns:
+        Tuple[List[FinancialReportCreate], List[ReportValidationError]]:
+        Valid reports in input order and the errors of the others
+    """
+    valid = []
+    errors = []
+    for index, report in enumerate(
+        REPORT_CREATE_OR_RAW_LIST.validate_python(rows)
+    ):
+        if isinstance(report, FinancialReportCreate):
+            valid.append(report)
+            continue
+
+        try:
+            FinancialReportCreate.model_validate(report)
+        except ValidationError as error:
+            errors.append(ReportValidationError(
+                index=index, errors=_error_messages(error)
+            ))
+
+    return valid, errors
+
+
+def dump_reports(
+    reports: Sequence[FinancialReportCreate]
+) -> List[Dict[str, Any]]:
+    """Dump validated reports to dicts for the repository in one call.
+
+    Args:
+        reports (Sequence[FinancialReportCreate]): Validated reports
+
+    Returns:
+        List[Dict[str, Any]]: Report fields per report
+    """
+    return REPORT_CREATE_LIST.dump_python(reports)
+
+
+def report_responses(
+    rows: Sequence[Mapping[str, Any]],
+    report_ids: Sequence[int]
+) -> List[FinancialReportResponse]:
+    """Build responses for stored reports from the data that was stored.
+
+    The stored values are the validated ones, so responses are built from
+    them and the database IDs instead of reading every ORM row back.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): Dumped reports as stored
+        report_ids (Sequence[int]): Database ID of each report
+
+    Returns:
+        List[FinancialReportResponse]: One response per report
+    """
+    return REPORT_RESPONSE_LIST.validate_python([
+        {**row, "id": report_id} for row, report_id in zip(rows, report_ids)
+    ])
+
+
 class ScrapperRequest(BaseModel):
     """Schema for scrapper API request."""
     model_config = ConfigDict(from_attributes=True)
@@ -111,6 +230,21 @@ class ScrapperRequest(BaseModel):
         default=True,
         description="Run browser in headless mode"
     )
+    fetch_mode: FetchMode = Field(
+        default="auto",
+        description=(
+            "How to fetch the listing: 'http' only, 'browser' only, or "
+            "'auto' (HTTP with browser fallback)"
+        )
+    )
+    incremental: bool = Field(
+        default=False,
+        description=(
+            "Skip processing and database writes for report rows that are "
+            "unchanged since the last scrape. Off by default, so every "
+            "row is processed and stored"
+        )
+    )
 
     @field_validator('symbol')
     @classmethod
@@ -121,6 +255,19 @@ class ScrapperRequest(BaseModel):
         return value.strip().upper()
 
 
+class ReportChangeSummary(BaseModel):
+    """Row keys ('<report_time>|<report_name>') grouped by change status."""
+    new: List[str] = Field(
+        default_factory=list, description="Rows not seen before"
+    )
+    changed: List[str] = Field(
+        default_factory=list, description="Rows whose content changed"
+    )
+    unchanged: List[str] = Field(
+        default_factory=list, description="Rows identical to the last scrape"
+    )
+
+
 class ScrapperResponse(BaseModel):
     """Schema for scrapper API response."""
     model_config = ConfigDict(from_attributes=True)
@@ -136,10 +283,22 @@ class ScrapperResponse(BaseModel):
     updated_count: int = Field(
         default=0, description="Number of reports updated in DB"
     )
+    source: Optional[str] = Field(
+        default=None,
+        description="Path that served the listing: 'http' or 'browser'"
+    )
+    changes: Optional[ReportChangeSummary] = Field(
+        default=None,
+        description="Row changes since the last scrape (incremental mode)"
+    )
     reports: Optional[List[FinancialReportResponse]] = Field(
         default=None,
         description="List of scraped reports"
     )
+    validation_errors: Optional[List[ReportValidationError]] = Field(
+        default=None,
+        description="Processed reports that failed validation, by index"
+    )
 
 
 class BulkScrapperRequest(BaseModel):
@@ -154,6 +313,36 @@ class BulkScrapperRequest(BaseModel):
     headless: bool = Field(
         default=True, description="Run browser in headless mode"
     )
+    fetch_mode: FetchMode = Field(
+        default="auto",
+        description=(
+            "How to fetch each listing: 'http' only, 'browser' only, or "
+            "'auto' (HTTP with browser fallback)"
+        )
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=32,
+        description="Concurrent workers (defaults to server setting)"
+    )
+    tabs: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=16,
+        description=(
+            "With fetch_mode 'browser', load listings in this many tabs of "
+            "one shared browser instead of one pooled browser per worker"
+        )
+    )
+    incremental: bool = Field(
+        default=False,
+        description=(
+            "Skip processing and database writes for report rows that are "
+            "unchanged since the last scrape. Off by default, so every "
+            "row is processed and stored"
+        )
+    )
 
     @field_validator('symbols')
     @classmethod
@@ -176,8 +365,8 @@ class BulkScrapperRequest(BaseModel):
         return cleaned
 
 
-class BulkScrapperResponse(BaseModel):
-    """Schema for bulk scrapper API response."""
+class BulkScrapeSummary(BaseModel):
+    """Schema for the aggregated counters of a bulk scrape."""
     model_config = ConfigDict(from_attributes=True)
     success: bool = Field(
         ..., description="Whether overall scraping was successful"
@@ -195,7 +384,63 @@ class BulkScrapperResponse(BaseModel):
         default=0, description="Total reports created in DB")
     total_updated: int = Field(
         default=0, description="Total reports updated in DB")
+
+
+class BulkScrapperResponse(BulkScrapeSummary):
+    """Schema for bulk scrapper API response."""
     results: Optional[List[ScrapperResponse]] = Field(
         default=None,
         description="Individual results for each symbol"
     )
+
+
+class BulkScrapeStreamRecord(BaseModel):
+    """Schema for one record of a streamed bulk scrape.
+
+    A stream carries one 'result' record per symbol in completion order,
+    then a single 'summary' record, or an 'error' record if the run
+    aborted.
+    """
+    type: Literal["result", "summary", "error"] = Field(
+        ..., description="Record type"
+    )
+    done: int = Field(..., description="Symbols processed so far")
+    total: int = Field(..., description="Symbols to process")
+    result: Optional[ScrapperResponse] = Field(
+        default=None, description="Result of one symbol ('result' records)"
+    )
+    summary: Optional[BulkScrapeSummary] = Field(
+        default=None, description="Totals of the run ('summary' records)"
+    )
+    error: Optional[str] = Field(
+        default=None, description="Why the run aborted ('error' records)"
+    )
+
+
+class ScrapeJobResponse(BaseModel):
+    """Schema for a background scrape job."""
+    id: str = Field(..., description="Job ID")
+    kind: str = Field(..., description="Job kind: 'scrape' or 'scrape-bulk'")
+    status: JobStatus = Field(..., description="Current job status")
+    progress_done: int = Field(
+        default=0, description="Symbols processed so far"
+    )
+    progress_total: int = Field(
+        default=0, description="Symbols to process"
+    )
+    created_at: datetime = Field(..., description="Submission time")
+    started_at: Optional[datetime] = Field(
+        default=None, description="Time the job last started running"
+    )
+    finished_at: Optional[datetime] = Field(
+        default=None, description="Completion time"
+    )
+    error: Optional[str] = Field(
+        default=None, description="Error message of a failed job"
+    )
+    result: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description=(
+            "ScrapperResponse or BulkScrapperResponse of a succeeded job"
+        )
+    )
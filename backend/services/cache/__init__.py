@@ -0,0 +1,25 @@
+"""Local cache and state storage package."""
+
+from backend.services.cache.store import (
+    KeyValueStore,
+    get_store,
+    close_stores
+)
+from backend.services.cache.http_cache import (
+    CacheEntry,
+    HttpCache,
+    get_http_cache,
+    http_cache_stats,
+    close_http_cache
+)
+
+__all__ = [
+    "KeyValueStore",
+    "get_store",
+    "close_stores",
+    "CacheEntry",
+    "HttpCache",
+    "get_http_cache",
+    "http_cache_stats",
+    "close_http_cache"
+]
@@ -0,0 +1,509 @@
+"""
+Content-addressed on-disk HTTP cache.
+
+Response bodies are stored once per content hash under ``blobs/`` and a
+SQLite index maps each URL to its blob, validators and expiry. Entries
+are served directly while fresh; stale entries with an ETag or
+Last-Modified header are revalidated with a conditional request. The
+cache is bounded in size and evicts least recently used entries. Text
+bodies (HTML pages, JSON snapshots) are stored zlib-compressed.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional, Tuple
+from backend.core import settings
+
+logger = logging.getLogger(__name__)
+
+SOURCE_HIT = "hit"
+SOURCE_REVALIDATED = "revalidated"
+SOURCE_NETWORK = "network"
+
+COMPRESSED_TYPES = ("text/", "application/json", "application/xhtml")
+
+# Performs a GET with the given extra headers and returns a response
+# exposing ``status_code``, ``headers``, ``content`` and ``encoding``
+Fetcher = Callable[[str, Dict[str, str]], object]
+
+
+class CacheEntry:
+    """A cached response body with its metadata."""
+
+    __slots__ = (
+        "url", "content", "content_type", "encoding", "etag",
+        "last_modified", "expires_at", "source",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        content: bytes,
+        content_type: Optional[str] = None,
+        encoding: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        expires_at: float = 0.0,
+        source: str = SOURCE_HIT
+    ):
+        """Initialize the entry.
+
+        Args:
+            url (str): Cached URL or key
+            content (bytes): Uncompressed body
+            content_type (str, optional): Content-Type of the body
+            encoding (str, optional): Text encoding of the body
+            etag (str, optional): ETag validator
+            last_modified (str, optional): Last-Modified validator
+            expires_at (float): Epoch time the entry becomes stale
+            source (str): 'hit', 'revalidated' or 'network'
+        """
+        self.url = url
+        self.content = content
+        self.content_type = content_type
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.source = source
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return self.expires_at > time.time()
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the stored encoding."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+class HttpCache:
+    """Size-bounded, content-addressed response cache."""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        """Open (and create if needed) the cache.
+
+        Args:
+            directory (Path): Cache directory
+            max_bytes (int): Maximum total size of stored blobs
+        """
+        self.directory = Path(directory)
+        self.blob_dir = self.directory / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+        self._conn = sqlite3.connect(
+            str(self.directory / "index.db"),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                blob TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                content_type TEXT,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_entries_accessed "
+            "ON entries (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_entries_blob ON entries (blob)"
+        )
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    @staticmethod
+    def _should_compress(content_type: Optional[str]) -> bool:
+        content_type = (content_type or "").lower()
+        return any(content_type.startswith(kind) for kind in COMPRESSED_TYPES)
+
+    def _blob_path(self, blob: str) -> Path:
+        return self.blob_dir / blob[:2] / blob
+
+    def _read_blob(self, blob: str) -> Optional[bytes]:
+        try:
+            data = self._blob_path(blob).read_bytes()
+        except FileNotFoundError:
+            return None
+        return zlib.decompress(data) if blob.endswith(".z") else data
+
+    def _write_blob(
+        self, content: bytes, compress: bool
+    ) -> Tuple[str, int]:
+        digest = hashlib.sha256(content).hexdigest()
+        blob = f"{digest}.z" if compress else digest
+        path = self._blob_path(blob)
+        if path.exists():
+            return blob, path.stat().st_size
+
+        data = zlib.compress(content, 6) if compress else content
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+        return blob, len(data)
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Get the cached entry of a URL, fresh or stale.
+
+        Args:
+            url (str): URL or cache key
+
+        Returns:
+            CacheEntry or None: The entry, or None if not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob, content_type, encoding, etag, last_modified, "
+                "expires_at FROM entries WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        blob, content_type, encoding, etag, last_modified, expires_at = row
+        content = self._read_blob(blob)
+        if content is None:
+            self.delete(url)
+            return None
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE url = ?",
+                (time.time(), url)
+            )
+        return CacheEntry(
+            url, content, content_type, encoding, etag, last_modified,
+            expires_at
+        )
+
+    def get_fresh(self, url: str) -> Optional[CacheEntry]:
+        """Get the entry of a URL only if it has not expired.
+
+        Args:
+            url (str): URL or cache key
+
+        Returns:
+            CacheEntry or None: Fresh entry, or None
+        """
+        entry = self.get(url)
+        if entry is not None and entry.is_fresh:
+            self._count("hits")
+            return entry
+        self._count("misses")
+        return None
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        ttl: float,
+        content_type: Optional[str] = None,
+        encoding: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> CacheEntry:
+        """Store a body for a URL.
+
+        Args:
+            url (str): URL or cache key
+            content (bytes): Body to store
+            ttl (float): Seconds the entry stays fresh
+            content_type (str, optional): Content-Type of the body
+            encoding (str, optional): Text encoding of the body
+            etag (str, optional): ETag validator
+            last_modified (str, optional): Last-Modified validator
+
+        Returns:
+            CacheEntry: The stored entry
+        """
+        blob, size = self._write_blob(
+            content, self._should_compress(content_type)
+        )
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT blob FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (url, blob, size, "
+                "content_type, encoding, etag, last_modified, stored_at, "
+                "expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url, blob, size, content_type, encoding, etag,
+                    last_modified, now, now + ttl, now
+                )
+            )
+            self._stats["stores"] += 1
+        if previous and previous[0] != blob:
+            self._release_blob(previous[0])
+
+        self.evict()
+        return CacheEntry(
+            url, content, content_type, encoding, etag, last_modified,
+            now + ttl, SOURCE_NETWORK
+        )
+
+    def fetch(
+        self,
+        url: str,
+        fetcher: Fetcher,
+        ttl: float
+    ) -> Optional[CacheEntry]:
+        """Get a URL through the cache.
+
+        Fresh entries are returned without a request. Stale entries with
+        validators are revalidated with a conditional GET; a 304 renews
+        them. Otherwise the body is downloaded and stored.
+
+        Args:
+            url (str): URL to fetch
+            fetcher (Fetcher): Performs the GET request
+            ttl (float): Seconds a stored response stays fresh
+
+        Returns:
+            CacheEntry or None: The entry, or None on a non-200 response
+        """
+        cached = self.get(url)
+        if cached is not None and cached.is_fresh:
+            self._count("hits")
+            return cached
+
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = fetcher(url, headers)
+
+        if response.status_code == 304 and cached is not None:
+            self._count("revalidated")
+            self._renew(url, ttl, response.headers)
+            cached.expires_at = time.time() + ttl
+            cached.source = SOURCE_REVALIDATED
+            return cached
+
+        self._count("misses")
+        if response.status_code != 200:
+            logger.info(
+                "Fetch of %s returned status %s", url, response.status_code
+            )
+            return None
+
+        response_headers: Mapping[str, str] = response.headers
+        return self.put(
+            url,
+            response.content,
+            ttl,
+            content_type=response_headers.get("Content-Type"),
+            encoding=response.encoding,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified")
+        )
+
+    def _renew(
+        self,
+        url: str,
+        ttl: float,
+        headers: Mapping[str, str]
+    ) -> None:
+        """Extend a revalidated entry and refresh its validators."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET expires_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (
+                    now + ttl, now, headers.get("ETag"),
+                    headers.get("Last-Modified"), url
+                )
+            )
+
+    def delete(self, url: str) -> None:
+        """Remove the entry of a URL.
+
+        Args:
+            url (str): URL or cache key
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+        if row:
+            self._release_blob(row[0])
+
+    def _release_blob(self, blob: str) -> None:
+        """Delete a blob file once no entry references it."""
+        with self._lock:
+            self._unlink_unreferenced(blob)
+
+    def _unlink_unreferenced(self, blob: str) -> bool:
+        """Delete a blob file unless an entry still references it.
+
+        Called with the lock held, so no entry can be pointed at the blob
+        between the check and the unlink.
+
+        Returns:
+            bool: True if the blob was deleted
+        """
+        referenced = self._conn.execute(
+            "SELECT 1 FROM entries WHERE blob = ? LIMIT 1", (blob,)
+        ).fetchone()
+        if referenced:
+            return False
+        try:
+            self._blob_path(blob).unlink()
+        except FileNotFoundError:
+            pass
+        return True
+
+    def total_bytes(self) -> int:
+        """Total size of stored blobs.
+
+        Returns:
+            int: Bytes on disk, counting shared blobs once
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM "
+                "(SELECT DISTINCT blob, size FROM entries)"
+            ).fetchone()
+        return row[0]
+
+    def evict(self) -> int:
+        """Evict least recently used entries until under the size limit.
+
+        The total size is measured once. An evicted entry subtracts its
+        size only when it was the last one referencing its blob, which is
+        then deleted; blobs other entries share stay on disk.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        evicted = 0
+        total = self.total_bytes()
+        with self._lock:
+            while total > self.max_bytes:
+                row = self._conn.execute(
+                    "SELECT url, blob, size FROM entries "
+                    "ORDER BY accessed_at LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                url, blob, size = row
+                self._conn.execute(
+                    "DELETE FROM entries WHERE url = ?", (url,)
+                )
+                evicted += 1
+                if self._unlink_unreferenced(blob):
+                    total -= size
+            self._stats["evictions"] += evicted
+
+        if evicted:
+            logger.info("Evicted %d HTTP cache entries", evicted)
+        return evicted
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters and size.
+
+        Returns:
+            Dict[str, int]: Hits, misses, revalidations, stores,
+            evictions, entry count and bytes on disk
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = self._conn.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()[0]
+        stats["bytes"] = self.total_bytes()
+        return stats
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Get or create the process-wide HTTP cache.
+
+    Returns:
+        HttpCache or None: Shared cache under ``STATE_DIR``, or None when
+        HTTP_CACHE_ENABLED is off
+    """
+    global _cache
+
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache(
+                Path(settings.STATE_DIR) / "http_cache",
+                max_bytes=settings.HTTP_CACHE_MAX_MB * 1024 * 1024
+            )
+        return _cache
+
+
+def http_cache_stats() -> Dict[str, int]:
+    """Return counters of the process-wide HTTP cache.
+
+    Returns:
+        Dict[str, int]: Cache counters, empty when the cache is disabled
+    """
+    cache = get_http_cache()
+    return cache.stats() if cache is not None else {}
+
+
+def close_http_cache() -> None:
+    """Close the process-wide HTTP cache.
+
+    This should be called during application shutdown.
+    """
+    global _cache
+
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
@@ -0,0 +1,179 @@
+"""
+Local persistent key-value store.
+
+Scraper state that must survive restarts but does not belong in SQL Server
+(fingerprints, resolution caches, ...) is kept in a SQLite file under
+``STATE_DIR``. Values are JSON encoded and may carry a time-to-live.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from backend.core import settings
+
+logger = logging.getLogger(__name__)
+
+
+class KeyValueStore:
+    """Namespaced JSON key-value store backed by SQLite."""
+
+    def __init__(self, path: Path, namespace: str):
+        """Open (and create if needed) the store.
+
+        Args:
+            path (Path): SQLite database file
+            namespace (str): Namespace isolating this store's keys
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS kv (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, ignoring expired entries.
+
+        Args:
+            key (str): Key to look up
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The stored value or ``default``
+        """
+        found, value = self.lookup(key)
+        return value if found else default
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """Get a value and whether it exists.
+
+        Useful when None is a meaningful stored value.
+
+        Args:
+            key (str): Key to look up
+
+        Returns:
+            Tuple[bool, Any]: (found, value)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM kv "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+
+        if row is None:
+            return False, None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return False, None
+
+        return True, json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value.
+
+        Args:
+            key (str): Key to store under
+            value: JSON-serializable value
+            ttl (float, optional): Seconds until the entry expires
+        """
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv "
+                "(namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), expires_at)
+            )
+
+    def delete(self, key: str) -> bool:
+        """Remove a key.
+
+        Args:
+            key (str): Key to remove
+
+        Returns:
+            bool: True if the key existed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM kv WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            )
+        return cursor.rowcount > 0
+
+    def clear(self) -> int:
+        """Remove every key of the namespace.
+
+        Returns:
+            int: Number of keys removed
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM kv WHERE namespace = ?", (self.namespace,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, KeyValueStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(namespace: str) -> KeyValueStore:
+    """Get or create the process-wide store for a namespace.
+
+    Args:
+        namespace (str): Namespace name
+
+    Returns:
+        KeyValueStore: Store persisted under ``STATE_DIR``
+    """
+    with _stores_lock:
+        store = _stores.get(namespace)
+        if store is None:
+            store = KeyValueStore(
+                Path(settings.STATE_DIR) / "state.db", namespace
+            )
+            _stores[namespace] = store
+        return store
+
+
+def close_stores() -> None:
+    """Close all open stores.
+
+    This should be called during application shutdown.
+    """
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+
+    for store in stores:
+        store.close()
@@ -0,0 +1,29 @@
+"""Background job package."""
+
+from backend.services.jobs.store import (
+    JobStore,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    STATUS_SUCCEEDED,
+    STATUS_FAILED,
+    STATUS_CANCELLED
+)
+from backend.services.jobs.manager import (
+    JobManager,
+    register_handler,
+    get_job_manager,
+    close_job_manager
+)
+
+__all__ = [
+    "JobStore",
+    "STATUS_QUEUED",
+    "STATUS_RUNNING",
+    "STATUS_SUCCEEDED",
+    "STATUS_FAILED",
+    "STATUS_CANCELLED",
+    "JobManager",
+    "register_handler",
+    "get_job_manager",
+    "close_job_manager"
+]
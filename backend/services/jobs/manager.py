@@ -0,0 +1,209 @@
+"""
+Background job manager.
+
+Submitted jobs are persisted in the ``JobStore`` and executed by a fixed
+set of worker threads. Each job kind maps to a handler registered with
+``register_handler``; handlers receive the job payload and a progress
+callback, and return a JSON-serializable result.
+
+On start, jobs left queued or running by a previous process are put back
+on the queue, so a restart does not lose work. Browsers orphaned by a job
+(a scrape that crashed without quitting) are reaped after it finishes.
+"""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from backend.core import settings
+from backend.services.jobs.store import (
+    JobStore,
+    STATUS_FAILED,
+    STATUS_SUCCEEDED
+)
+from backend.services.scrappers.governor import reap_orphans
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+JobHandler = Callable[[Dict[str, Any], ProgressCallback], Dict[str, Any]]
+
+_handlers: Dict[str, JobHandler] = {}
+
+
+def register_handler(kind: str, handler: JobHandler) -> None:
+    """Register the handler that executes jobs of a kind.
+
+    Args:
+        kind (str): Job kind
+        handler (JobHandler): Callable taking (payload, progress) and
+            returning the job result
+    """
+    _handlers[kind] = handler
+
+
+class JobManager:
+    """Queue and worker threads executing persisted jobs."""
+
+    def __init__(self, store: JobStore, workers: int):
+        """Initialize the manager.
+
+        Args:
+            store (JobStore): Persistent job storage
+            workers (int): Number of worker threads
+        """
+        self.store = store
+        self.workers = workers
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Re-enqueue unfinished jobs and start the worker threads."""
+        if self._threads:
+            return
+
+        purged = self.store.purge(settings.SCRAPER_JOB_RETENTION)
+        if purged:
+            logger.info("Purged %d finished jobs", purged)
+
+        pending = self.store.pending_ids()
+        for job_id in pending:
+            self._queue.put(job_id)
+        if pending:
+            logger.info("Recovered %d unfinished jobs", len(pending))
+
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._work,
+                name=f"job-worker-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker threads.
+
+        Jobs still running when the timeout expires stay marked as running
+        and are picked up again on the next start.
+
+        Args:
+            timeout (float): Seconds to wait for each worker
+        """
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        total: int = 0
+    ) -> Dict[str, Any]:
+        """Persist and enqueue a job.
+
+        Args:
+            kind (str): Job kind with a registered handler
+            payload (dict): JSON-serializable job arguments
+            total (int): Number of work items, for progress reporting
+
+        Returns:
+            dict: The queued job
+
+        Raises:
+            ValueError: If no handler is registered for the kind
+        """
+        if kind not in _handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job = self.store.create(kind, payload, total)
+        self._queue.put(job["id"])
+        logger.info("Queued %s job %s", kind, job["id"])
+        return job
+
+    def _work(self) -> None:
+        """Worker loop: run jobs until a stop sentinel arrives."""
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            try:
+                self._run(job_id)
+            except Exception as error:
+                logger.error(
+                    "Job %s crashed: %s", job_id, error, exc_info=True
+                )
+            try:
+                reap_orphans()
+            except Exception as error:
+                logger.error("Reaping orphaned browsers failed: %s", error)
+
+    def _run(self, job_id: str) -> None:
+        """Execute one job and record its outcome.
+
+        Args:
+            job_id (str): Job ID
+        """
+        if not self.store.mark_running(job_id):
+            return
+
+        job = self.store.get(job_id)
+        handler = _handlers.get(job["kind"])
+        if handler is None:
+            self.store.finish(
+                job_id, STATUS_FAILED,
+                error=f"Unknown job kind: {job['kind']}"
+            )
+            return
+
+        def progress(done: int, total: int) -> None:
+            self.store.update_progress(job_id, done, total)
+
+        logger.info("Running %s job %s", job["kind"], job_id)
+        try:
+            result = handler(job["payload"], progress)
+        except Exception as error:
+            logger.error("Job %s failed: %s", job_id, error)
+            self.store.finish(job_id, STATUS_FAILED, error=str(error))
+            return
+
+        self.store.finish(job_id, STATUS_SUCCEEDED, result=result)
+        logger.info("Finished job %s", job_id)
+
+
+_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Get or create the process-wide job manager.
+
+    Returns:
+        JobManager: Job manager persisted under ``STATE_DIR``
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager(
+                JobStore(Path(settings.STATE_DIR) / "jobs.db"),
+                workers=settings.SCRAPER_JOB_WORKERS
+            )
+        return _manager
+
+
+def close_job_manager() -> None:
+    """Stop the job workers and close the job store.
+
+    This should be called during application shutdown.
+    """
+    global _manager
+    with _manager_lock:
+        manager = _manager
+        _manager = None
+
+    if manager is not None:
+        manager.stop()
+        manager.store.close()
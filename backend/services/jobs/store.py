@@ -0,0 +1,267 @@
+"""
+Persistent storage for background scrape jobs.
+
+Jobs are kept in a SQLite file under ``STATE_DIR`` so that queued and
+interrupted work survives an application restart.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED)
+
+_COLUMNS = (
+    "id", "kind", "status", "payload", "result", "error",
+    "progress_done", "progress_total",
+    "created_at", "started_at", "finished_at",
+)
+
+
+class JobStore:
+    """SQLite-backed table of jobs and their state."""
+
+    def __init__(self, path: Path):
+        """Open (and create if needed) the job table.
+
+        Args:
+            path (Path): SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                progress_done INTEGER NOT NULL DEFAULT 0,
+                progress_total INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_jobs_status_created "
+            "ON jobs (status, created_at)"
+        )
+
+    @staticmethod
+    def _to_dict(row: tuple) -> Dict[str, Any]:
+        """Convert a row to a job dictionary with decoded JSON fields."""
+        job = dict(zip(_COLUMNS, row))
+        job["payload"] = json.loads(job["payload"])
+        if job["result"] is not None:
+            job["result"] = json.loads(job["result"])
+        return job
+
+    def create(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        total: int = 0
+    ) -> Dict[str, Any]:
+        """Insert a new queued job.
+
+        Args:
+            kind (str): Job kind, used to pick its handler
+            payload (dict): JSON-serializable job arguments
+            total (int): Number of work items, for progress reporting
+
+        Returns:
+            dict: The created job
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, "
+                "progress_total, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    job_id, kind, STATUS_QUEUED, json.dumps(payload),
+                    total, time.time()
+                )
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID.
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            dict or None: The job if found
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """List jobs, newest first.
+
+        Args:
+            status (str, optional): Only return jobs with this status
+            limit (int): Maximum number of jobs
+
+        Returns:
+            list: Jobs
+        """
+        query = f"SELECT {', '.join(_COLUMNS)} FROM jobs"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+
+        with self._lock:
+            rows = self._conn.execute(query, params + (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def pending_ids(self) -> List[str]:
+        """IDs of jobs that are queued or were interrupted while running.
+
+        Returns:
+            list: Job IDs in submission order
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status IN (?, ?) "
+                "ORDER BY created_at",
+                (STATUS_QUEUED, STATUS_RUNNING)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def mark_running(self, job_id: str) -> bool:
+        """Move a queued (or interrupted) job to running.
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            bool: False if the job is no longer runnable (e.g. cancelled)
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, "
+                "progress_done = 0 WHERE id = ? AND status IN (?, ?)",
+                (
+                    STATUS_RUNNING, time.time(), job_id,
+                    STATUS_QUEUED, STATUS_RUNNING
+                )
+            )
+        return cursor.rowcount > 0
+
+    def update_progress(self, job_id: str, done: int, total: int) -> None:
+        """Record progress of a running job.
+
+        Args:
+            job_id (str): Job ID
+            done (int): Work items completed
+            total (int): Total work items
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET progress_done = ?, progress_total = ? "
+                "WHERE id = ?",
+                (done, total, job_id)
+            )
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Record the final state of a job.
+
+        Args:
+            job_id (str): Job ID
+            status (str): Final status
+            result (dict, optional): JSON-serializable job result
+            error (str, optional): Error message for failed jobs
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, "
+                "finished_at = ? WHERE id = ?",
+                (
+                    status,
+                    json.dumps(result) if result is not None else None,
+                    error, time.time(), job_id
+                )
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet.
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            bool: True if the job was queued and is now cancelled
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? "
+                "WHERE id = ? AND status = ?",
+                (STATUS_CANCELLED, time.time(), job_id, STATUS_QUEUED)
+            )
+        return cursor.rowcount > 0
+
+    def purge(self, older_than: float) -> int:
+        """Delete finished jobs older than a given age.
+
+        Args:
+            older_than (float): Age in seconds
+
+        Returns:
+            int: Number of jobs deleted
+        """
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM jobs WHERE status IN ({placeholders}) "
+                "AND finished_at < ?",
+                FINISHED_STATUSES + (time.time() - older_than,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
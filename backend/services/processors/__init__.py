@@ -1,21 +1,39 @@
 """Processors package."""
 
 from backend.services.processors.converter import ImageConverter
+from backend.services.processors.fingerprint import (
+    ReportChangeSet,
+    ReportFingerprintStore
+)
 from backend.services.processors.metadata_parser import (
+    ReportColumns,
+    ReportNameInfo,
+    classify_report_name,
+    columns_from_reports,
+    fold_diacritics,
     filter_parent_company,
     determine_audit_status,
     parse_report_time,
     clean_report_name,
     prioritize_reports,
+    process_report_batch,
     process_reports
 )
 
 __all__ = [
+    "ReportColumns",
+    "ReportNameInfo",
+    "classify_report_name",
+    "columns_from_reports",
+    "fold_diacritics",
     "filter_parent_company",
     "determine_audit_status",
     "parse_report_time",
     "clean_report_name",
     "prioritize_reports",
     "process_reports",
+    "process_report_batch",
     "ImageConverter",
+    "ReportChangeSet",
+    "ReportFingerprintStore",
 ]
@@ -9,6 +9,8 @@ from typing import List
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
 from pdf2image import convert_from_bytes
 import requests
+from backend.core import settings
+from backend.services.cache import get_http_cache
 
 
 logger = logging.getLogger(__name__)
@@ -28,14 +30,27 @@ class ImageConverter:
         self.dpi = dpi
 
     def get_file_bytes(self, file_url: str):
-        """_summary_
+        """Download a report file, reusing the on-disk HTTP cache.
 
         Args:
-            file_url (str): _description_
+            file_url (str): URL of the file
 
         Returns:
-            _type_: _description_
+            bytes or None: File content, or None if the download failed
         """
+        cache = get_http_cache()
+        if cache is not None:
+            entry = cache.fetch(
+                file_url,
+                lambda url, headers: requests.get(
+                    url, headers=headers, timeout=60
+                ),
+                ttl=settings.HTTP_CACHE_FILE_TTL
+            )
+            if entry is None:
+                logger.info("Failed to download file: %s", file_url)
+                return None
+            return entry.content
 
         response = requests.get(file_url, timeout=60)
         if response.status_code == 200:
@@ -0,0 +1,202 @@
+"""
+Change detection for scraped report listings.
+
+Each symbol's report table is fingerprinted row by row and the hashes are
+persisted between scrapes. A new scrape is compared with the stored state
+so that unchanged listings skip processing and database writes entirely,
+and changed listings only process the report periods that changed.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+from backend.services.cache import KeyValueStore, get_store
+from backend.services.processors.metadata_parser import parse_report_time
+from backend.services.records import RawReport
+
+logger = logging.getLogger(__name__)
+
+
+def _row_keys(reports: List[RawReport]) -> List[str]:
+    """Stable identity of each row: report time and name.
+
+    Repeated (time, name) pairs within one listing get an occurrence
+    suffix so every row has a distinct key.
+    """
+    seen: Dict[str, int] = {}
+    keys = []
+    for report in reports:
+        base = f"{report.report_time}|{report.report_name}"
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        keys.append(base if occurrence == 0 else f"{base}#{occurrence}")
+    return keys
+
+
+def _row_hash(report: RawReport) -> str:
+    """Hash of the row content that is persisted downstream."""
+    payload = json.dumps(
+        [
+            report.company_name,
+            report.report_time,
+            report.report_name,
+            report.report_url,
+        ],
+        ensure_ascii=False
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _period(report: RawReport) -> Tuple[Any, Any, Any]:
+    """Deduplication period of a raw row (type, year, quarter)."""
+    parsed = parse_report_time(report.report_time or "")
+    return (
+        parsed["report_type"],
+        parsed["report_year"],
+        parsed["report_quarter"],
+    )
+
+
+class ReportChangeSet:
+    """Difference between a scraped listing and the stored fingerprint."""
+
+    def __init__(
+        self,
+        symbol: str,
+        reports: List[RawReport],
+        row_hashes: Dict[str, str],
+        new: List[str],
+        changed: List[str],
+        unchanged: List[str],
+        affected_reports: List[RawReport]
+    ):
+        """Initialize the change set.
+
+        Args:
+            symbol (str): Stock symbol
+            reports (list): All scraped rows
+            row_hashes (dict): Hash of every scraped row by row key
+            new (list): Keys of rows not seen before
+            changed (list): Keys of rows whose content changed
+            unchanged (list): Keys of rows identical to the stored state
+            affected_reports (list): Rows to process: every row sharing a
+                report period with a new or changed row
+        """
+        self.symbol = symbol
+        self.reports = reports
+        self.row_hashes = row_hashes
+        self.new = new
+        self.changed = changed
+        self.unchanged = unchanged
+        self.affected_reports = affected_reports
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the whole listing."""
+        digest = hashlib.sha1()
+        for key in sorted(self.row_hashes):
+            digest.update(f"{key}={self.row_hashes[key]}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any row is new or changed."""
+        return bool(self.new or self.changed)
+
+    def summary(self) -> Dict[str, List[str]]:
+        """Row keys grouped by status, for API responses."""
+        return {
+            "new": self.new,
+            "changed": self.changed,
+            "unchanged": self.unchanged,
+        }
+
+
+class ReportFingerprintStore:
+    """Persisted per-symbol row fingerprints."""
+
+    def __init__(self, store: Optional[KeyValueStore] = None):
+        """Initialize the fingerprint store.
+
+        Args:
+            store (KeyValueStore, optional): Backing store. Defaults to the
+                shared 'report_fingerprints' namespace.
+        """
+        self.store = store or get_store("report_fingerprints")
+
+    def diff(
+        self,
+        symbol: str,
+        reports: List[RawReport]
+    ) -> ReportChangeSet:
+        """Compare scraped rows with the stored fingerprint.
+
+        Args:
+            symbol (str): Stock symbol
+            reports (list): Raw rows as returned by the scraper
+
+        Returns:
+            ReportChangeSet: New, changed and unchanged rows
+        """
+        stored = self.store.get(symbol.lower()) or {}
+        previous: Dict[str, str] = stored.get("rows", {})
+
+        keys = _row_keys(reports)
+        row_hashes: Dict[str, str] = {}
+        new: List[str] = []
+        changed: List[str] = []
+        unchanged: List[str] = []
+        touched: List[RawReport] = []
+
+        for key, report in zip(keys, reports):
+            row_hash = _row_hash(report)
+            row_hashes[key] = row_hash
+
+            if key not in previous:
+                new.append(key)
+                touched.append(report)
+            elif previous[key] != row_hash:
+                changed.append(key)
+                touched.append(report)
+            else:
+                unchanged.append(key)
+
+        periods: Set[Tuple[Any, Any, Any]] = {
+            _period(report) for report in touched
+        }
+        affected = [
+            report for report in reports if _period(report) in periods
+        ]
+
+        return ReportChangeSet(
+            symbol=symbol,
+            reports=reports,
+            row_hashes=row_hashes,
+            new=new,
+            changed=changed,
+            unchanged=unchanged,
+            affected_reports=affected
+        )
+
+    def commit(self, changes: ReportChangeSet) -> None:
+        """Persist the fingerprint of a successfully stored listing.
+
+        Args:
+            changes (ReportChangeSet): Change set that was applied
+        """
+        self.store.set(changes.symbol.lower(), {
+            "fingerprint": changes.fingerprint,
+            "rows": changes.row_hashes,
+        })
+
+    def invalidate(self, symbol: str) -> None:
+        """Forget a symbol so its next scrape processes every row.
+
+        Call this whenever stored reports are removed outside a scrape.
+
+        Args:
+            symbol (str): Stock symbol
+        """
+        if self.store.delete(symbol.lower()):
+            logger.info("Invalidated report fingerprint for %s", symbol)
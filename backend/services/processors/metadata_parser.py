@@ -1,42 +1,140 @@
 """
 Financial report metadata parser.
 
-This module processes raw scraped financial report data into structured format
-suitable for database insertion. It handles:
+This module processes raw scraped report rows (``RawReport``) into
+``ReportRecord``s suitable for validation and database insertion. It
+handles:
 - Filtering parent company reports
 - Determining audit status
 - Parsing report periods
 - Prioritizing audited reports
+
+Listings hold a few dozen rows, so everything is done in plain Python in
+a single pass over the rows; a DataFrame costs more than the work itself.
+
+Report names repeat across symbols and periods, so everything derived
+from a name is computed once by ``classify_report_name`` and memoized.
+
+``process_report_batch`` processes the rows of many symbols at once, given
+as columns, and returns each symbol's reports; every slice equals what
+``process_reports`` returns for that symbol's listing.
 """
 import re
 import logging
-from typing import List, Dict, Any, cast
-import pandas as pd
+import unicodedata
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple
+)
+from backend.services.records import RawReport, ReportRecord
 
 
 logger = logging.getLogger(__name__)
 
+REPORT_NAME_CACHE_SIZE = 4096
+
+# Markers in the lowercase NFC name, matched anywhere as before
+ACCENTED_MARKERS = re.compile(
+    r'(?P<parent>mẹ)|(?P<audited>kiểm\s+toán)|(?P<reviewed>soát\s+xét)'
+)
+# Markers in names written without diacritics, matched as whole words
+# since e.g. 'me' is a common fragment
+FOLDED_MARKERS = re.compile(
+    r'\b(?:(?P<parent>me)|(?P<audited>kiem\s+toan)'
+    r'|(?P<reviewed>soat\s+xet))\b'
+)
+PARENTHETICAL = re.compile(r'\s*\([^)]*\)')
+
+
+class ReportNameInfo(NamedTuple):
+    """Attributes of a report name."""
+    is_parent_company: bool
+    is_audited: bool
+    is_reviewed: bool
+    cleaned_name: Optional[str]
+
+
+def fold_diacritics(text: str) -> str:
+    """Strip Vietnamese diacritics (e.g. 'kiểm toán' -> 'kiem toan').
+
+    Args:
+        text (str): Text to fold
+
+    Returns:
+        str: Text without combining marks, with 'đ' mapped to 'd'
+    """
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).replace('đ', 'd').replace('Đ', 'D')
+
+
+@lru_cache(maxsize=REPORT_NAME_CACHE_SIZE)
+def classify_report_name(report_name: str) -> ReportNameInfo:
+    """Compute every attribute of a report name in one pass.
+
+    Names are matched case-insensitively after Unicode normalization.
+    Names written entirely without diacritics ('cong ty me',
+    'da kiem toan', 'soat xet') are recognized as well. Results are
+    memoized in a bounded LRU cache.
+
+    Args:
+        report_name (str): The name of the financial report
 
-def filter_parent_company(
-    reports: List[Dict[str, Any]]
-) -> List[Dict[str, Any]]:
+    Returns:
+        ReportNameInfo: Parent company flag, audit and review status and
+        the name without parenthetical content
+    """
+    if not report_name:
+        return ReportNameInfo(False, False, False, report_name)
+
+    lower = unicodedata.normalize('NFC', report_name).lower()
+    markers = (
+        FOLDED_MARKERS if fold_diacritics(lower) == lower
+        else ACCENTED_MARKERS
+    )
+    found = {match.lastgroup for match in markers.finditer(lower)}
+
+    return ReportNameInfo(
+        is_parent_company='parent' in found,
+        is_audited='audited' in found,
+        is_reviewed='reviewed' in found,
+        cleaned_name=PARENTHETICAL.sub('', report_name).strip()
+    )
+
+
+def filter_parent_company(reports: List[RawReport]) -> List[RawReport]:
     """Filter out parent company reports.
 
-    Removes reports that contain 'mẹ' (parent company) in the report name.
+    Removes reports that contain 'mẹ' (parent company) in the report name,
+    or the word 'me' in a name written without diacritics.
 
     Args:
-        reports (List[Dict[str, Any]]): List of report dictionaries
+        reports (List[RawReport]): Raw report rows
 
     Returns:
-        List[Dict[str, Any]]: Filtered list excluding parent company reports
+        List[RawReport]: Filtered list excluding parent company reports
     """
-    filtered = []
-    for report in reports:
-        report_name = report.get('report_name', '')
-        if report_name and 'mẹ' not in report_name.lower():
-            filtered.append(report)
+    return [
+        report for report in reports
+        if not _is_excluded(report.report_name)
+    ]
+
 
-    return filtered
+def _is_excluded(report_name: Optional[str]) -> bool:
+    """Whether a report is dropped: unnamed or a parent company report."""
+    return (
+        not report_name
+        or classify_report_name(report_name).is_parent_company
+    )
 
 
 def determine_audit_status(report_name: str) -> Dict[str, bool]:
@@ -48,16 +146,11 @@ def determine_audit_status(report_name: str) -> Dict[str, bool]:
     Returns:
         Dict[str, bool]: Dictionary with 'is_audited' and 'is_reviewed' keys
     """
-    if not report_name:
-        return {'is_audited': False, 'is_reviewed': False}
-
-    report_name_lower = report_name.lower()
-    is_audited = 'kiểm toán' in report_name_lower
-    is_reviewed = 'soát xét' in report_name_lower
+    info = classify_report_name(report_name)
 
     return {
-        'is_audited': is_audited,
-        'is_reviewed': is_reviewed
+        'is_audited': info.is_audited,
+        'is_reviewed': info.is_reviewed
     }
 
 
@@ -133,15 +226,25 @@ def clean_report_name(report_name: str) -> str:
     Returns:
         str: Cleaned report name
     """
+    return classify_report_name(report_name).cleaned_name
 
-    if not report_name:
-        return report_name
 
-    cleaned = re.sub(r'\s*\([^)]*\)', '', report_name)
-    return cleaned.strip()
+def _priority(is_audited: bool, is_reviewed: bool) -> int:
+    """Rank of a report among duplicates: audited > reviewed > regular."""
+    return int(is_audited) * 2 + int(is_reviewed)
+
+
+def _dedup_key(report: ReportRecord) -> Tuple[Any, Any, Any, Any]:
+    """Key identifying duplicate reports of the same period."""
+    return (
+        report.symbol,
+        report.report_type,
+        report.report_year,
+        report.report_quarter
+    )
 
 
-def prioritize_reports(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def prioritize_reports(reports: List[ReportRecord]) -> List[ReportRecord]:
     """Prioritize audited and reviewed reports over regular reports.
 
     For duplicate reports (same symbol, report_type, report_year,
@@ -150,31 +253,121 @@ def prioritize_reports(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     2. Reviewed reports (is_reviewed=True)
     3. Regular reports
 
+    Among duplicates of equal priority the first one is kept. The result
+    is ordered by priority, highest first, then by input order.
+
     Args:
-        reports (List[Dict[str, Any]]): List of reports with audit status
+        reports (List[ReportRecord]): Processed reports
 
     Returns:
-        List[Dict[str, Any]]: Deduplicated list with prioritized reports
+        List[ReportRecord]: Deduplicated list with prioritized reports
     """
     if not reports:
         return reports
 
-    df = pd.DataFrame(reports)
-    df['priority'] = (
-        df['is_audited'].astype(int) * 2 +
-        df['is_reviewed'].astype(int)
-    )
-    df = df.sort_values('priority', ascending=False)
-    df = df.drop_duplicates(
-        subset=['symbol', 'report_type', 'report_year', 'report_quarter'],
-        keep='first'
+    best: Dict[Tuple[Any, ...], Tuple[int, int]] = {}
+    for index, report in enumerate(reports):
+        priority = _priority(report.is_audited, report.is_reviewed)
+        key = _dedup_key(report)
+        current = best.get(key)
+        if current is None or priority > current[0]:
+            best[key] = (priority, index)
+
+    kept = sorted(best.values(), key=lambda entry: (-entry[0], entry[1]))
+    return [reports[index] for _, index in kept]
+
+
+def _sort_key(entry: Tuple[int, int, ReportRecord]) -> Tuple[Any, ...]:
+    """Order by symbol, year descending and quarter, missing values last.
+
+    Ties keep the higher priority report first, then input order.
+    """
+    priority, index, report = entry
+    symbol = report.symbol
+    year = report.report_year
+    quarter = report.report_quarter
+    return (
+        symbol is None, symbol or '',
+        year is None, -(year or 0),
+        quarter is None, quarter or 0,
+        -priority, index
     )
-    df = df.drop(columns=['priority'])
 
-    return cast(List[Dict[str, Any]], df.to_dict('records'))
 
+class ReportColumns(NamedTuple):
+    """Raw report rows of many symbols, one sequence per field."""
+    symbol: Sequence[str]
+    company_name: Sequence[Optional[str]]
+    report_time: Sequence[Optional[str]]
+    report_name: Sequence[Optional[str]]
+    report_url: Sequence[Optional[str]]
+
+
+def columns_from_reports(
+    listings: Iterable[Iterable[RawReport]]
+) -> ReportColumns:
+    """Lay out the rows of scraped listings as columns.
+
+    Args:
+        listings (Iterable[Iterable[RawReport]]): Raw rows per symbol
+
+    Returns:
+        ReportColumns: All rows, in listing order
+    """
+    rows = [report for listing in listings for report in listing]
+    if not rows:
+        return ReportColumns([], [], [], [], [])
+    return ReportColumns._make(list(column) for column in zip(*rows))
+
+
+BestReports = Dict[Tuple[Any, ...], Tuple[int, int, ReportRecord]]
+
+
+def _best_reports(
+    rows: Iterable[Sequence[Optional[str]]],
+    parse_time: Callable[[str], Dict[str, Any]] = parse_report_time
+) -> BestReports:
+    """Classify rows and keep the best report of each period in one pass.
 
-def process_reports(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    Args:
+        rows (Iterable[Sequence]): Raw rows in ``RawReport`` field order
+        parse_time (Callable): Period parser
+
+    Returns:
+        BestReports: Priority, row index and record keyed by period
+    """
+    best: BestReports = {}
+    for index, row in enumerate(rows):
+        symbol, company_name, report_time, report_name, report_url = row
+        if not report_name:
+            continue
+        info = classify_report_name(report_name)
+        if info.is_parent_company:
+            continue
+
+        period = parse_time(report_time)
+        record = ReportRecord._make((
+            symbol,
+            company_name,
+            info.cleaned_name,
+            period['report_type'],
+            period['report_year'],
+            period['report_quarter'],
+            info.is_audited,
+            info.is_reviewed,
+            report_url
+        ))
+
+        priority = _priority(info.is_audited, info.is_reviewed)
+        key = _dedup_key(record)
+        current = best.get(key)
+        if current is None or priority > current[0]:
+            best[key] = (priority, index, record)
+
+    return best
+
+
+def process_reports(reports: List[RawReport]) -> List[ReportRecord]:
     """Process raw financial report data into structured format.
 
     This function performs the following operations:
@@ -185,66 +378,78 @@ def process_reports(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     5. Prioritizes audited and reviewed reports
     6. Sorts reports by symbol, year, and quarter
 
+    Steps 1 to 5 run in one pass over the rows, followed by one sort.
+    Each surviving row becomes one ``ReportRecord``; nothing else is
+    allocated per row.
+
     Args:
-        reports (List[Dict[str, Any]]): List of raw report dictionaries
+        reports (List[RawReport]): Raw report rows
 
     Returns:
-        List[Dict[str, Any]]: Processed list of report dictionaries in JSON
-        format
+        List[ReportRecord]: Processed reports
     """
     if not reports:
         logger.warning("No reports to process")
         return []
 
-    reports = filter_parent_company(reports)
-    if not reports:
+    best = _best_reports(reports)
+    if not best:
         logger.warning("All reports filtered out (parent company)")
         return []
 
-    for report in reports:
-        audit_status = determine_audit_status(report.get('report_name', ''))
-        report['is_audited'] = audit_status['is_audited']
-        report['is_reviewed'] = audit_status['is_reviewed']
-
-    for report in reports:
-        time_parsed = parse_report_time(report.get('report_time', ''))
-        report['report_type'] = time_parsed['report_type']
-        report['report_year'] = time_parsed['report_year']
-        report['report_quarter'] = time_parsed['report_quarter']
-
-    for report in reports:
-        if report.get('report_name'):
-            report['report_name'] = clean_report_name(report['report_name'])
-
-    reports = prioritize_reports(reports)
-    df = pd.DataFrame(reports)
-    df = df.sort_values(
-        by=['symbol', 'report_year', 'report_quarter'],
-        ascending=[True, False, True],
-        na_position='last'
-    )
-
-    column_order = [
-        'symbol',
-        'company_name',
-        'report_name',
-        'report_type',
-        'report_year',
-        'report_quarter',
-        'is_audited',
-        'is_reviewed',
-        'report_url'
+    result = [
+        record for _, _, record in sorted(best.values(), key=_sort_key)
     ]
 
-    existing_columns = [col for col in column_order if col in df.columns]
-    df = df[existing_columns]
-    result = df.to_dict('records')
+    logger.info("Processed %d reports", len(result))
+
+    return result
 
-    for report in result:
-        for key, value in report.items():
-            if pd.isna(value):
-                report[key] = None
 
-    logger.info("Processed %d reports", len(result))
+def process_report_batch(
+    columns: ReportColumns
+) -> Dict[str, List[ReportRecord]]:
+    """Process the raw rows of many symbols at once.
+
+    Rows are grouped by symbol in one pass over the columns, and each
+    distinct period string is parsed once for the whole batch. Use this
+    when the rows of many symbols are in hand at once, e.g. to reprocess
+    the whole market; scrapes process each symbol as it arrives with
+    ``process_reports``.
+
+    Args:
+        columns (ReportColumns): Raw rows of all symbols
+
+    Returns:
+        Dict[str, List[ReportRecord]]: Processed reports of every symbol
+        in the batch, in order of first appearance; each list equals
+        ``process_reports`` on that symbol's rows
+    """
+    periods: Dict[Optional[str], Dict[str, Any]] = {}
+
+    def parse_time(report_time: Optional[str]) -> Dict[str, Any]:
+        period = periods.get(report_time)
+        if period is None:
+            period = periods[report_time] = parse_report_time(report_time)
+        return period
+
+    listings: Dict[str, List[Tuple[Optional[str], ...]]] = {}
+    for row in zip(*columns):
+        listing = listings.get(row[0])
+        if listing is None:
+            listing = listings[row[0]] = []
+        listing.append(row)
+
+    slices: Dict[str, List[ReportRecord]] = {}
+    for symbol, rows in listings.items():
+        best = _best_reports(rows, parse_time)
+        slices[symbol] = [
+            record for _, _, record in sorted(best.values(), key=_sort_key)
+        ]
+
+    logger.info(
+        "Processed %d reports of %d symbols",
+        sum(len(records) for records in slices.values()), len(slices)
+    )
 
-    return cast(List[Dict[str, Any]], result)
+    return slices
@@ -0,0 +1,57 @@
+"""
+Compact report records shared by the scrapers and the processors.
+
+A full-universe crawl holds tens of thousands of report rows at once.
+Rows travel from the scraper through processing to validation as
+immutable named tuples instead of dicts: a tuple stores its values
+without a per-row hash table, nothing downstream can mutate a row in
+place, and no stage has to copy rows defensively. Rows become dicts or
+Pydantic models only at the API boundary (``_asdict()``).
+"""
+
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+
+class RawReport(NamedTuple):
+    """One row of a scraped report listing, as found on the page.
+
+    Text fields are lowercased; ``report_url`` is absolute.
+    """
+    symbol: str
+    company_name: Optional[str]
+    report_time: Optional[str]
+    report_name: Optional[str]
+    report_url: Optional[str]
+
+
+class ReportRecord(NamedTuple):
+    """A processed report, ready for validation and storage."""
+    symbol: str
+    company_name: Optional[str]
+    report_name: Optional[str]
+    report_type: Optional[str]
+    report_year: Optional[int]
+    report_quarter: Optional[int]
+    is_audited: bool
+    is_reviewed: bool
+    report_url: Optional[str]
+
+
+def load_raw_reports(
+    rows: Iterable[Union[Sequence[Any], dict]]
+) -> List[RawReport]:
+    """Rebuild raw reports from their JSON form.
+
+    Reports serialize to JSON arrays in field order. Snapshots cached
+    before reports became records hold objects, which are accepted too.
+
+    Args:
+        rows (Iterable): Decoded JSON rows, arrays or objects
+
+    Returns:
+        List[RawReport]: The reports
+    """
+    return [
+        RawReport(**row) if isinstance(row, dict) else RawReport(*row)
+        for row in rows
+    ]
@@ -2,8 +2,74 @@
 
 from backend.services.scrappers.base import BaseScraper
 from backend.services.scrappers.cafef import CafeFScraper
+from backend.services.scrappers.tabs import TabbedCafeFScraper
+from backend.services.scrappers.pool import (
+    WebDriverPool,
+    get_driver_pool,
+    driver_pool_stats,
+    close_driver_pools
+)
+from backend.services.scrappers.http_client import (
+    HttpClient,
+    get_http_client,
+    close_http_client
+)
+from backend.services.scrappers.exchange import (
+    ExchangeResolver,
+    get_exchange_resolver,
+    exchange_stats
+)
+from backend.services.scrappers.fetch import FETCH_MODES, fetch_reports
+from backend.services.scrappers.governor import reap_orphans
+from backend.services.scrappers.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    NoDataCache,
+    NoDataError,
+    get_circuit_breaker,
+    get_no_data_cache,
+    resilience_stats
+)
+from backend.services.scrappers.throttle import RateLimiter, throttle
+from backend.services.scrappers.bulk import BulkScrapeEngine
+from backend.services.scrappers.profile import (
+    BrowsingProfile,
+    traffic_stats
+)
+from backend.services.scrappers.readiness import (
+    ReadinessTracker,
+    readiness_stats
+)
 
 __all__ = [
     "BaseScraper",
-    "CafeFScraper"
+    "CafeFScraper",
+    "TabbedCafeFScraper",
+    "WebDriverPool",
+    "get_driver_pool",
+    "driver_pool_stats",
+    "close_driver_pools",
+    "HttpClient",
+    "get_http_client",
+    "close_http_client",
+    "ExchangeResolver",
+    "get_exchange_resolver",
+    "exchange_stats",
+    "FETCH_MODES",
+    "fetch_reports",
+    "reap_orphans",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "NoDataCache",
+    "NoDataError",
+    "get_circuit_breaker",
+    "get_no_data_cache",
+    "resilience_stats",
+    "RateLimiter",
+    "throttle",
+    "BulkScrapeEngine",
+    "ReadinessTracker",
+    "readiness_stats",
+    "BrowsingProfile",
+    "traffic_stats"
 ]
@@ -4,19 +4,40 @@ Base web scraper with Selenium WebDriver management.
 This module provides the base class for web scraping with:
 - WebDriver initialization and cleanup
 - Headless mode support
+- Condition-based page readiness with adaptive timeouts
+- Optional lean browsing profile that blocks unneeded resources
+- Cached snapshots of rendered pages
+- Process tree tracking and forced cleanup of the browser
 - Anti-bot bypass configurations
 - Resource management
 """
 
 import time
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
+from backend.core import settings
+from backend.services.cache import CacheEntry, get_http_cache
+from backend.services.scrappers.governor import (
+    kill_process_tree,
+    kill_processes,
+    marker_argument,
+    process_tree,
+    track_driver,
+    tree_memory,
+    untrack_driver
+)
+from backend.services.scrappers.profile import BrowsingProfile
+from backend.services.scrappers.readiness import get_readiness_tracker
+from backend.services.scrappers.throttle import throttle
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_PREFIX = "browser:"
+
 
 class BaseScraper:
     """Base scraper class with WebDriver management.
@@ -28,16 +49,34 @@ class BaseScraper:
     - Resource cleanup
     """
 
-    def __init__(self, headless: bool = False):
+    def __init__(
+        self,
+        headless: bool = False,
+        lean: bool = False,
+        profile: Optional[BrowsingProfile] = None
+    ):
         """Initialize the base scraper.
 
         Args:
             headless (bool): Whether to run browser in headless mode.
                 Defaults to False.
+            lean (bool): Use the lean browsing profile (eager page load,
+                images, fonts and ad networks blocked). Defaults to False.
+            profile (BrowsingProfile, optional): Explicit browsing profile,
+                overriding ``lean``
         """
         self.headless = headless
+        self.profile = profile or (
+            BrowsingProfile.lean() if lean else BrowsingProfile.full()
+        )
+        self.last_traffic: Optional[Dict[str, Any]] = None
         self.driver: Optional[webdriver.Chrome] = None
-        self._wait: Optional[WebDriverWait] = None
+        self.driver_pid: Optional[int] = None
+        self.started_at: Optional[float] = None
+        self.pages_loaded = 0
+        self.last_ready_time: Optional[float] = None
+        self.readiness = get_readiness_tracker(type(self).__name__)
+        self._ready_probe: Any = None
 
     def init_webdriver(self) -> webdriver.Chrome:
         """Initialize the Selenium WebDriver with Chrome options.
@@ -73,9 +112,13 @@ class BaseScraper:
         )
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
+        options.add_argument(marker_argument())
+        self.profile.apply_options(options)
 
         try:
             self.driver = webdriver.Chrome(options=options)
+            self.driver_pid = self.driver.service.process.pid
+            track_driver(self.driver_pid)
             self.driver.execute_script(
                 """
                 Object.defineProperty(
@@ -84,14 +127,18 @@ class BaseScraper:
                 """
             )
 
+            self.profile.apply_driver(self.driver)
+
             if not self.headless:
                 self.driver.set_window_size(1920, 1080)
 
-            self._wait = WebDriverWait(self.driver, 10)
+            self.started_at = time.monotonic()
+            self.pages_loaded = 0
 
             logger.info(
-                "WebDriver initialized successfully (headless=%s)",
-                self.headless
+                "WebDriver initialized successfully (headless=%s, "
+                "profile=%s)",
+                self.headless, self.profile.name
             )
             return self.driver
 
@@ -99,21 +146,113 @@ class BaseScraper:
             logger.error("Failed to initialize WebDriver: %s", error)
             raise
 
-    def get_page(self, url: str, wait_time: float = 1.5) -> None:
-        """Navigate to a URL and wait for page load.
+    def get_page(self, url: str, wait_time: Optional[float] = None) -> bool:
+        """Navigate to a URL and wait until the page is ready.
+
+        Readiness is decided by ``is_page_ready``, polled up to an adaptive
+        timeout derived from previous pages. The time the page actually
+        took is stored in ``last_ready_time`` and, when the profile
+        captures traffic, the page's network usage in ``last_traffic``.
 
         Args:
             url (str): URL to navigate to
-            wait_time (float): Time to wait after page load in seconds
+            wait_time (float, optional): Extra fixed delay after readiness,
+                for pages whose content keeps changing after it
+
+        Returns:
+            bool: True if the page became ready, False on timeout
         """
         if self.driver is None:
             raise RuntimeError(
                 "WebDriver not initialized. Call init_webdriver() first."
             )
 
+        throttle(url)
         logger.info("Navigating to: %s", url)
+        self.profile.reset_traffic(self.driver)
+        started = time.monotonic()
         self.driver.get(url)
-        time.sleep(wait_time)
+        self.pages_loaded += 1
+        ready = self.wait_until_ready(started)
+
+        self.last_traffic = self.profile.read_traffic(self.driver)
+        if self.last_traffic:
+            logger.debug("Page traffic for %s: %s", url, self.last_traffic)
+
+        if wait_time:
+            time.sleep(wait_time)
+        return ready
+
+    def wait_until_ready(self, started: Optional[float] = None) -> bool:
+        """Poll ``is_page_ready`` until it succeeds or the timeout expires.
+
+        Args:
+            started (float, optional): Monotonic time navigation began.
+                Defaults to now.
+
+        Returns:
+            bool: True if the page became ready, False on timeout
+        """
+        if self.driver is None:
+            raise RuntimeError(
+                "WebDriver not initialized. Call init_webdriver() first."
+            )
+
+        started = time.monotonic() if started is None else started
+        timeout = self.readiness.timeout()
+        self._ready_probe = None
+
+        try:
+            WebDriverWait(
+                self.driver, timeout, poll_frequency=0.1
+            ).until(self.is_page_ready)
+            ready = True
+        except TimeoutException:
+            ready = False
+
+        elapsed = time.monotonic() - started
+        self.last_ready_time = elapsed
+        self.readiness.record(elapsed, timed_out=not ready)
+
+        if ready:
+            logger.debug("Page ready after %.2fs", elapsed)
+        else:
+            logger.warning(
+                "Page not ready after %.2fs (timeout %.2fs)", elapsed, timeout
+            )
+        return ready
+
+    def is_page_ready(self, driver: webdriver.Chrome) -> bool:
+        """Readiness predicate polled after navigation.
+
+        Subclasses override this to wait for the content they need. The
+        default waits for the document to finish loading.
+
+        Args:
+            driver (webdriver.Chrome): The active WebDriver
+
+        Returns:
+            bool: True once the page can be scraped
+        """
+        return driver.execute_script(
+            "return document.readyState"
+        ) == "complete"
+
+    def is_stable(self, value: Any) -> bool:
+        """Check that a probed value is unchanged since the previous poll.
+
+        Useful in ``is_page_ready`` to wait until content stops changing.
+        The probe is reset on every navigation.
+
+        Args:
+            value: Current probe value (None means not ready)
+
+        Returns:
+            bool: True if the value is set and equals the previous probe
+        """
+        previous = self._ready_probe
+        self._ready_probe = value
+        return value is not None and value == previous
 
     def get_page_source(self) -> str:
         """Get the current page source.
@@ -128,17 +267,111 @@ class BaseScraper:
 
         return self.driver.page_source
 
+    def load_snapshot(self, url: str) -> Optional[CacheEntry]:
+        """Get a fresh cached snapshot of a rendered page.
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            CacheEntry or None: The snapshot, or None if the cache is
+            disabled or holds no fresh snapshot
+        """
+        cache = get_http_cache()
+        if cache is None:
+            return None
+        return cache.get_fresh(SNAPSHOT_PREFIX + url)
+
+    def save_snapshot(
+        self,
+        url: str,
+        content: str,
+        content_type: str = "text/html; charset=utf-8"
+    ) -> None:
+        """Cache what was read from a rendered page.
+
+        Snapshots are kept for HTTP_CACHE_PAGE_TTL seconds, so repeated
+        scrapes of the same page skip the browser.
+
+        Args:
+            url (str): Page URL
+            content (str): Page HTML or data extracted from it
+            content_type (str): Content type of ``content``
+        """
+        cache = get_http_cache()
+        if cache is None:
+            return
+        cache.put(
+            SNAPSHOT_PREFIX + url,
+            content.encode("utf-8"),
+            ttl=settings.HTTP_CACHE_PAGE_TTL,
+            content_type=content_type,
+            encoding="utf-8"
+        )
+
+    @property
+    def age(self) -> float:
+        """Seconds since the WebDriver was started (0 if not running)."""
+        if self.started_at is None:
+            return 0.0
+        return time.monotonic() - self.started_at
+
+    def is_alive(self) -> bool:
+        """Check that the browser session still answers commands.
+
+        Returns:
+            bool: True if the WebDriver responds, False otherwise
+        """
+        if self.driver is None:
+            return False
+
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception as error:
+            logger.warning("WebDriver health check failed: %s", error)
+            return False
+
+    def memory_usage(self) -> Dict[str, float]:
+        """Measure the browser's process tree.
+
+        Returns:
+            Dict[str, float]: ``rss_mb`` and ``processes`` of chromedriver,
+            Chrome and its helper processes
+        """
+        return tree_memory(self.driver_pid)
+
     def quit(self) -> None:
-        """Close the WebDriver and cleanup resources."""
+        """Close the WebDriver and cleanup resources.
+
+        Browser processes that survive the quit are killed, and a quit
+        that fails kills the driver's whole process tree, so no Chrome is
+        left behind.
+        """
         if self.driver is not None:
+            pid = self.driver_pid
+            processes = process_tree(pid)
+            failed = False
             try:
                 self.driver.quit()
                 logger.info("WebDriver closed successfully")
             except Exception as error:
+                failed = True
                 logger.error("Error closing WebDriver: %s", error)
             finally:
                 self.driver = None
-                self._wait = None
+                self.driver_pid = None
+                self.started_at = None
+                untrack_driver(pid)
+
+            # Kill the live tree first, then snapshot members re-parented
+            # away from chromedriver while it exited
+            stopped = kill_process_tree(pid) if failed else 0
+            stopped += kill_processes(list(reversed(processes)))
+            if stopped:
+                logger.warning(
+                    "Force-killed %d leftover browser process(es)", stopped
+                )
 
     def __enter__(self):
         """Context manager entry."""
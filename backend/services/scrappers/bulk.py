@@ -0,0 +1,175 @@
+"""
+Bounded-concurrency bulk scraping engine.
+
+Symbols are fanned out to a fixed set of worker threads. Each task leases
+its own WebDriver (or uses the pooled HTTP session) and the shared per-host
+rate limiter keeps the combined request rate under the configured cap.
+Results are yielded as soon as each symbol finishes.
+
+``process`` runs the same fan-out for work fed by another producer, such
+as listings a multi-tab browser finishes: the producer is drained on its
+own thread, so it never waits for the workers or the caller.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar
+)
+from backend.core import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+_SOURCE_DONE = object()
+
+
+class BulkScrapeEngine:
+    """Run a per-symbol task over many symbols with bounded concurrency."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the engine.
+
+        Args:
+            max_workers (int, optional): Number of worker threads.
+                Defaults to the SCRAPER_BULK_WORKERS setting.
+        """
+        self.max_workers = max_workers or settings.SCRAPER_BULK_WORKERS
+
+    def run(
+        self,
+        symbols: Iterable[str],
+        task: Callable[[str], T]
+    ) -> Iterator[Tuple[str, T]]:
+        """Run ``task`` for every symbol and yield results as they finish.
+
+        The task is expected to handle its own errors and return a result
+        object; an exception escaping it is logged and re-raised to the
+        caller when that symbol's result is consumed.
+
+        Args:
+            symbols (Iterable[str]): Symbols to process
+            task (Callable[[str], T]): Work to run for one symbol
+
+        Yields:
+            Tuple[str, T]: Symbol and its task result, in completion order
+        """
+        symbols = list(symbols)
+        workers = max(1, min(self.max_workers, len(symbols)))
+
+        logger.info(
+            "Bulk scraping %d symbols with %d workers", len(symbols), workers
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="bulk-scrape"
+        ) as executor:
+            futures = {
+                executor.submit(task, symbol): symbol for symbol in symbols
+            }
+            try:
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        logger.error(
+                            "Bulk task for %s raised: %s", symbol, error
+                        )
+                        raise
+                    yield symbol, result
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def process(
+        self,
+        source: Iterable[Tuple[str, S]],
+        task: Callable[[str, S], T]
+    ) -> Iterator[Tuple[str, T]]:
+        """Run ``task`` for every item of ``source`` as it is produced.
+
+        ``source`` is iterated on a dedicated thread and each item is
+        handed to a worker at once, so a slow task or a slow consumer of
+        the results never holds up the producer. Stopping the iteration
+        early stops drawing from ``source`` and cancels queued tasks.
+
+        Args:
+            source (Iterable[Tuple[str, S]]): Symbols and the input of
+                their task, e.g. fetched listings
+            task (Callable[[str, S], T]): Work to run for one item
+
+        Yields:
+            Tuple[str, T]: Symbol and its task result, in completion order
+
+        Raises:
+            Exception: An error raised by ``source``, or by a task when
+                its result is consumed
+        """
+        finished: "queue.Queue[Tuple[Any, Any]]" = queue.Queue()
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, self.max_workers),
+            thread_name_prefix="bulk-process"
+        )
+
+        def report(symbol: str, future: Future) -> None:
+            future.add_done_callback(lambda _: finished.put((symbol, future)))
+
+        def produce() -> None:
+            submitted = 0
+            items = iter(source)
+            try:
+                for symbol, item in items:
+                    if stop.is_set():
+                        break
+                    report(symbol, executor.submit(task, symbol, item))
+                    submitted += 1
+            except Exception as error:
+                logger.error("Bulk source failed: %s", error)
+                finished.put((None, error))
+            finally:
+                close = getattr(items, "close", None)
+                if close is not None:
+                    close()
+                finished.put((_SOURCE_DONE, submitted))
+
+        producer = threading.Thread(
+            target=produce, name="bulk-source", daemon=True
+        )
+        producer.start()
+        try:
+            expected: Optional[int] = None
+            received = 0
+            while expected is None or received < expected:
+                symbol, outcome = finished.get()
+                if symbol is _SOURCE_DONE:
+                    expected = outcome
+                    continue
+                if symbol is None:
+                    raise outcome
+
+                received += 1
+                try:
+                    result = outcome.result()
+                except Exception as error:
+                    logger.error(
+                        "Bulk task for %s raised: %s", symbol, error
+                    )
+                    raise
+                yield symbol, result
+        finally:
+            stop.set()
+            producer.join()
+            executor.shutdown(wait=True, cancel_futures=True)
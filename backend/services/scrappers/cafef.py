@@ -5,14 +5,47 @@ This module provides functionality to scrape financial report data
 from cafef.vn website, returning structured JSON data.
 """
 
+import json
 import logging
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
+import time
+from typing import Any, List, Dict, Optional, Tuple
+import requests
+from selenium.common.exceptions import TimeoutException
 from backend.services.scrappers.base import BaseScraper
+from backend.services.scrappers.exchange import get_exchange_resolver
+from backend.services.scrappers.http_client import (
+    HttpClient,
+    get_http_client
+)
+from backend.services.scrappers.parsing import (
+    build_reports,
+    parse_report_listing
+)
+from backend.services.scrappers.resilience import (
+    NoDataError,
+    cafef_breaker,
+    get_no_data_cache
+)
+from backend.services.records import RawReport, load_raw_reports
 
 logger = logging.getLogger(__name__)
 
 
+CHALLENGE_MARKERS = (
+    "cf-browser-verification",
+    "challenge-platform",
+    "cf-chl-",
+    "just a moment...",
+    "g-recaptcha",
+    "captcha-container",
+    "access denied",
+)
+
+# States of a listing page once it is ready to be read
+LISTING_ROWS = "rows"
+LISTING_EMPTY = "empty"
+
+
 class CafeFScraper(BaseScraper):
     """Scraper for cafef.vn financial reports.
 
@@ -22,27 +55,131 @@ class CafeFScraper(BaseScraper):
     - Document URLs
     """
 
-    BASE_URL_TEMPLATE = (
-        "https://cafef.vn/du-lieu/hose/{symbol}"
-        "-bao-cao-tai-chinh.chn"
-    )
+    # Returns [document loaded, row count | null]
+    READY_SCRIPT = """
+        const body = document.querySelector('tbody.render_dataBCTC');
+        return [
+            document.readyState === 'complete',
+            body ? body.querySelectorAll('tr').length : null
+        ];
+    """
+
+    # Seconds a loaded page must stay without report rows before it is
+    # taken as having none: the table is filled by script after load
+    EMPTY_GRACE = 1.5
+
+    # Returns only what the parser needs instead of the whole DOM:
+    # {"company": str | null, "rows": [[name, time, href], ...]} or null
+    # when the report table is missing. Text is joined from trimmed text
+    # nodes to match the HTML parser.
+    EXTRACT_SCRIPT = """
+        const text = (el) => {
+            if (!el) return null;
+            const walker = document.createTreeWalker(
+                el, NodeFilter.SHOW_TEXT
+            );
+            const parts = [];
+            while (walker.nextNode()) {
+                parts.push(walker.currentNode.data.trim());
+            }
+            return parts.join('');
+        };
+        const body = document.querySelector('tbody.render_dataBCTC');
+        if (!body) return null;
+        const rows = Array.from(body.querySelectorAll('tr'), (tr) => {
+            const link = tr.querySelector('td.BCTC_body_download a');
+            return [
+                text(tr.querySelector('td.BCTC_body_type')),
+                text(tr.querySelector('td.BCTC_body_dateTime')),
+                link ? link.getAttribute('href') : null
+            ];
+        });
+        return {
+            company: text(document.querySelector('h1.title-content-name')),
+            rows: rows
+        };
+    """
+
+    EXTRACTION_MODES = ("script", "dom")
 
-    def __init__(self, headless: bool = False):
+    def __init__(
+        self,
+        headless: bool = False,
+        lean: bool = False,
+        extraction: str = "script"
+    ):
         """Initialize CafeF scraper.
 
         Args:
             headless (bool): Whether to run browser in headless mode
+            lean (bool): Whether to use the lean browsing profile
+            extraction (str): 'script' to extract rows inside the page and
+                return them as JSON, or 'dom' to transfer and parse the
+                full page source
+        """
+        super().__init__(headless=headless, lean=lean)
+        if extraction not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction}")
+        self.extraction = extraction
+        self.listing_state: Optional[str] = None
+
+    def probe_listing(
+        self,
+        previous: Any,
+        complete: bool,
+        row_count: Optional[int]
+    ) -> Tuple[Any, Optional[str]]:
+        """Advance the readiness probe of a listing page.
+
+        A listing is ready once its row count is the same on two
+        consecutive polls, or once the document has loaded and stayed
+        without report rows for ``EMPTY_GRACE`` seconds (delisted or
+        mistyped symbols).
+
+        Args:
+            previous: Probe returned by the previous poll (None at first)
+            complete (bool): Whether the document has finished loading
+            row_count (int, optional): Rows in the report table, or None
+                if the table is missing
+
+        Returns:
+            Tuple[Any, str or None]: The new probe, and ``LISTING_ROWS``
+            or ``LISTING_EMPTY`` once the page is ready (None before)
+        """
+        if row_count:
+            return row_count, LISTING_ROWS if row_count == previous else None
+        if not complete:
+            return None, None
+
+        now = time.monotonic()
+        since = previous[1] if isinstance(previous, tuple) else now
+        state = LISTING_EMPTY if now - since >= self.EMPTY_GRACE else None
+        return (LISTING_EMPTY, since), state
+
+    def is_page_ready(self, driver) -> bool:
+        """Wait for report rows to stop changing, or for a page without.
+
+        Args:
+            driver (webdriver.Chrome): The active WebDriver
+
+        Returns:
+            bool: True once the listing is ready per ``probe_listing``;
+            ``listing_state`` then tells whether it has report rows
         """
-        super().__init__(headless=headless)
+        complete, row_count = driver.execute_script(self.READY_SCRIPT)
+        self._ready_probe, self.listing_state = self.probe_listing(
+            self._ready_probe, complete, row_count
+        )
+        return self.listing_state is not None
 
-    def scrape_symbol(self, symbol: str) -> List[Dict[str, Any]]:
+    def scrape_symbol(self, symbol: str) -> List[RawReport]:
         """Scrape financial report data for a given stock symbol.
 
         Args:
             symbol (str): Stock symbol to scrape (e.g., 'FPT')
 
         Returns:
-            List[Dict[str, Any]]: List of report dictionaries with keys:
+            List[RawReport]: One record per report row with:
                 - symbol: Stock symbol (lowercase)
                 - company_name: Company name (lowercase)
                 - report_time: Report period (e.g., 'Q3/2025')
@@ -51,104 +188,257 @@ class CafeFScraper(BaseScraper):
 
         Raises:
             RuntimeError: If WebDriver is not initialized
-            ValueError: If no report data is found for the symbol
+            ValueError: If no report data is found for the symbol, including
+                a page that loaded without report rows
+            TimeoutException: If the page did not become ready and has no
+                report data
         """
+        url = self.listing_url(symbol)
+
+        snapshot = self.load_snapshot(url)
+        if snapshot is not None:
+            logger.info("Using cached snapshot for symbol: %s", symbol)
+            if snapshot.content_type.startswith("application/json"):
+                return load_raw_reports(json.loads(snapshot.text))
+            return self.parse_listing(snapshot.text, symbol)
+
         if self.driver is None:
             raise RuntimeError(
                 "WebDriver not initialized. Call init_webdriver() first."
             )
 
-        url = self.BASE_URL_TEMPLATE.format(symbol=symbol.lower())
-
         logger.info("Scraping data for symbol: %s from %s", symbol, url)
 
-        self.get_page(url, wait_time=1.5)
-        html = self.get_page_source()
-        soup = BeautifulSoup(html, "lxml")
+        self.listing_state = None
+        ready = self.get_page(url)
+        if ready:
+            get_exchange_resolver().learn(symbol, self.driver.current_url)
+        if ready and self.listing_state == LISTING_EMPTY:
+            logger.error("No report rows found for symbol: %s", symbol)
+            raise ValueError(f"No report data found for symbol: {symbol}")
+        try:
+            if self.extraction == "script":
+                reports = self.extract_listing(symbol)
+                content = json.dumps(reports)
+                content_type = "application/json"
+            else:
+                content = self.get_page_source()
+                reports = self.parse_listing(content, symbol)
+                content_type = "text/html; charset=utf-8"
+        except ValueError as error:
+            if ready:
+                raise
+            # A missing table on a page that never became ready says
+            # nothing about the symbol, so report a (retryable) timeout
+            raise TimeoutException(
+                f"Listing for {symbol} not ready: {error}"
+            ) from error
+        self.save_snapshot(url, content, content_type)
+
+        logger.info("Scraped %d reports for symbol: %s", len(reports), symbol)
+
+        return reports
 
-        company_name_tag = soup.find("h1", class_="title-content-name")
-        company_name = company_name_tag.get_text(
-            strip=True
-        ).lower() if company_name_tag else None
+    def extract_listing(self, symbol: str) -> List[RawReport]:
+        """Extract report rows inside the loaded page.
 
+        Runs ``EXTRACT_SCRIPT`` in the browser so only the rows travel over
+        the WebDriver protocol, then shapes them like ``parse_listing``.
+
+        Args:
+            symbol (str): Stock symbol of the loaded page
+
+        Returns:
+            List[RawReport]: One record per report row
+
+        Raises:
+            ValueError: If no report table is found on the page
+        """
+        if self.driver is None:
+            raise RuntimeError(
+                "WebDriver not initialized. Call init_webdriver() first."
+            )
+
+        data = self.driver.execute_script(self.EXTRACT_SCRIPT)
+        if not data:
+            logger.error("No report table found for symbol: %s", symbol)
+            raise ValueError(f"No report data found for symbol: {symbol}")
+
+        company_name = data.get("company")
+        if company_name is not None:
+            company_name = company_name.lower()
         if not company_name:
             logger.warning(
-                "Could not find company name for symbol: %s",
-                symbol
+                "Could not find company name for symbol: %s", symbol
             )
 
-        report_table = soup.find(
-            "tbody", class_="render_dataBCTC"
-        )
+        return build_reports(symbol, company_name, data.get("rows") or [])
 
-        if not report_table:
-            logger.error("No report table found for symbol: %s", symbol)
-            raise ValueError(f"No report data found for symbol: {symbol}")
+    def fetch_listing_http(
+        self, symbol: str, client: Optional[HttpClient] = None
+    ) -> Optional[List[RawReport]]:
+        """Fetch and parse the report listing without a browser.
 
-        rows = report_table.find_all("tr")
-        reports = []
+        The listing page is requested over plain HTTP and parsed directly.
+        The result is None whenever the browser path is still needed: the
+        request failed, a bot challenge was served, or the report table is
+        missing or empty because it is rendered client-side.
 
-        for row in rows:
-            try:
-                report_name_tag = row.find("td", class_="BCTC_body_type")
-                report_name = report_name_tag.get_text(
-                    strip=True
-                ).lower() if report_name_tag else None
-
-                report_time_tag = row.find("td", class_="BCTC_body_dateTime")
-                report_time = report_time_tag.get_text(
-                    strip=True
-                ).lower() if report_time_tag else None
-
-                download_tag = row.find("td", class_="BCTC_body_download")
-                link_tag = download_tag.find("a") if download_tag else None
-                report_url = (
-                    link_tag["href"]
-                    if link_tag and "href" in link_tag.attrs
-                    else None
-                )
-
-                if isinstance(report_url, str) and report_url.startswith("//"):
-                    report_url = f"https:{report_url}"
-
-                report = {
-                    "symbol": symbol.lower(),
-                    "company_name": company_name,
-                    "report_time": report_time,
-                    "report_name": report_name,
-                    "report_url": report_url
-                }
-
-                reports.append(report)
-
-            except Exception as error:
-                logger.warning(
-                    "Error parsing row for symbol %s: %s", symbol, error
-                )
-                continue
+        The request goes through the CafeF circuit breaker like browser
+        loads do: failed requests, 5xx and 429 statuses count as failures,
+        any other answer counts as a success. A client error such as 404
+        means the listing does not exist, so the symbol is added to the
+        no-data cache (403 is left to the browser, as it is how bot blocks
+        are usually served). The exchange CafeF redirects the listing to
+        is learned from the final URL, as after a browser load. A fresh
+        copy served by the HTTP cache involves no request: it is used even
+        while the circuit is open and is not counted by the breaker.
 
-        logger.info("Scraped %d reports for symbol: %s", len(reports), symbol)
+        Args:
+            symbol (str): Stock symbol to scrape (e.g., 'FPT')
+            client (HttpClient, optional): HTTP client to use.
+                Defaults to the shared process-wide client.
+
+        Returns:
+            List[RawReport] or None: Reports in the same format as
+            ``scrape_symbol``, or None if the page must be rendered
 
+        Raises:
+            CircuitOpenError: If scraping of CafeF is paused after errors
+        """
+        client = client or get_http_client()
+        url = self.listing_url(symbol)
+        breaker = cafef_breaker()
+
+        logger.info("Fetching listing for %s over HTTP: %s", symbol, url)
+
+        requested: List[bool] = []
+
+        def before_request() -> None:
+            breaker.before_call()
+            requested.append(True)
+
+        try:
+            page = client.get_page(url, before_request=before_request)
+        except requests.RequestException as error:
+            breaker.record_failure()
+            logger.warning("HTTP fetch failed for %s: %s", symbol, error)
+            return None
+        except Exception:
+            if requested:
+                breaker.release_trial()
+            raise
+        html = page.text
+
+        # A fresh cached copy involved no call to CafeF, so it says
+        # nothing about the host's health
+        if not page.cached:
+            status = page.status
+            if html is None:
+                if status is None or status >= 500 or status == 429:
+                    breaker.record_failure()
+                    return None
+                breaker.record_success()
+                if 400 <= status < 500 and status != 403:
+                    logger.info(
+                        "Listing for %s returned status %s", symbol, status
+                    )
+                    get_no_data_cache().add(
+                        symbol, f"HTTP {status} for {url}"
+                    )
+                return None
+            breaker.record_success()
+            get_exchange_resolver().learn(symbol, page.url)
+
+        if not html:
+            return None
+
+        if self.is_challenge_page(html):
+            logger.info("Challenge page served for %s over HTTP", symbol)
+            client.forget(url)
+            return None
+
+        try:
+            reports = self.parse_listing(html, symbol)
+        except ValueError:
+            return None
+
+        if not reports:
+            return None
+
+        logger.info(
+            "Fetched %d reports for symbol %s over HTTP", len(reports), symbol
+        )
         return reports
 
+    @staticmethod
+    def listing_url(symbol: str) -> str:
+        """Get the listing URL of a symbol on the exchange it trades on.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            str: Listing URL
+        """
+        return get_exchange_resolver().listing_url(symbol)
+
+    @staticmethod
+    def is_challenge_page(html: str) -> bool:
+        """Detect anti-bot challenge or block pages.
+
+        Args:
+            html (str): Page HTML
+
+        Returns:
+            bool: True if the page looks like a challenge instead of content
+        """
+        head = html[:20000].lower()
+        return any(marker in head for marker in CHALLENGE_MARKERS)
+
+    @staticmethod
+    def parse_listing(html: str, symbol: str) -> List[RawReport]:
+        """Parse report rows from a CafeF listing page.
+
+        Args:
+            html (str): Page HTML
+            symbol (str): Stock symbol the page belongs to
+
+        Returns:
+            List[RawReport]: One record per report row
+
+        Raises:
+            ValueError: If no report table is found on the page
+        """
+        return parse_report_listing(html, symbol)
+
     def scrape_multiple_symbols(
         self, symbols: List[str]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> Dict[str, List[RawReport]]:
         """Scrape financial report data for multiple stock symbols.
 
         Args:
             symbols (List[str]): List of stock symbols to scrape
 
         Returns:
-            Dict[str, List[Dict[str, Any]]]: Dictionary mapping symbols to
+            Dict[str, List[RawReport]]: Dictionary mapping symbols to
             their reports
         """
         results = {}
+        no_data = get_no_data_cache()
+        resolver = get_exchange_resolver()
 
         for symbol in symbols:
             try:
+                no_data.check(symbol)
+                resolver.check(symbol)
                 reports = self.scrape_symbol(symbol)
                 results[symbol] = reports
+            except ValueError as e:
+                logger.error("Failed to scrape symbol %s: %s", symbol, e)
+                if not isinstance(e, NoDataError):
+                    no_data.add(symbol, str(e))
+                results[symbol] = []
             except Exception as e:
                 logger.error("Failed to scrape symbol %s: %s", symbol, e)
                 results[symbol] = []
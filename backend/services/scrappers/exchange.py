@@ -0,0 +1,234 @@
+"""
+Symbol to exchange resolution for CafeF listing URLs.
+
+CafeF listing URLs contain the exchange a symbol trades on
+(``/du-lieu/<exchange>/<symbol>-bao-cao-tai-chinh.chn``) and redirect a
+listing requested under the wrong exchange to the right one. Symbols
+not seen yet are requested under ``DEFAULT_EXCHANGE``; the exchange is
+learned from the final URL of that listing fetch, over HTTP or in the
+browser, and cached persistently with a TTL. No request is made only to
+resolve a symbol.
+
+A listing whose final URL has no exchange was redirected off the listing
+pages: CafeF does not list the symbol. Such symbols are cached negatively
+for a shorter TTL and refused by ``check`` so bulk runs do not fetch them
+again.
+"""
+
+import logging
+import re
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from backend.core import settings
+from backend.services.cache import KeyValueStore, get_store
+from backend.services.scrappers.resilience import NoDataError
+
+logger = logging.getLogger(__name__)
+
+
+EXCHANGES = ("hose", "hnx", "upcom")
+DEFAULT_EXCHANGE = "hose"
+
+LISTING_URL_TEMPLATE = (
+    "{base_url}/du-lieu/{exchange}/{symbol}-bao-cao-tai-chinh.chn"
+)
+
+EXCHANGE_PATTERN = re.compile(
+    r"/du-lieu/(" + "|".join(EXCHANGES) + r")/", re.IGNORECASE
+)
+
+
+def exchange_from_url(url: Optional[str]) -> Optional[str]:
+    """Extract the exchange segment of a CafeF listing URL.
+
+    Args:
+        url (str): Listing URL
+
+    Returns:
+        str or None: Lowercase exchange, or None if the URL has none
+    """
+    if not url:
+        return None
+    match = EXCHANGE_PATTERN.search(url)
+    return match.group(1).lower() if match else None
+
+
+def is_cafef_url(url: str) -> bool:
+    """Check that a URL is on the configured CafeF host.
+
+    Args:
+        url (str): URL to check
+
+    Returns:
+        bool: True if the URL's host is the CAFEF_BASE_URL host
+    """
+    host = urlsplit(settings.CAFEF_BASE_URL).hostname
+    return host is not None and urlsplit(url).hostname == host
+
+
+class ExchangeResolver:
+    """Cached symbol to exchange resolution."""
+
+    def __init__(
+        self,
+        store: Optional[KeyValueStore] = None,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None
+    ):
+        """Initialize the resolver.
+
+        Args:
+            store (KeyValueStore, optional): Backing store. Defaults to the
+                shared 'exchange_resolution' namespace.
+            ttl (float, optional): Seconds a learned exchange is trusted.
+                Defaults to the SCRAPER_EXCHANGE_TTL setting.
+            negative_ttl (float, optional): Seconds an unresolved symbol is
+                refused. Defaults to SCRAPER_EXCHANGE_NEGATIVE_TTL.
+        """
+        self.store = store or get_store("exchange_resolution")
+        self.ttl = ttl or settings.SCRAPER_EXCHANGE_TTL
+        self.negative_ttl = (
+            negative_ttl or settings.SCRAPER_EXCHANGE_NEGATIVE_TTL
+        )
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "learned": 0,
+            "unresolved": 0,
+        }
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def listing_url(self, symbol: str) -> str:
+        """Build the listing URL of a symbol on its exchange.
+
+        Symbols whose exchange is not learned yet use
+        ``DEFAULT_EXCHANGE``; CafeF redirects them to the right one.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            str: Listing URL
+        """
+        exchange = self.resolve(symbol) or DEFAULT_EXCHANGE
+        return LISTING_URL_TEMPLATE.format(
+            base_url=settings.CAFEF_BASE_URL.rstrip("/"),
+            exchange=exchange,
+            symbol=symbol.lower()
+        )
+
+    def resolve(self, symbol: str) -> Optional[str]:
+        """Get the cached exchange of a symbol.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            str or None: Exchange, or None if it has not been learned or
+            the symbol is cached as unresolved
+        """
+        found, exchange = self.store.lookup(symbol.lower())
+        if not found:
+            self._count("misses")
+        else:
+            self._count("hits" if exchange else "negative_hits")
+        return exchange
+
+    def check(self, symbol: str) -> None:
+        """Refuse a symbol whose listing recently resolved to no exchange.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Raises:
+            NoDataError: If the symbol is cached as unresolved
+        """
+        found, exchange = self.store.lookup(symbol.lower())
+        if found and exchange is None:
+            self._count("negative_hits")
+            raise NoDataError(
+                f"No report data found for symbol: {symbol} "
+                "(no exchange lists it)"
+            )
+
+    def learn(self, symbol: str, url: Optional[str]) -> None:
+        """Record the exchange seen in the final URL of a page load.
+
+        Used after every listing fetch, where CafeF's redirect to the
+        correct exchange shows up in the final URL. A final CafeF URL
+        without an exchange caches the symbol as unresolved.
+
+        Args:
+            symbol (str): Stock symbol
+            url (str): Final URL of the loaded listing, or None if no
+                request was made (nothing is learned then)
+        """
+        if not url:
+            return
+
+        key = symbol.lower()
+        exchange = exchange_from_url(url)
+        if not exchange:
+            if not is_cafef_url(url):
+                # e.g. about:blank after a failed navigation
+                return
+            self.store.set(key, None, ttl=self.negative_ttl)
+            self._count("unresolved")
+            logger.info("No exchange lists %s (served %s)", symbol, url)
+            return
+
+        if self.store.get(key) != exchange:
+            self.store.set(key, exchange, ttl=self.ttl)
+            self._count("learned")
+            logger.info("Learned exchange %s for %s", exchange, symbol)
+
+    def invalidate(self, symbol: str) -> None:
+        """Forget the cached exchange of a symbol.
+
+        Args:
+            symbol (str): Stock symbol
+        """
+        self.store.delete(symbol.lower())
+
+    def stats(self) -> Dict[str, int]:
+        """Return resolution counters.
+
+        Returns:
+            Dict[str, int]: Cache hits, negative hits, misses, learned and
+            unresolved entries
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+_resolver: Optional[ExchangeResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_exchange_resolver() -> ExchangeResolver:
+    """Get or create the process-wide exchange resolver.
+
+    Returns:
+        ExchangeResolver: Shared resolver instance
+    """
+    global _resolver
+
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = ExchangeResolver()
+        return _resolver
+
+
+def exchange_stats() -> Dict[str, int]:
+    """Return counters of the process-wide exchange resolver.
+
+    Returns:
+        Dict[str, int]: Resolution counters
+    """
+    return get_exchange_resolver().stats()
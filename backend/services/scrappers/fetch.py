@@ -0,0 +1,107 @@
+"""
+Report listing fetch strategies.
+
+This module decides how a symbol's report listing is retrieved:
+- ``http``: plain HTTP fetch and parse, no browser
+- ``browser``: full Selenium render through the WebDriver pool
+- ``auto``: HTTP first, falling back to the browser when needed
+
+HTTP fetches and browser loads are guarded by the CafeF host's circuit
+breaker, and browser loads are retried with backoff on transient
+WebDriver errors. Symbols whose listing loads without report rows, or
+is answered with a client error over HTTP, are cached negatively and
+refused without a browser until the cache entry expires. So are symbols
+whose listing was redirected to a page of no exchange.
+"""
+
+import logging
+from typing import List, Tuple
+from selenium.common.exceptions import WebDriverException
+from backend.services.scrappers.cafef import CafeFScraper
+from backend.services.scrappers.exchange import get_exchange_resolver
+from backend.services.scrappers.pool import get_driver_pool
+from backend.services.scrappers.resilience import (
+    cafef_breaker,
+    get_no_data_cache,
+    retry_call
+)
+from backend.services.records import RawReport
+
+logger = logging.getLogger(__name__)
+
+
+FETCH_MODES = ("auto", "http", "browser")
+
+SOURCE_HTTP = "http"
+SOURCE_BROWSER = "browser"
+
+# Browser failures worth another attempt on a fresh pooled driver
+TRANSIENT_ERRORS = (WebDriverException,)
+
+
+def fetch_reports(
+    symbol: str,
+    fetch_mode: str = "auto",
+    headless: bool = True
+) -> Tuple[List[RawReport], str]:
+    """Fetch raw report rows for a symbol using the requested strategy.
+
+    Args:
+        symbol (str): Stock symbol to scrape
+        fetch_mode (str): One of 'auto', 'http' or 'browser'
+        headless (bool): Whether a fallback browser runs headless
+
+    Returns:
+        Tuple[List[RawReport], str]: Raw reports and the path that
+        served them ('http' or 'browser')
+
+    Raises:
+        ValueError: If the mode is unknown or no report data is found
+            (``NoDataError`` when the symbol is in the no-data cache or
+            cached as listed on no exchange)
+        CircuitOpenError: If scraping of CafeF is paused after errors
+        WebDriverException: If the browser keeps failing after retries
+    """
+    if fetch_mode not in FETCH_MODES:
+        raise ValueError(f"Unknown fetch mode: {fetch_mode}")
+
+    no_data = get_no_data_cache()
+    no_data.check(symbol)
+    resolver = get_exchange_resolver()
+    resolver.check(symbol)
+
+    if fetch_mode in ("auto", "http"):
+        reports = CafeFScraper().fetch_listing_http(symbol)
+        if reports is not None:
+            return reports, SOURCE_HTTP
+
+        # A 4xx listing was just cached as having no data, a listing
+        # served off the listing pages as unresolved
+        no_data.check(symbol)
+        resolver.check(symbol)
+
+        if fetch_mode == "http":
+            raise ValueError(
+                f"No report data found for symbol: {symbol} over HTTP"
+            )
+
+        logger.info("Falling back to browser for symbol: %s", symbol)
+
+    pool = get_driver_pool(headless=headless)
+
+    def scrape() -> List[RawReport]:
+        # A driver broken by the failure is recycled on release, so a
+        # retry leases a fresh one
+        with pool.lease() as scraper:
+            return scraper.scrape_symbol(symbol)
+
+    try:
+        reports = retry_call(
+            scrape, TRANSIENT_ERRORS, breaker=cafef_breaker()
+        )
+    except ValueError as error:
+        # The page rendered without a report table: delisted or mistyped
+        no_data.add(symbol, str(error))
+        raise
+
+    return reports, SOURCE_BROWSER
@@ -0,0 +1,209 @@
+"""
+Chrome process governor.
+
+Every browser started by a scraper carries a marker switch naming the
+Python process that owns it. This lets the governor:
+- Measure the process tree (chromedriver, Chrome and its helpers) and
+  resident memory of each driver
+- Force-kill a driver's tree when a normal quit fails or leaves
+  survivors behind
+- Reap browsers left by crashed scrapes: those whose owning process is
+  gone, and those of this process that no live scraper tracks any more
+
+Scrapers register the chromedriver process of each browser they start
+with ``track_driver`` and drop it on quit.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set
+import psutil
+
+logger = logging.getLogger(__name__)
+
+MARKER_SWITCH = "--hdl-scraper-owner"
+
+# Seconds a browser of this process may run before it is tracked, which
+# covers the time between Chrome starting and its scraper registering it
+ORPHAN_GRACE = 60.0
+
+_tracked: Set[int] = set()
+_tracked_lock = threading.Lock()
+
+
+def track_driver(pid: Optional[int]) -> None:
+    """Register the chromedriver process of a live scraper.
+
+    Args:
+        pid (int): chromedriver process ID
+    """
+    if pid is not None:
+        with _tracked_lock:
+            _tracked.add(pid)
+
+
+def untrack_driver(pid: Optional[int]) -> None:
+    """Forget a chromedriver process once its scraper quits.
+
+    Args:
+        pid (int): chromedriver process ID
+    """
+    with _tracked_lock:
+        _tracked.discard(pid)
+
+
+def marker_argument() -> str:
+    """Chrome switch tagging a browser with the current process ID."""
+    return f"{MARKER_SWITCH}={os.getpid()}"
+
+
+def process_tree(pid: Optional[int]) -> List[psutil.Process]:
+    """Get a process and all of its descendants.
+
+    Args:
+        pid (int): Root process ID
+
+    Returns:
+        List[psutil.Process]: Live processes of the tree, root first
+    """
+    if pid is None:
+        return []
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def tree_memory(pid: Optional[int]) -> Dict[str, float]:
+    """Measure the resident memory of a process tree.
+
+    Args:
+        pid (int): Root process ID
+
+    Returns:
+        Dict[str, float]: ``rss_mb`` and ``processes`` of the tree
+    """
+    rss = 0
+    count = 0
+    for process in process_tree(pid):
+        try:
+            rss += process.memory_info().rss
+            count += 1
+        except psutil.Error:
+            continue
+    return {"rss_mb": round(rss / (1024 * 1024), 1), "processes": count}
+
+
+def kill_processes(
+    processes: List[psutil.Process],
+    timeout: float = 5.0
+) -> int:
+    """Terminate processes, killing those that do not exit in time.
+
+    Args:
+        processes (list): Processes to stop
+        timeout (float): Seconds to wait after terminating
+
+    Returns:
+        int: Number of processes that were still running
+    """
+    alive = []
+    for process in processes:
+        try:
+            if process.is_running():
+                process.terminate()
+                alive.append(process)
+        except psutil.Error:
+            continue
+
+    _, survivors = psutil.wait_procs(alive, timeout=timeout)
+    for process in survivors:
+        try:
+            process.kill()
+        except psutil.Error:
+            continue
+    psutil.wait_procs(survivors, timeout=timeout)
+    return len(alive)
+
+
+def kill_process_tree(pid: Optional[int], timeout: float = 5.0) -> int:
+    """Stop a process and all of its descendants.
+
+    Args:
+        pid (int): Root process ID
+        timeout (float): Seconds to wait after terminating
+
+    Returns:
+        int: Number of processes stopped
+    """
+    # Children first, so they are not re-parented while the root exits
+    return kill_processes(list(reversed(process_tree(pid))), timeout)
+
+
+def _owner_pid(cmdline: List[str]) -> Optional[int]:
+    """Owner process ID from a browser command line, if it has a marker."""
+    prefix = f"{MARKER_SWITCH}="
+    for argument in cmdline:
+        if argument.startswith(prefix):
+            try:
+                return int(argument[len(prefix):])
+            except ValueError:
+                return None
+    return None
+
+
+def _owner_alive(owner: int, process: psutil.Process) -> bool:
+    """Whether the owner still runs (and is not a reused process ID)."""
+    try:
+        return psutil.Process(owner).create_time() <= process.create_time()
+    except psutil.Error:
+        return False
+
+
+def _is_orphan(owner: int, process: psutil.Process) -> bool:
+    """Whether a marked browser is no longer owned by a live scraper."""
+    if owner != os.getpid():
+        return not _owner_alive(owner, process)
+
+    if time.time() - process.create_time() < ORPHAN_GRACE:
+        return False
+    with _tracked_lock:
+        tracked = set(_tracked)
+    return not any(parent.pid in tracked for parent in process.parents())
+
+
+def reap_orphans() -> int:
+    """Kill marked browsers no live scraper owns any more.
+
+    These are browsers whose owning process no longer exists, and
+    browsers of this process whose chromedriver is not tracked by a
+    scraper (its scrape crashed without quitting, or chromedriver died).
+    The chromedriver parent of a reaped browser is stopped as well.
+
+    Returns:
+        int: Number of processes stopped
+    """
+    doomed: Dict[int, psutil.Process] = {}
+    for process in psutil.process_iter(["pid", "cmdline"]):
+        try:
+            owner = _owner_pid(process.info["cmdline"] or [])
+            if owner is None or not _is_orphan(owner, process):
+                continue
+
+            for member in [process] + process.children(recursive=True):
+                doomed[member.pid] = member
+            parent = process.parent()
+            if parent is not None and "chromedriver" in parent.name():
+                doomed[parent.pid] = parent
+        except psutil.Error:
+            continue
+
+    if not doomed:
+        return 0
+
+    stopped = kill_processes(list(doomed.values()))
+    logger.warning("Reaped %d orphaned browser process(es)", stopped)
+    return stopped
@@ -0,0 +1,215 @@
+"""
+Pooled HTTP client for browser-less page fetches.
+
+This module provides a shared ``requests`` session with connection pooling
+and retry handling, used when a page can be read without running Chrome.
+Pages are read through the on-disk HTTP cache when it is enabled.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from backend.core import settings
+from backend.services.cache import HttpCache, get_http_cache
+from backend.services.scrappers.throttle import throttle
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+    ),
+    "Accept-Language": "vi-VN,vi;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+class Page(NamedTuple):
+    """A page read through ``HttpClient.get_page``."""
+    text: Optional[str]
+    url: Optional[str]
+    status: Optional[int]
+    cached: bool
+
+
+class HttpClient:
+    """Thin wrapper around a pooled ``requests.Session``."""
+
+    def __init__(
+        self,
+        pool_size: int = 16,
+        timeout: float = 15.0,
+        retries: int = 2,
+        headers: Optional[Dict[str, str]] = None,
+        cache: Optional[HttpCache] = None
+    ):
+        """Initialize the client.
+
+        Args:
+            pool_size (int): Connections kept alive per host
+            timeout (float): Request timeout in seconds
+            retries (int): Retries for connection errors and 5xx responses
+            headers (dict, optional): Default request headers
+            cache (HttpCache, optional): Response cache. Defaults to the
+                shared on-disk cache (None when it is disabled).
+        """
+        self.timeout = timeout
+        self.cache = cache if cache is not None else get_http_cache()
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request through the pooled session.
+
+        Args:
+            url (str): URL to fetch
+            **kwargs: Extra arguments passed to ``requests.Session.get``
+
+        Returns:
+            requests.Response: The response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        throttle(url)
+        logger.debug("HTTP GET %s", url)
+        return self.session.get(url, **kwargs)
+
+    def _fetch(
+        self, url: str, headers: Dict[str, str]
+    ) -> requests.Response:
+        """GET used by the cache, with the text encoding resolved."""
+        response = self.get(url, headers=headers)
+        if response.encoding is None or response.encoding == "ISO-8859-1":
+            response.encoding = response.apparent_encoding
+        return response
+
+    def get_page(
+        self,
+        url: str,
+        ttl: Optional[float] = None,
+        before_request: Optional[Callable[[], None]] = None
+    ) -> Page:
+        """Fetch a page and return its decoded body, final URL and status.
+
+        Args:
+            url (str): URL to fetch
+            ttl (float, optional): Seconds a cached copy stays fresh.
+                Defaults to the HTTP_CACHE_PAGE_TTL setting.
+            before_request (Callable, optional): Called right before a
+                request is sent, not when the cache serves the page.
+                An exception it raises aborts the fetch.
+
+        Returns:
+            Page: Response body, or None on a non-200 status; the URL the
+            body was served from after redirects; the HTTP status; and
+            whether the page came from the cache without a request, in
+            which case URL and status are None.
+        """
+        served: List[requests.Response] = []
+
+        def fetch(url: str, headers: Dict[str, str]) -> requests.Response:
+            if before_request is not None:
+                before_request()
+            response = self._fetch(url, headers)
+            served.append(response)
+            return response
+
+        if self.cache is not None:
+            entry = self.cache.fetch(
+                url, fetch, ttl or settings.HTTP_CACHE_PAGE_TTL
+            )
+            if not served:
+                return Page(entry.text if entry else None, None, None, True)
+            response = served[-1]
+            if entry is None:
+                return Page(None, None, response.status_code, False)
+            return Page(entry.text, response.url, response.status_code, False)
+
+        response = fetch(url, {})
+        if response.status_code != 200:
+            logger.info(
+                "HTTP fetch of %s returned status %s",
+                url, response.status_code
+            )
+            return Page(None, None, response.status_code, False)
+        return Page(response.text, response.url, response.status_code, False)
+
+    def get_text(
+        self, url: str, ttl: Optional[float] = None
+    ) -> Optional[str]:
+        """Fetch a page and return its decoded body.
+
+        Args:
+            url (str): URL to fetch
+            ttl (float, optional): Seconds a cached copy stays fresh.
+                Defaults to the HTTP_CACHE_PAGE_TTL setting.
+
+        Returns:
+            str or None: Response body, or None on a non-200 status
+        """
+        return self.get_page(url, ttl).text
+
+    def forget(self, url: str) -> None:
+        """Drop a cached response, e.g. when it turned out to be unusable.
+
+        Args:
+            url (str): URL whose cached copy to drop
+        """
+        if self.cache is not None:
+            self.cache.delete(url)
+
+    def close(self) -> None:
+        """Close the underlying session and its connections."""
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get or create the process-wide HTTP client.
+
+    Returns:
+        HttpClient: Shared client instance
+    """
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def close_http_client() -> None:
+    """Close the process-wide HTTP client.
+
+    This should be called during application shutdown.
+    """
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,138 @@
+"""
+Targeted parsing of CafeF report listing pages.
+
+Instead of building a full BeautifulSoup tree and searching it repeatedly,
+the page is parsed once by lxml and only the company header and the report
+table are visited, with each row turned into a ``RawReport`` in one pass.
+"""
+
+import logging
+from typing import Iterable, List, Optional, Sequence
+from lxml import etree, html as lxml_html
+from backend.services.records import RawReport
+
+logger = logging.getLogger(__name__)
+
+
+def _has_class(name: str) -> str:
+    """Build an XPath predicate matching one CSS class token."""
+    return (
+        "contains(concat(' ', normalize-space(@class), ' '), "
+        f"' {name} ')"
+    )
+
+
+# Expressions are kept as strings and evaluated with ``element.xpath``:
+# compiled ``etree.XPath`` objects must not be shared between the threads
+# of the bulk scraping engine.
+COMPANY_NAME_XPATH = f"(//h1[{_has_class('title-content-name')}])[1]"
+REPORT_TABLE_XPATH = f"(//tbody[{_has_class('render_dataBCTC')}])[1]"
+ROW_XPATH = ".//tr"
+NAME_CELL_XPATH = f"(.//td[{_has_class('BCTC_body_type')}])[1]"
+TIME_CELL_XPATH = f"(.//td[{_has_class('BCTC_body_dateTime')}])[1]"
+LINK_XPATH = f"(.//td[{_has_class('BCTC_body_download')}])[1]//a[1]"
+
+
+def _text(element) -> str:
+    """Concatenate stripped text nodes, like BeautifulSoup's strip=True."""
+    return "".join(part.strip() for part in element.xpath(".//text()"))
+
+
+def _parse_document(html: str):
+    """Parse page HTML into an lxml tree, or None if it is empty."""
+    if not html or not html.strip():
+        return None
+
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # Unicode input with an XML encoding declaration
+        return lxml_html.fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def build_reports(
+    symbol: str,
+    company_name: Optional[str],
+    rows: Iterable[Sequence[Optional[str]]]
+) -> List[RawReport]:
+    """Build raw reports from extracted (name, time, href) rows.
+
+    This is the single place that shapes scraped rows, shared by the HTML
+    parser and the in-browser extraction script.
+
+    Args:
+        symbol (str): Stock symbol the rows belong to
+        company_name (str, optional): Lowercased company name
+        rows (Iterable[Sequence]): Report name, report time and download
+            href of each row, as found on the page (not lowercased)
+
+    Returns:
+        List[RawReport]: One record per row
+    """
+    symbol_lower = symbol.lower()
+    reports = []
+
+    for report_name, report_time, report_url in rows:
+        if report_url is not None and report_url.startswith("//"):
+            report_url = f"https:{report_url}"
+
+        reports.append(RawReport._make((
+            symbol_lower,
+            company_name,
+            report_time.lower() if report_time is not None else None,
+            report_name.lower() if report_name is not None else None,
+            report_url
+        )))
+
+    return reports
+
+
+def _cell_text(xpath: str, element) -> Optional[str]:
+    """Text of the first match of ``xpath``, or None."""
+    matches = element.xpath(xpath)
+    return _text(matches[0]) if matches else None
+
+
+def _iter_rows(table):
+    """Yield (name, time, href) of every row of the report table."""
+    for row in table.xpath(ROW_XPATH):
+        links = row.xpath(LINK_XPATH)
+        yield (
+            _cell_text(NAME_CELL_XPATH, row),
+            _cell_text(TIME_CELL_XPATH, row),
+            links[0].get("href") if links else None
+        )
+
+
+def parse_report_listing(html: str, symbol: str) -> List[RawReport]:
+    """Extract report rows from a CafeF listing page.
+
+    Args:
+        html (str): Page HTML
+        symbol (str): Stock symbol the page belongs to
+
+    Returns:
+        List[RawReport]: One record per row of the report table
+
+    Raises:
+        ValueError: If no report table is found on the page
+    """
+    document = _parse_document(html)
+    if document is None:
+        logger.error("Empty page for symbol: %s", symbol)
+        raise ValueError(f"No report data found for symbol: {symbol}")
+
+    company_name = _cell_text(COMPANY_NAME_XPATH, document)
+    if company_name is not None:
+        company_name = company_name.lower()
+    if not company_name:
+        logger.warning("Could not find company name for symbol: %s", symbol)
+
+    tables = document.xpath(REPORT_TABLE_XPATH)
+    if not tables:
+        logger.error("No report table found for symbol: %s", symbol)
+        raise ValueError(f"No report data found for symbol: {symbol}")
+
+    return build_reports(symbol, company_name, _iter_rows(tables[0]))
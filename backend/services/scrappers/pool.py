@@ -0,0 +1,347 @@
+"""
+Process-wide pool of warm WebDriver instances.
+
+Starting Chrome costs several seconds, so scrapers are kept alive between
+requests and leased out through a context manager. The pool:
+- Bounds the number of live browsers
+- Health-checks an instance before handing it out
+- Recycles instances after a page budget, maximum age or once the
+  browser's process tree exceeds a memory limit, reaping orphaned
+  browsers after each recycle
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set
+)
+from backend.core import settings
+from backend.services.scrappers.base import BaseScraper
+from backend.services.scrappers.cafef import CafeFScraper
+from backend.services.scrappers.governor import reap_orphans
+
+logger = logging.getLogger(__name__)
+
+
+class WebDriverPool:
+    """Bounded pool of initialized scrapers.
+
+    Instances are created lazily up to ``size`` and returned to the pool
+    after each lease. Idle instances are handed out most-recently-used
+    first so the warmest browser serves the next request.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], BaseScraper],
+        size: int = 2,
+        max_pages: int = 100,
+        max_age: float = 1800.0,
+        lease_timeout: float = 120.0,
+        max_rss_mb: float = 1024.0
+    ):
+        """Initialize the pool.
+
+        Args:
+            factory (Callable): Builds a new, not yet initialized scraper
+            size (int): Maximum number of live instances
+            max_pages (int): Pages an instance may load before recycling
+            max_age (float): Seconds an instance may live before recycling
+            lease_timeout (float): Seconds to wait for a free instance
+            max_rss_mb (float): Resident memory of an instance's process
+                tree, in MiB, above which it is recycled
+        """
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self.lease_timeout = lease_timeout
+        self.max_rss_mb = max_rss_mb
+
+        self._idle: Deque[BaseScraper] = deque()
+        self._live: Set[BaseScraper] = set()
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {
+            "created": 0,
+            "recycled": 0,
+            "recycled_memory": 0,
+            "leases": 0,
+        }
+
+    def _is_expired(self, scraper: BaseScraper) -> bool:
+        """Check whether an instance has used up its page or age budget."""
+        return (
+            scraper.pages_loaded >= self.max_pages
+            or scraper.age >= self.max_age
+        )
+
+    def _is_oversized(self, scraper: BaseScraper) -> bool:
+        """Check whether an instance's browser exceeds the memory limit."""
+        rss_mb = scraper.memory_usage()["rss_mb"]
+        if rss_mb <= self.max_rss_mb:
+            return False
+
+        logger.info(
+            "Recycling WebDriver using %.0f MiB (limit %.0f MiB)",
+            rss_mb, self.max_rss_mb
+        )
+        with self._cond:
+            self._stats["recycled_memory"] += 1
+        return True
+
+    def _discard(self, scraper: BaseScraper) -> None:
+        """Quit an instance, free its slot and reap orphaned browsers."""
+        scraper.quit()
+        with self._cond:
+            self._live.discard(scraper)
+            self._total -= 1
+            self._stats["recycled"] += 1
+            self._cond.notify()
+
+        # Recycles are rare and often follow a crashed browser, so this
+        # is where browsers abandoned by failed scrapes are cleaned up
+        reap_orphans()
+
+    def _create(self) -> BaseScraper:
+        """Start a new instance for a slot already reserved by the caller."""
+        try:
+            scraper = self.factory()
+            scraper.init_webdriver()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._stats["created"] += 1
+            self._live.add(scraper)
+        return scraper
+
+    def _acquire(self, timeout: float) -> BaseScraper:
+        """Take an idle healthy instance or start a new one.
+
+        Raises:
+            TimeoutError: If no instance becomes available in time
+            RuntimeError: If the pool has been closed
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            candidate: Optional[BaseScraper] = None
+            reserve = False
+
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("WebDriver pool is closed")
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        break
+                    if self._total < self.size:
+                        self._total += 1
+                        reserve = True
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            "Timed out waiting for a free WebDriver"
+                        )
+                    self._cond.wait(remaining)
+
+            if reserve:
+                return self._create()
+
+            if candidate is not None:
+                if not self._is_expired(candidate) and candidate.is_alive():
+                    return candidate
+                logger.info("Recycling pooled WebDriver before lease")
+                self._discard(candidate)
+
+    def _release(self, scraper: BaseScraper) -> None:
+        """Return an instance to the pool or recycle it."""
+        with self._cond:
+            closed = self._closed
+
+        if (
+            closed
+            or self._is_expired(scraper)
+            or not scraper.is_alive()
+            or self._is_oversized(scraper)
+        ):
+            self._discard(scraper)
+            return
+
+        with self._cond:
+            self._idle.append(scraper)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[BaseScraper]:
+        """Lease a ready-to-use scraper for the duration of a block.
+
+        Usage:
+            with pool.lease() as scraper:
+                scraper.scrape_symbol("FPT")
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free instance.
+                Defaults to the pool's lease timeout.
+
+        Yields:
+            BaseScraper: Initialized scraper owned by the caller until exit
+        """
+        scraper = self._acquire(
+            self.lease_timeout if timeout is None else timeout
+        )
+        with self._cond:
+            self._stats["leases"] += 1
+
+        try:
+            yield scraper
+        finally:
+            self._release(scraper)
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """Start idle instances ahead of the first lease.
+
+        Args:
+            count (int, optional): Number of instances to start.
+                Defaults to the pool size.
+
+        Returns:
+            int: Number of instances started
+        """
+        target = self.size if count is None else min(count, self.size)
+        started: List[BaseScraper] = []
+
+        for _ in range(target):
+            with self._cond:
+                if self._total >= self.size:
+                    break
+                self._total += 1
+            try:
+                started.append(self._create())
+            except Exception as error:
+                logger.error("Failed to warm up WebDriver: %s", error)
+                break
+
+        for scraper in started:
+            self._release(scraper)
+
+        logger.info("Warmed up %d WebDriver instance(s)", len(started))
+        return len(started)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool counters and per-driver resource usage.
+
+        Returns:
+            Dict[str, Any]: Sizes and lifetime counters of the pool, and
+            the memory, page count and age of every live driver
+        """
+        with self._cond:
+            stats: Dict[str, Any] = {
+                "size": self.size,
+                "live": self._total,
+                "idle": len(self._idle),
+                **self._stats,
+            }
+            live = list(self._live)
+
+        stats["drivers"] = [
+            {
+                "pid": scraper.driver_pid,
+                **scraper.memory_usage(),
+                "pages_loaded": scraper.pages_loaded,
+                "age": round(scraper.age, 1),
+            }
+            for scraper in live
+        ]
+        return stats
+
+    def close(self) -> None:
+        """Quit all idle instances and refuse new leases.
+
+        Leased instances are quit when they are returned.
+        """
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for scraper in idle:
+            self._discard(scraper)
+
+
+_pools: Dict[bool, WebDriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(headless: bool = True) -> WebDriverPool:
+    """Get or create the process-wide CafeF WebDriver pool.
+
+    Headless and headed browsers are kept in separate pools.
+
+    Args:
+        headless (bool): Whether pooled browsers run headless
+
+    Returns:
+        WebDriverPool: Shared pool for the given mode
+    """
+    with _pools_lock:
+        pool = _pools.get(headless)
+        if pool is None:
+            pool = WebDriverPool(
+                factory=lambda: CafeFScraper(
+                    headless=headless,
+                    lean=settings.SCRAPER_LEAN_PROFILE
+                ),
+                size=settings.SCRAPER_POOL_SIZE,
+                max_pages=settings.SCRAPER_MAX_PAGES,
+                max_age=settings.SCRAPER_MAX_AGE,
+                lease_timeout=settings.SCRAPER_LEASE_TIMEOUT,
+                max_rss_mb=settings.SCRAPER_MAX_RSS_MB
+            )
+            _pools[headless] = pool
+        return pool
+
+
+def driver_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Return counters of every WebDriver pool.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Pool statistics keyed by mode
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+    return {
+        "headless" if headless else "headed": pool.stats()
+        for headless, pool in pools.items()
+    }
+
+
+def close_driver_pools() -> None:
+    """Close all WebDriver pools.
+
+    This should be called during application shutdown.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close()
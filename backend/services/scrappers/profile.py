@@ -0,0 +1,358 @@
+"""
+Browsing profiles for the Selenium WebDriver.
+
+A profile decides what Chrome loads for each page:
+- ``full``: everything, as a regular browser would
+- ``lean``: eager page-load strategy, no images, and fonts, ad networks
+  and analytics blocked through Chrome DevTools
+
+Blocking works on URL patterns (``Network.setBlockedURLs``): blocking by
+resource type needs the DevTools Fetch domain, which pauses every
+request until the client answers an event, and Selenium's
+``execute_cdp_cmd`` cannot receive events. Fonts are matched by file
+extension and scripts by ad and analytics host; images are turned off in
+the renderer as well, so image URLs without an extension are not loaded.
+
+Profiles can also capture per-page network traffic from Chrome's
+performance log (``SCRAPER_CAPTURE_TRAFFIC``, off by default since the
+log costs browser memory and CPU). Savings need no full-profile page to
+compare with: every blocked request is counted by resource type from
+``Network.loadingFailed``, and the bytes it would have used are
+estimated from the average size of loaded responses of that type.
+Images the renderer never requests are not counted.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from selenium.webdriver.chrome.options import Options
+from backend.core import settings
+
+logger = logging.getLogger(__name__)
+
+
+IMAGE_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+)
+
+FONT_PATTERNS = (
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+)
+
+AD_PATTERNS = (
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googleadservices.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*admicro.vn*",
+    "*adnxs.com*",
+    "*adtima.vn*",
+    "*criteo.com*",
+    "*hotjar.com*",
+)
+
+
+class BrowsingProfile:
+    """What Chrome loads and whether its traffic is measured."""
+
+    def __init__(
+        self,
+        name: str,
+        page_load_strategy: str = "normal",
+        block_images: bool = False,
+        blocked_patterns: Sequence[str] = (),
+        disable_extras: bool = False,
+        capture_traffic: bool = False
+    ):
+        """Initialize the profile.
+
+        Args:
+            name (str): Profile name used in traffic statistics
+            page_load_strategy (str): 'normal', 'eager' or 'none'
+            block_images (bool): Disable image loading entirely
+            blocked_patterns (Sequence[str]): URL patterns blocked via
+                DevTools ``Network.setBlockedURLs``
+            disable_extras (bool): Start Chrome without extensions and
+                with audio muted
+            capture_traffic (bool): Record requests and bytes per page
+        """
+        self.name = name
+        self.page_load_strategy = page_load_strategy
+        self.block_images = block_images
+        self.blocked_patterns = list(blocked_patterns)
+        self.disable_extras = disable_extras
+        self.capture_traffic = capture_traffic
+
+    @classmethod
+    def full(
+        cls,
+        capture_traffic: Optional[bool] = None
+    ) -> "BrowsingProfile":
+        """Profile that loads pages like a regular browser.
+
+        Args:
+            capture_traffic (bool, optional): Record traffic per page.
+                Defaults to ``SCRAPER_CAPTURE_TRAFFIC``.
+        """
+        if capture_traffic is None:
+            capture_traffic = settings.SCRAPER_CAPTURE_TRAFFIC
+        return cls("full", capture_traffic=capture_traffic)
+
+    @classmethod
+    def lean(
+        cls,
+        block_images: bool = True,
+        capture_traffic: Optional[bool] = None
+    ) -> "BrowsingProfile":
+        """Profile that loads only what is needed to read page content.
+
+        Args:
+            block_images (bool): Also block images
+            capture_traffic (bool, optional): Record traffic per page.
+                Defaults to ``SCRAPER_CAPTURE_TRAFFIC``.
+        """
+        if capture_traffic is None:
+            capture_traffic = settings.SCRAPER_CAPTURE_TRAFFIC
+        patterns: List[str] = list(FONT_PATTERNS) + list(AD_PATTERNS)
+        if block_images:
+            patterns = list(IMAGE_PATTERNS) + patterns
+
+        return cls(
+            "lean",
+            page_load_strategy="eager",
+            block_images=block_images,
+            blocked_patterns=patterns,
+            disable_extras=True,
+            capture_traffic=capture_traffic
+        )
+
+    def apply_options(self, options: Options) -> None:
+        """Configure Chrome options before the browser starts.
+
+        Args:
+            options (Options): Chrome options being built
+        """
+        options.page_load_strategy = self.page_load_strategy
+
+        if self.block_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+            })
+
+        if self.disable_extras:
+            options.add_argument("--disable-extensions")
+            options.add_argument("--mute-audio")
+
+        if self.capture_traffic:
+            options.set_capability(
+                "goog:loggingPrefs", {"performance": "ALL"}
+            )
+
+    def apply_driver(self, driver) -> None:
+        """Configure DevTools request blocking once the browser runs.
+
+        Args:
+            driver (webdriver.Chrome): The started WebDriver
+        """
+        if not self.blocked_patterns:
+            return
+
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": self.blocked_patterns}
+        )
+        logger.debug(
+            "Blocking %d URL patterns (%s profile)",
+            len(self.blocked_patterns), self.name
+        )
+
+    def reset_traffic(self, driver) -> None:
+        """Drain the performance log so the next read covers one page.
+
+        Args:
+            driver (webdriver.Chrome): The active WebDriver
+        """
+        if self.capture_traffic:
+            try:
+                driver.get_log("performance")
+            except Exception as error:
+                logger.debug("Could not drain performance log: %s", error)
+
+    def read_traffic(self, driver) -> Optional[Dict[str, Any]]:
+        """Summarize network traffic since the last reset.
+
+        Args:
+            driver (webdriver.Chrome): The active WebDriver
+
+        Returns:
+            dict or None: Requests sent, bytes transferred, blocked
+            requests (in total and per resource type) and the requests
+            and estimated bytes the blocking saved; None if traffic is not
+            captured
+        """
+        if not self.capture_traffic:
+            return None
+
+        try:
+            entries = driver.get_log("performance")
+        except Exception as error:
+            logger.debug("Could not read performance log: %s", error)
+            return None
+
+        requests = 0
+        transferred = 0
+        types: Dict[str, str] = {}
+        loaded: Dict[str, List[int]] = {}
+        blocked_by_type: Dict[str, int] = {}
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+            if method == "Network.requestWillBeSent":
+                requests += 1
+                types[request_id] = params.get("type") or "Other"
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength", 0))
+                transferred += size
+                resource_type = types.get(request_id, "Other")
+                loaded.setdefault(resource_type, []).append(size)
+            elif (
+                method == "Network.loadingFailed"
+                and params.get("blockedReason")
+            ):
+                resource_type = (
+                    params.get("type") or types.get(request_id) or "Other"
+                )
+                blocked_by_type[resource_type] = (
+                    blocked_by_type.get(resource_type, 0) + 1
+                )
+
+        blocked = sum(blocked_by_type.values())
+        return {
+            "requests": requests - blocked,
+            "blocked_requests": blocked,
+            "blocked_by_type": blocked_by_type,
+            "bytes": transferred,
+            "requests_saved": blocked,
+            "bytes_saved": _traffic.record(
+                self.name, requests - blocked, transferred,
+                loaded, blocked_by_type
+            ),
+        }
+
+
+class TrafficStats:
+    """Running per-profile traffic totals and per-type response sizes."""
+
+    def __init__(self):
+        """Initialize empty totals."""
+        self._totals: Dict[str, Dict[str, Any]] = {}
+        # Resource type -> (loaded responses, their bytes), all profiles
+        self._sizes: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        profile: str,
+        requests: int,
+        transferred: int,
+        loaded: Dict[str, List[int]],
+        blocked_by_type: Dict[str, int]
+    ) -> Optional[int]:
+        """Add one page's traffic and estimate the bytes blocking saved.
+
+        Sizes of the page's loaded responses update the per-type averages
+        first, so a type blocked by pattern but also served by the page
+        itself (first-party scripts, say) is estimated from those.
+
+        Args:
+            profile (str): Profile name
+            requests (int): Requests the page sent (not blocked)
+            transferred (int): Bytes the page transferred
+            loaded (dict): Sizes of loaded responses per resource type
+            blocked_by_type (dict): Blocked requests per resource type
+
+        Returns:
+            int or None: Estimated bytes of the blocked requests, None if
+            requests were blocked but no response of their types has
+            been measured yet
+        """
+        with self._lock:
+            for resource_type, sizes in loaded.items():
+                count, total = self._sizes.get(resource_type, (0, 0))
+                self._sizes[resource_type] = (
+                    count + len(sizes), total + sum(sizes)
+                )
+
+            saved: Optional[int] = 0
+            for resource_type, blocked in blocked_by_type.items():
+                count, total = self._sizes.get(resource_type, (0, 0))
+                if not count:
+                    saved = None
+                    break
+                saved += blocked * total // count
+
+            totals = self._totals.setdefault(profile, {
+                "pages": 0,
+                "requests": 0,
+                "bytes": 0,
+                "requests_saved": 0,
+                "bytes_saved": 0,
+                "estimated_pages": 0,
+                "blocked_by_type": {},
+            })
+            totals["pages"] += 1
+            totals["requests"] += requests
+            totals["bytes"] += transferred
+            for resource_type, blocked in blocked_by_type.items():
+                totals["requests_saved"] += blocked
+                totals["blocked_by_type"][resource_type] = (
+                    totals["blocked_by_type"].get(resource_type, 0) + blocked
+                )
+            if saved is not None:
+                totals["bytes_saved"] += saved
+                totals["estimated_pages"] += 1
+            return saved
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-profile totals and per-page averages.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by profile name
+        """
+        with self._lock:
+            result = {}
+            for profile, totals in self._totals.items():
+                pages = totals["pages"] or 1
+                estimated = totals["estimated_pages"] or 1
+                result[profile] = {
+                    **totals,
+                    "blocked_by_type": dict(totals["blocked_by_type"]),
+                    "avg_requests": totals["requests"] // pages,
+                    "avg_bytes": totals["bytes"] // pages,
+                    "avg_requests_saved": totals["requests_saved"] // pages,
+                    "avg_bytes_saved": totals["bytes_saved"] // estimated,
+                }
+            return result
+
+
+_traffic = TrafficStats()
+
+
+def traffic_stats() -> Dict[str, Dict[str, Any]]:
+    """Return per-profile traffic statistics.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Statistics keyed by profile name
+    """
+    return _traffic.stats()
@@ -0,0 +1,134 @@
+"""
+Adaptive page readiness timeouts.
+
+Scrapers poll a readiness predicate instead of sleeping a fixed time. The
+tracker here records how long pages actually took to become ready and
+derives the next timeout from a smoothed mean and deviation, similar to
+TCP retransmission timers: fast sites get short timeouts, slow sites get
+more headroom.
+"""
+
+import threading
+from typing import Dict
+
+
+class ReadinessTracker:
+    """Smoothed statistics of page-ready times."""
+
+    def __init__(
+        self,
+        initial_timeout: float = 10.0,
+        min_timeout: float = 3.0,
+        max_timeout: float = 30.0,
+        alpha: float = 0.125,
+        beta: float = 0.25
+    ):
+        """Initialize the tracker.
+
+        Args:
+            initial_timeout (float): Timeout used before any sample exists
+            min_timeout (float): Lower bound of the adaptive timeout
+            max_timeout (float): Upper bound of the adaptive timeout
+            alpha (float): Smoothing factor of the mean
+            beta (float): Smoothing factor of the deviation
+        """
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.alpha = alpha
+        self.beta = beta
+
+        self._mean = None
+        self._deviation = 0.0
+        self._lock = threading.Lock()
+        self._stats = {
+            "samples": 0,
+            "timeouts": 0,
+            "last": 0.0,
+            "max": 0.0,
+        }
+
+    def timeout(self) -> float:
+        """Return the timeout to use for the next page.
+
+        Returns:
+            float: Seconds to wait for readiness
+        """
+        with self._lock:
+            if self._mean is None:
+                return self.initial_timeout
+            estimate = self._mean + 4 * self._deviation
+        return max(self.min_timeout, min(self.max_timeout, estimate))
+
+    def record(self, elapsed: float, timed_out: bool = False) -> None:
+        """Record how long a page took to get ready.
+
+        Timed-out pages are counted but not folded into the mean, and the
+        next timeout is backed off instead so a slow streak gets headroom.
+
+        Args:
+            elapsed (float): Seconds from navigation to readiness
+            timed_out (bool): Whether the wait gave up before readiness
+        """
+        with self._lock:
+            self._stats["last"] = elapsed
+            self._stats["max"] = max(self._stats["max"], elapsed)
+
+            if timed_out:
+                self._stats["timeouts"] += 1
+                if self._mean is not None:
+                    self._deviation = max(self._deviation * 2, elapsed / 4)
+                return
+
+            self._stats["samples"] += 1
+            if self._mean is None:
+                self._mean = elapsed
+                self._deviation = elapsed / 2
+            else:
+                error = elapsed - self._mean
+                self._mean += self.alpha * error
+                self._deviation += self.beta * (abs(error) - self._deviation)
+
+    def stats(self) -> Dict[str, float]:
+        """Return readiness statistics.
+
+        Returns:
+            Dict[str, float]: Sample counts, mean and current timeout
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["mean"] = self._mean or 0.0
+        stats["timeout"] = self.timeout()
+        return stats
+
+
+_trackers: Dict[str, ReadinessTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_readiness_tracker(name: str) -> ReadinessTracker:
+    """Get or create the readiness tracker for a scraper.
+
+    Args:
+        name (str): Scraper name (usually the class name)
+
+    Returns:
+        ReadinessTracker: Shared tracker for that scraper
+    """
+    with _trackers_lock:
+        tracker = _trackers.get(name)
+        if tracker is None:
+            tracker = ReadinessTracker()
+            _trackers[name] = tracker
+        return tracker
+
+
+def readiness_stats() -> Dict[str, Dict[str, float]]:
+    """Return readiness statistics of every tracked scraper.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Statistics keyed by scraper name
+    """
+    with _trackers_lock:
+        trackers = dict(_trackers)
+    return {name: tracker.stats() for name, tracker in trackers.items()}
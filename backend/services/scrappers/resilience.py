@@ -0,0 +1,432 @@
+"""
+Failure handling for scraping a host.
+
+- ``NoDataCache``: remembers symbols whose listing has no report table
+  (delisted or mistyped tickers) for a TTL, so bulk runs stop paying a
+  full browser load for them
+- ``retry_call``: retries transient failures with exponential backoff and
+  jitter
+- ``CircuitBreaker``: stops sending requests to a host while its recent
+  error rate is too high, then lets a single trial request through after
+  a cool-down
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Type
+from urllib.parse import urlsplit
+from backend.core import settings
+from backend.services.cache import KeyValueStore, get_store
+
+logger = logging.getLogger(__name__)
+
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is refused because the host's circuit is open.
+
+    Attributes:
+        host (str): Host whose circuit is open
+        retry_after (float): Seconds until a trial request is allowed
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(
+            f"Scraping of {host} paused after repeated errors, "
+            f"retry in {retry_after:.1f}s"
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
+class NoDataError(ValueError):
+    """Raised for a symbol recently found to have no report data."""
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker for one host.
+
+    The breaker tracks the outcome of requests within a sliding time
+    window. Once at least ``min_calls`` outcomes are in the window and the
+    share of failures reaches ``error_rate``, the circuit opens and every
+    request is refused for ``cooldown`` seconds. The next request is then
+    let through as a trial (half-open): success closes the circuit,
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        error_rate: Optional[float] = None,
+        min_calls: Optional[int] = None,
+        window: Optional[float] = None,
+        cooldown: Optional[float] = None
+    ):
+        """Initialize the breaker.
+
+        Args:
+            host (str): Host name the breaker guards
+            error_rate (float, optional): Failure share that opens the
+                circuit. Defaults to SCRAPER_BREAKER_ERROR_RATE.
+            min_calls (int, optional): Outcomes needed in the window
+                before the circuit may open. Defaults to
+                SCRAPER_BREAKER_MIN_CALLS.
+            window (float, optional): Seconds of outcomes considered.
+                Defaults to SCRAPER_BREAKER_WINDOW.
+            cooldown (float, optional): Seconds the circuit stays open.
+                Defaults to SCRAPER_BREAKER_COOLDOWN.
+        """
+        self.host = host
+        self.error_rate = error_rate or settings.SCRAPER_BREAKER_ERROR_RATE
+        self.min_calls = min_calls or settings.SCRAPER_BREAKER_MIN_CALLS
+        self.window = window or settings.SCRAPER_BREAKER_WINDOW
+        self.cooldown = cooldown or settings.SCRAPER_BREAKER_COOLDOWN
+
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._stats = {
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+        }
+
+    def _prune(self, now: float) -> None:
+        """Drop outcomes older than the window."""
+        while self._outcomes and self._outcomes[0][0] < now - self.window:
+            self._outcomes.popleft()
+
+    def _open(self, now: float) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = now
+        self._trial_running = False
+        self._outcomes.clear()
+        self._stats["opened"] += 1
+
+    def before_call(self) -> None:
+        """Check that a request may be sent to the host.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                trial request still running
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return
+
+            now = time.monotonic()
+            remaining = self._opened_at + self.cooldown - now
+            if self._state == STATE_OPEN and remaining <= 0:
+                self._state = STATE_HALF_OPEN
+
+            if self._state == STATE_HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                logger.info("Circuit for %s half-open, trying", self.host)
+                return
+
+            self._stats["rejected"] += 1
+            raise CircuitOpenError(self.host, max(0.0, remaining))
+
+    def record_success(self) -> None:
+        """Record a request that reached the host and got a usable page."""
+        with self._lock:
+            self._stats["successes"] += 1
+            if self._state != STATE_CLOSED:
+                self._state = STATE_CLOSED
+                self._trial_running = False
+                self._outcomes.clear()
+                logger.info("Circuit for %s closed", self.host)
+                return
+
+            now = time.monotonic()
+            self._outcomes.append((now, True))
+            self._prune(now)
+
+    def record_failure(self) -> None:
+        """Record a request that failed for a transient reason."""
+        with self._lock:
+            self._stats["failures"] += 1
+            now = time.monotonic()
+
+            if self._state != STATE_CLOSED:
+                self._open(now)
+                logger.warning("Circuit for %s re-opened", self.host)
+                return
+
+            self._outcomes.append((now, False))
+            self._prune(now)
+
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            calls = len(self._outcomes)
+            if calls >= self.min_calls and failures / calls >= self.error_rate:
+                self._open(now)
+                logger.warning(
+                    "Circuit for %s opened: %d of %d requests failed",
+                    self.host, failures, calls
+                )
+
+    def release_trial(self) -> None:
+        """Let another trial through after one ended without an outcome."""
+        with self._lock:
+            self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            if (
+                self._state == STATE_OPEN
+                and time.monotonic() >= self._opened_at + self.cooldown
+            ):
+                return STATE_HALF_OPEN
+            return self._state
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the breaker state and counters.
+
+        Returns:
+            Dict[str, Any]: State, outcomes in the window, seconds until a
+            trial request and lifetime counters
+        """
+        state = self.state
+        with self._lock:
+            self._prune(time.monotonic())
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            retry_after = 0.0
+            if state == STATE_OPEN:
+                retry_after = max(
+                    0.0, self._opened_at + self.cooldown - time.monotonic()
+                )
+            return {
+                "state": state,
+                "window_calls": len(self._outcomes),
+                "window_failures": failures,
+                "retry_after_s": round(retry_after, 1),
+                **self._stats,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Get or create the circuit breaker of a host.
+
+    Args:
+        host (str): Host name (e.g., 'cafef.vn')
+
+    Returns:
+        CircuitBreaker: Shared breaker for the host
+    """
+    host = host.lower()
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host)
+            _breakers[host] = breaker
+        return breaker
+
+
+def cafef_breaker() -> CircuitBreaker:
+    """Circuit breaker of the configured CafeF host."""
+    return get_circuit_breaker(
+        urlsplit(settings.CAFEF_BASE_URL).hostname or ""
+    )
+
+
+_retry_stats = {"retries": 0, "exhausted": 0}
+_retry_lock = threading.Lock()
+
+
+def retry_call(
+    func: Callable[[], Any],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: Optional[int] = None,
+    backoff: Optional[float] = None,
+    breaker: Optional[CircuitBreaker] = None
+) -> Any:
+    """Call a function, retrying transient failures with backoff.
+
+    The n-th retry waits ``backoff * 2 ** (n - 1)`` seconds scaled by a
+    random jitter factor between 0.5 and 1.5, so concurrent workers do
+    not retry in lockstep. With a breaker, every attempt is checked
+    against and recorded in it, and retrying stops once it opens.
+    Non-transient errors are not recorded in the breaker.
+
+    Args:
+        func (Callable): Function to call without arguments
+        retry_on (tuple): Exception types considered transient
+        attempts (int, optional): Total attempts. Defaults to
+            SCRAPER_RETRY_ATTEMPTS.
+        backoff (float, optional): Base delay in seconds. Defaults to
+            SCRAPER_RETRY_BACKOFF.
+        breaker (CircuitBreaker, optional): Breaker of the target host
+
+    Returns:
+        Any: Result of the function
+
+    Raises:
+        CircuitOpenError: If the breaker refuses an attempt
+        Exception: The last transient error once attempts are exhausted,
+            or any non-transient error immediately
+    """
+    attempts = attempts or settings.SCRAPER_RETRY_ATTEMPTS
+    backoff = settings.SCRAPER_RETRY_BACKOFF if backoff is None else backoff
+
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = func()
+        except retry_on as error:
+            if breaker is not None:
+                breaker.record_failure()
+            if attempt >= attempts:
+                with _retry_lock:
+                    _retry_stats["exhausted"] += 1
+                raise
+
+            delay = backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+            logger.warning(
+                "Attempt %d/%d failed (%s), retrying in %.2fs",
+                attempt, attempts, error, delay
+            )
+            with _retry_lock:
+                _retry_stats["retries"] += 1
+            time.sleep(delay)
+            continue
+        except Exception:
+            if breaker is not None:
+                breaker.release_trial()
+            raise
+
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+class NoDataCache:
+    """Persistent negative cache of symbols without report data."""
+
+    def __init__(
+        self,
+        store: Optional[KeyValueStore] = None,
+        ttl: Optional[float] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            store (KeyValueStore, optional): Backing store. Defaults to the
+                shared 'no_data_symbols' namespace.
+            ttl (float, optional): Seconds a symbol stays cached. Defaults
+                to the SCRAPER_NO_DATA_TTL setting.
+        """
+        self.store = store or get_store("no_data_symbols")
+        self.ttl = ttl or settings.SCRAPER_NO_DATA_TTL
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "added": 0}
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def check(self, symbol: str) -> None:
+        """Refuse a symbol recently found to have no report data.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Raises:
+            NoDataError: If the symbol is cached
+        """
+        found, reason = self.store.lookup(symbol.upper())
+        if not found:
+            self._count("misses")
+            return
+
+        self._count("hits")
+        raise NoDataError(
+            f"No report data found for symbol: {symbol} "
+            f"(cached: {reason})"
+        )
+
+    def add(self, symbol: str, reason: str) -> None:
+        """Remember that a symbol has no report data.
+
+        Args:
+            symbol (str): Stock symbol
+            reason (str): Why the symbol has no data (the scrape error)
+        """
+        self.store.set(symbol.upper(), reason, ttl=self.ttl)
+        self._count("added")
+        logger.info("Cached %s as having no report data", symbol)
+
+    def invalidate(self, symbol: str) -> bool:
+        """Forget a symbol so the next scrape loads it again.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            bool: True if the symbol was cached
+        """
+        return self.store.delete(symbol.upper())
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses and added symbols
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+_no_data: Optional[NoDataCache] = None
+_no_data_lock = threading.Lock()
+
+
+def get_no_data_cache() -> NoDataCache:
+    """Get or create the process-wide no-data cache.
+
+    Returns:
+        NoDataCache: Shared cache instance
+    """
+    global _no_data
+
+    with _no_data_lock:
+        if _no_data is None:
+            _no_data = NoDataCache()
+        return _no_data
+
+
+def resilience_stats() -> Dict[str, Any]:
+    """Return breaker states, retry and no-data cache counters.
+
+    Returns:
+        Dict[str, Any]: Per-host breakers, retries and no-data cache
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    with _retry_lock:
+        retries = dict(_retry_stats)
+    return {
+        "breakers": {
+            host: breaker.stats() for host, breaker in breakers.items()
+        },
+        "retries": retries,
+        "no_data": get_no_data_cache().stats(),
+    }
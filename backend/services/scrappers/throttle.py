@@ -0,0 +1,93 @@
+"""
+Per-host request rate limiting.
+
+Every outgoing page request (browser or HTTP) passes through ``throttle``
+so that concurrent workers together stay under a per-host request rate.
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+from backend.core import settings
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Each request consumes one token and blocks until one is available.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the limiter.
+
+        Args:
+            rate (float): Sustained requests per second
+            burst (int): Maximum requests allowed back to back
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a request may be sent.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> RateLimiter:
+    """Get or create the rate limiter for a host.
+
+    Args:
+        host (str): Host name (e.g., 'cafef.vn')
+
+    Returns:
+        RateLimiter: Shared limiter for the host
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(
+                rate=settings.SCRAPER_HOST_RATE,
+                burst=settings.SCRAPER_HOST_BURST
+            )
+            _limiters[host] = limiter
+        return limiter
+
+
+def throttle(url: str) -> float:
+    """Wait for the rate limit of the URL's host.
+
+    Args:
+        url (str): URL about to be requested
+
+    Returns:
+        float: Seconds spent waiting
+    """
+    host = urlsplit(url).hostname or ""
+    return get_host_limiter(host.lower()).acquire()
@@ -0,0 +1,17 @@
+"""
+Performance benchmarks.
+
+Run from the project root (the ``.env`` file must be present because the
+backend package loads its settings on import), for example:
+
+    python -m benchmarks.parse_listing
+    python -m benchmarks.process_reports
+    python -m benchmarks.report_records
+    python -m benchmarks.validate_reports
+    python -m benchmarks.report_lookups
+    python -m benchmarks.report_pages
+    python -m benchmarks.scrape_throughput --compare latest
+
+``benchmarks.cafef_server`` is an offline stand-in for cafef.vn used by
+the end-to-end benchmarks; it can also be run on its own.
+"""
@@ -0,0 +1,258 @@
+"""
+Offline stand-in for cafef.vn.
+
+Serves report listings and report files from ``benchmarks/fixtures`` so
+scraper changes can be measured without touching the real site:
+
+- ``/du-lieu/<exchange>/<symbol>-bao-cao-tai-chinh.chn``: a recorded page
+  from ``fixtures/cafef/<SYMBOL>.html`` or a synthetic listing. Each
+  symbol belongs to one exchange; requests under another exchange are
+  redirected like CafeF does.
+- ``/bctc/<name>.pdf``: a recorded file from ``fixtures/pdf`` or a
+  synthetic PDF.
+
+Every response can be delayed (latency plus jitter) and a share of
+requests fails with 503.
+
+Usage:
+    python -m benchmarks.cafef_server [--port 8765] [--latency-ms 150]
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from benchmarks.fixtures import FIXTURE_DIR, synthetic_listing
+
+PDF_DIR = FIXTURE_DIR.parent / "pdf"
+
+EXCHANGES = ("hose", "hnx", "upcom")
+
+LISTING_PATH = re.compile(
+    r"^/du-lieu/(?P<exchange>[a-z]+)/(?P<symbol>[a-z0-9]+)"
+    r"-bao-cao-tai-chinh\.chn$"
+)
+FILE_PATH = re.compile(r"^/bctc/(?P<name>[A-Za-z0-9_.-]+\.pdf)$")
+CDN_LINK = "//cafef1.mediacdn.vn/bctc/"
+
+
+def exchange_of(symbol: str) -> str:
+    """Exchange a symbol is listed on in the stand-in (deterministic)."""
+    return EXCHANGES[zlib.crc32(symbol.lower().encode()) % len(EXCHANGES)]
+
+
+def synthetic_pdf(name: str, size_kb: int = 256) -> bytes:
+    """Build a small valid PDF padded to roughly ``size_kb`` KiB."""
+    padding = (f"% {name} " * 64 + "\n") * (size_kb * 16)
+    return (
+        b"%PDF-1.4\n"
+        b"1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+        b"2 0 obj << /Type /Pages /Kids [3 0 R] /Count 1 >> endobj\n"
+        b"3 0 obj << /Type /Page /Parent 2 0 R "
+        b"/MediaBox [0 0 595 842] >> endobj\n"
+        + padding[:size_kb * 1024].encode()
+        + b"\ntrailer << /Root 1 0 R >>\n%%EOF\n"
+    )
+
+
+class StandInState:
+    """Shared configuration and page cache of a stand-in server."""
+
+    def __init__(
+        self,
+        latency_ms: float,
+        jitter_ms: float,
+        error_rate: float,
+        seed: int = 0
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.origin = ""
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._pages: Dict[str, bytes] = {}
+        self._files: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def delay(self) -> None:
+        """Sleep for the configured latency and jitter."""
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+
+    def should_fail(self) -> bool:
+        """Decide whether the current request fails."""
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+
+    def listing(self, symbol: str) -> bytes:
+        """Listing page of a symbol, with file links on this server."""
+        with self._lock:
+            page = self._pages.get(symbol)
+        if page is not None:
+            return page
+
+        recorded = FIXTURE_DIR / f"{symbol.upper()}.html"
+        if recorded.exists():
+            html = recorded.read_text(encoding="utf-8")
+        else:
+            html = synthetic_listing(
+                symbol.upper(), seed=zlib.crc32(symbol.encode())
+            )
+        page = html.replace(CDN_LINK, f"{self.origin}/bctc/").encode()
+
+        with self._lock:
+            self._pages[symbol] = page
+        return page
+
+    def report_file(self, name: str) -> bytes:
+        """Recorded or synthetic report PDF."""
+        with self._lock:
+            data = self._files.get(name)
+        if data is not None:
+            return data
+
+        recorded = PDF_DIR / name
+        data = (
+            recorded.read_bytes() if recorded.exists()
+            else synthetic_pdf(name)
+        )
+        with self._lock:
+            self._files[name] = data
+        return data
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler replaying CafeF pages and files."""
+
+    server: "StandInServer"
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Silence per-request logging."""
+
+    def _send(
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "text/html; charset=utf-8",
+        location: Optional[str] = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if location:
+            self.send_header("Location", location)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        """Serve listings, redirects and files."""
+        state = self.server.state
+        state.delay()
+        if state.should_fail():
+            self._send(503, b"Service Unavailable")
+            return
+
+        path = self.path.split("?", 1)[0]
+
+        match = LISTING_PATH.match(path)
+        if match:
+            symbol = match.group("symbol")
+            exchange = exchange_of(symbol)
+            if match.group("exchange") != exchange:
+                self._send(301, location=(
+                    f"{state.origin}/du-lieu/{exchange}/{symbol}"
+                    "-bao-cao-tai-chinh.chn"
+                ))
+                return
+            self._send(200, state.listing(symbol))
+            return
+
+        match = FILE_PATH.match(path)
+        if match:
+            self._send(
+                200, state.report_file(match.group("name")),
+                content_type="application/pdf"
+            )
+            return
+
+        self._send(404, b"Not Found")
+
+    do_HEAD = do_GET
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying a ``StandInState``."""
+
+    daemon_threads = True
+
+    def __init__(self, address, state: StandInState):
+        super().__init__(address, StandInHandler)
+        self.state = state
+        host, port = self.server_address[:2]
+        state.origin = f"http://{host}:{port}"
+
+
+def start_server(
+    port: int = 0,
+    latency_ms: float = 150.0,
+    jitter_ms: float = 50.0,
+    error_rate: float = 0.0,
+    seed: int = 0
+) -> StandInServer:
+    """Start the stand-in in a background thread.
+
+    Args:
+        port (int): Port to listen on (0 picks a free port)
+        latency_ms (float): Mean response delay in milliseconds
+        jitter_ms (float): Maximum deviation from the mean delay
+        error_rate (float): Share of requests answered with 503
+        seed (int): Seed for jitter and errors
+
+    Returns:
+        StandInServer: Running server; ``state.origin`` is its base URL
+    """
+    server = StandInServer(
+        ("127.0.0.1", port),
+        StandInState(latency_ms, jitter_ms, error_rate, seed)
+    )
+    threading.Thread(
+        target=server.serve_forever, name="cafef-stand-in", daemon=True
+    ).start()
+    return server
+
+
+def main() -> None:
+    """Run the stand-in in the foreground."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = start_server(
+        args.port, args.latency_ms, args.jitter_ms, args.error_rate
+    )
+    print(f"Serving CafeF stand-in at {server.state.origin}")
+    print(f"Set CAFEF_BASE_URL={server.state.origin} to scrape it")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
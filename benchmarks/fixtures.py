@@ -0,0 +1,155 @@
+"""
+Fixture pages for benchmarks.
+
+Saved CafeF listing pages live in ``benchmarks/fixtures/cafef/<SYMBOL>.html``,
+trimmed to the page shell and the report table: FPT (HOSE), SHS (HNX), ACV
+(UPCoM) and XXX, a listing without a report table. Parse benchmarks fail if
+any of them is missing. ``synthetic_listing`` generates larger pages with the
+same table structure for the stand-in server, and ``synthetic_reports``
+builds raw report rows directly, including the duplicates and malformed
+periods that real listings contain.
+"""
+
+import random
+from pathlib import Path
+from typing import Dict, List
+from backend.services.records import RawReport
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "cafef"
+
+# Saved listings every parse benchmark needs
+LISTING_FIXTURES = ("FPT", "SHS", "ACV", "XXX")
+
+REPORT_NAMES = (
+    "Báo cáo tài chính hợp nhất",
+    "Báo cáo tài chính hợp nhất (đã kiểm toán)",
+    "Báo cáo tài chính hợp nhất (đã soát xét)",
+    "Báo cáo tài chính công ty mẹ",
+    "Báo cáo tài chính công ty mẹ (đã kiểm toán)",
+)
+
+
+def synthetic_listing(
+    symbol: str,
+    rows: int = 60,
+    filler_kb: int = 400,
+    seed: int = 0
+) -> str:
+    """Generate a listing page shaped like CafeF's report table.
+
+    Args:
+        symbol (str): Stock symbol
+        rows (int): Number of report rows
+        filler_kb (int): Approximate size of unrelated markup in KiB
+        seed (int): Random seed for reproducible pages
+
+    Returns:
+        str: Page HTML
+    """
+    rng = random.Random(seed)
+    table_rows = []
+    for index in range(rows):
+        year = 2025 - index // 5
+        period = "CN" if index % 5 == 4 else f"Q{index % 5 + 1}"
+        name = rng.choice(REPORT_NAMES)
+        table_rows.append(
+            "<tr>"
+            f"<td class=\"BCTC_body_type\"><span>{name}</span></td>"
+            f"<td class=\"BCTC_body_dateTime\">{period}/{year}</td>"
+            "<td class=\"BCTC_body_download\">"
+            f"<a href=\"//cafef1.mediacdn.vn/bctc/{symbol}_{index}.pdf\">"
+            "Tải về</a></td>"
+            "</tr>"
+        )
+
+    block = (
+        "<div class=\"news-item\"><a href=\"/tin-tuc/{i}.chn\">"
+        "<img src=\"/images/{i}.jpg\"><span>Tin tức thị trường {i}</span>"
+        "</a><p>Lorem ipsum dolor sit amet, consectetur adipiscing.</p></div>"
+        "<script>window.__ads=window.__ads||[];__ads.push({i});</script>"
+    )
+    filler = []
+    size = 0
+    index = 0
+    while size < filler_kb * 1024:
+        chunk = block.format(i=index)
+        filler.append(chunk)
+        size += len(chunk)
+        index += 1
+    half = len(filler) // 2
+
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{symbol} - Báo cáo tài chính</title></head><body>"
+        + "".join(filler[:half])
+        + f"<h1 class=\"title-content-name\">Công ty cổ phần {symbol}</h1>"
+        "<table class=\"tbBCTC\"><tbody class=\"render_dataBCTC\">"
+        + "".join(table_rows)
+        + "</tbody></table>"
+        + "".join(filler[half:])
+        + "</body></html>"
+    )
+
+
+def load_listing_pages() -> Dict[str, str]:
+    """Load the saved listing pages.
+
+    Returns:
+        Dict[str, str]: Page HTML keyed by symbol
+
+    Raises:
+        FileNotFoundError: If a page of ``LISTING_FIXTURES`` is missing
+    """
+    pages = {
+        path.stem.upper(): path.read_text(encoding="utf-8")
+        for path in sorted(FIXTURE_DIR.glob("*.html"))
+    }
+    missing = [symbol for symbol in LISTING_FIXTURES if symbol not in pages]
+    if missing:
+        raise FileNotFoundError(
+            f"Listing fixtures missing from {FIXTURE_DIR}: "
+            + ", ".join(missing)
+        )
+    return pages
+
+
+REPORT_TIMES_MALFORMED = ("", "Q5/2024", "Q/2024", "X1/2023", "CN/abc", "2022")
+
+
+def synthetic_reports(
+    symbol: str,
+    rows: int = 60,
+    seed: int = 0
+) -> List[RawReport]:
+    """Generate raw report rows as returned by the CafeF scraper.
+
+    Periods repeat so that audited, reviewed and regular versions of the
+    same report compete, and a few rows carry malformed periods.
+
+    Args:
+        symbol (str): Stock symbol
+        rows (int): Number of report rows
+        seed (int): Random seed for reproducible rows
+
+    Returns:
+        List[RawReport]: Raw reports
+    """
+    rng = random.Random(seed)
+    reports = []
+    for index in range(rows):
+        if rng.random() < 0.05:
+            report_time = rng.choice(REPORT_TIMES_MALFORMED)
+        else:
+            year = 2025 - rng.randrange(rows // 8 + 1)
+            period = rng.choice(("Q1", "Q2", "Q3", "Q4", "CN", "nam"))
+            report_time = f"{period}/{year}".lower()
+        reports.append(RawReport(
+            symbol=symbol.lower(),
+            company_name=f"công ty cổ phần {symbol.lower()}",
+            report_time=report_time,
+            report_name=rng.choice(REPORT_NAMES).lower(),
+            report_url=(
+                f"https://cafef1.mediacdn.vn/bctc/{symbol}_{index}.pdf"
+            ),
+        ))
+    return reports
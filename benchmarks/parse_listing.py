@@ -0,0 +1,140 @@
+"""
+Listing parse micro-benchmark.
+
+Compares the previous full-document BeautifulSoup parse, a BeautifulSoup
+parse restricted with ``SoupStrainer`` and the lxml XPath parser used by
+``CafeFScraper`` on the saved fixture pages. Every variant is first checked
+to return the same rows, and to reject the page without a report table.
+
+Usage:
+    python -m benchmarks.parse_listing [--repeat 20]
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from backend.services.scrappers.parsing import parse_report_listing
+from benchmarks.fixtures import load_listing_pages
+
+
+def _rows_from_soup(soup, symbol: str) -> List[Dict[str, Any]]:
+    """Row extraction as previously done in ``CafeFScraper``."""
+    company_name_tag = soup.find("h1", class_="title-content-name")
+    company_name = company_name_tag.get_text(
+        strip=True
+    ).lower() if company_name_tag else None
+
+    report_table = soup.find("tbody", class_="render_dataBCTC")
+    if not report_table:
+        raise ValueError(f"No report data found for symbol: {symbol}")
+
+    reports = []
+    for row in report_table.find_all("tr"):
+        report_name_tag = row.find("td", class_="BCTC_body_type")
+        report_time_tag = row.find("td", class_="BCTC_body_dateTime")
+        download_tag = row.find("td", class_="BCTC_body_download")
+        link_tag = download_tag.find("a") if download_tag else None
+        report_url = (
+            link_tag["href"]
+            if link_tag and "href" in link_tag.attrs
+            else None
+        )
+        if isinstance(report_url, str) and report_url.startswith("//"):
+            report_url = f"https:{report_url}"
+
+        reports.append({
+            "symbol": symbol.lower(),
+            "company_name": company_name,
+            "report_time": report_time_tag.get_text(
+                strip=True
+            ).lower() if report_time_tag else None,
+            "report_name": report_name_tag.get_text(
+                strip=True
+            ).lower() if report_name_tag else None,
+            "report_url": report_url
+        })
+    return reports
+
+
+def parse_full_soup(html: str, symbol: str) -> List[Dict[str, Any]]:
+    """Previous implementation: full document BeautifulSoup tree."""
+    return _rows_from_soup(BeautifulSoup(html, "lxml"), symbol)
+
+
+def parse_strained_soup(html: str, symbol: str) -> List[Dict[str, Any]]:
+    """BeautifulSoup restricted to the header and the report table."""
+    strainer = SoupStrainer(
+        ["h1", "tbody"],
+        attrs={"class": ["title-content-name", "render_dataBCTC"]}
+    )
+    return _rows_from_soup(
+        BeautifulSoup(html, "lxml", parse_only=strainer), symbol
+    )
+
+
+def _as_dicts(rows: List[Any]) -> List[Dict[str, Any]]:
+    """Rows as dicts; the current parser returns ``RawReport`` records."""
+    return [row if isinstance(row, dict) else row._asdict() for row in rows]
+
+
+PARSERS: Dict[str, Callable[[str, str], List[Any]]] = {
+    "bs4_full": parse_full_soup,
+    "bs4_strainer": parse_strained_soup,
+    "lxml_xpath": parse_report_listing,
+}
+
+
+def _parse(
+    parse: Callable[[str, str], List[Any]],
+    html: str,
+    symbol: str
+) -> Optional[List[Dict[str, Any]]]:
+    """Rows of a page as dicts, or None if it has no report table."""
+    try:
+        return _as_dicts(parse(html, symbol))
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    # The page without a report table logs an error on every parse
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pages = load_listing_pages()
+    total_kb = sum(len(html) for html in pages.values()) / 1024
+    print(f"{len(pages)} pages, {total_kb:.0f} KiB total")
+
+    for symbol, html in pages.items():
+        expected = _parse(parse_full_soup, html, symbol)
+        for name, parse in PARSERS.items():
+            if _parse(parse, html, symbol) != expected:
+                raise SystemExit(f"{name} output differs on {symbol}")
+
+    baseline = None
+    for name, parse in PARSERS.items():
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            for symbol, html in pages.items():
+                _parse(parse, html, symbol)
+            timings.append(
+                (time.perf_counter() - started) / len(pages) * 1000
+            )
+
+        median = statistics.median(timings)
+        baseline = baseline or median
+        print(
+            f"{name:<14} median {median:8.2f} ms/page "
+            f"({baseline / median:5.1f}x vs bs4_full)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Report processing micro-benchmark.
+
+Compares the previous pandas implementation of ``process_reports``, which
+took and returned dicts, with the current single-pass one over records,
+called per listing, and with ``process_report_batch`` over all listings.
+The pandas version is the baseline code kept in ``tests/pandas_baseline.py``.
+Before timing, both are run on many synthetic listings (duplicate periods
+of every priority, parent company rows, malformed periods) and on the
+parsed fixture pages, and must keep the same reports; the batch must
+return exactly what ``process_reports`` returns per listing. Periods must come
+back as integers; the pandas version returned floats whenever a column
+held a missing value.
+
+Usage:
+    python -m benchmarks.process_reports [--symbols 200] [--repeat 5]
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from backend.services.processors.metadata_parser import (
+    columns_from_reports,
+    process_report_batch,
+    process_reports
+)
+from backend.services.records import RawReport
+from backend.services.scrappers.parsing import parse_report_listing
+from benchmarks.fixtures import load_listing_pages, synthetic_reports
+
+
+def process_reports_pandas(
+    reports: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Baseline pandas version; pandas is imported on first use."""
+    # pylint: disable=import-outside-toplevel
+    from tests.pandas_baseline import process_reports as baseline
+
+    return baseline(reports)
+
+
+def run_pandas(listings: List[List[RawReport]]) -> None:
+    """Process listings the previous way, from dicts."""
+    for listing in listings:
+        process_reports_pandas([report._asdict() for report in listing])
+
+
+def run_single_pass(listings: List[List[RawReport]]) -> None:
+    """Process listings with ``process_reports``."""
+    for listing in listings:
+        process_reports(listing)
+
+
+def run_batch(listings: List[List[RawReport]]) -> None:
+    """Process all listings with one ``process_report_batch`` call."""
+    process_report_batch(columns_from_reports(listings))
+
+
+IMPLEMENTATIONS: Dict[str, Callable[[List[List[RawReport]]], None]] = {
+    "pandas": run_pandas,
+    "single_pass": run_single_pass,
+    "batch": run_batch,
+}
+
+
+def build_listings(symbols: int) -> List[List[RawReport]]:
+    """Synthetic listings plus the parsed fixture pages."""
+    listings = [
+        synthetic_reports(f"S{index:04d}", seed=index)
+        for index in range(symbols)
+    ]
+    for symbol, html in load_listing_pages().items():
+        try:
+            listings.append(parse_report_listing(html, symbol))
+        except ValueError:
+            # Saved listing without a report table
+            continue
+    return listings
+
+
+def _outline(rows: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+    """Kept periods and flags, whichever equal duplicate was kept."""
+    return sorted(
+        (
+            row["report_type"] or "", row["report_year"] or 0,
+            row["report_quarter"] or 0, row["is_audited"], row["is_reviewed"]
+        )
+        for row in rows
+    )
+
+
+def check_equivalence(listings: List[List[RawReport]]) -> None:
+    """Fail if the implementations keep different reports of a listing.
+
+    The pandas version picks among equally ranked duplicates with an
+    unstable sort, so only the kept periods and their flags are compared
+    here; tests/test_metadata_parser.py compares tie-free listings row
+    for row.
+    """
+    for listing in listings:
+        expected = process_reports_pandas(
+            [report._asdict() for report in listing]
+        )
+        actual = process_reports(listing)
+        if _outline([record._asdict() for record in actual]) != _outline(
+            expected
+        ):
+            symbol = listing[0].symbol if listing else "?"
+            raise SystemExit(f"single_pass output differs on {symbol}")
+        if any(
+            value is not None and not isinstance(value, int)
+            for record in actual
+            for value in (record.report_year, record.report_quarter)
+        ):
+            raise SystemExit("single_pass returned non-integer periods")
+
+    batch = process_report_batch(columns_from_reports(listings))
+    for listing in listings:
+        if listing and batch[listing[0].symbol] != process_reports(listing):
+            raise SystemExit(f"batch output differs on {listing[0].symbol}")
+
+
+def main() -> None:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Malformed periods and the fixture page without a report table are
+    # logged on every pass
+    logging.basicConfig(level=logging.CRITICAL)
+
+    started = time.perf_counter()
+    import pandas  # noqa: F401  pylint: disable=import-outside-toplevel
+    print(f"pandas import  {(time.perf_counter() - started) * 1000:8.1f} ms")
+
+    listings = build_listings(args.symbols)
+    rows = sum(len(listing) for listing in listings)
+    print(f"{len(listings)} listings, {rows} rows")
+
+    check_equivalence(listings)
+    print("same reports kept")
+
+    baseline = None
+    for name, process in IMPLEMENTATIONS.items():
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            process(listings)
+            timings.append(time.perf_counter() - started)
+
+        median = statistics.median(timings)
+        baseline = baseline or median
+        print(
+            f"{name:<12} median {median:8.3f} s total, "
+            f"{median / len(listings) * 1000:6.3f} ms/listing "
+            f"({baseline / median:6.1f}x vs pandas)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Report lookup benchmark.
+
+Grows a SQLite financial_reports table (default 10,000, 100,000 and
+300,000 rows, 60 reports per symbol) and times the hot repository
+lookups at each size, in two schemas:
+
+- ``no_index``: the previous table, primary key only
+- ``indexed``: the current model, with the natural-key and listing
+  indexes
+
+The ``indexed`` schema must also pass ``QueryPlanCheck``, and lookup
+times should stay flat as the table grows. Both schemas must return the
+same rows.
+
+Usage:
+    python -m benchmarks.report_lookups [--sizes 10000,100000,300000]
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from backend.database import Base, QueryPlanCheck
+from backend.database.models import FinancialReport
+from backend.database.repositories import ReportRepository
+
+REPORTS_PER_SYMBOL = 60
+
+LOOKUPS: Dict[str, Callable[[ReportRepository, str, int], Any]] = {
+    "find_duplicate": lambda repository, symbol, year: (
+        repository.find_duplicate(symbol, "quarterly", year, 2).id
+    ),
+    "get_by_symbol": lambda repository, symbol, year: [
+        report.id for report in repository.get_by_symbol(symbol)
+    ],
+    "count_by_symbol": lambda repository, symbol, year: (
+        repository.count_by_symbol(symbol)
+    ),
+}
+
+
+def report_rows(start: int, stop: int) -> List[Dict[str, Any]]:
+    """Rows of symbols ``start`` to ``stop``, 12 years of 5 reports."""
+    rows = []
+    for index in range(start, stop):
+        symbol = f"s{index:05d}"
+        for report in range(REPORTS_PER_SYMBOL):
+            quarter = report % 5 + 1 if report % 5 < 4 else None
+            rows.append({
+                "symbol": symbol,
+                "company_name": f"công ty cổ phần {symbol}",
+                "report_name": "báo cáo tài chính hợp nhất",
+                "report_type": "quarterly" if quarter else "annual",
+                "report_year": 2025 - report // 5,
+                "report_quarter": quarter,
+                "is_audited": quarter is None,
+                "is_reviewed": quarter == 2,
+                "report_url": f"https://cafef1.mediacdn.vn/{symbol}.pdf",
+            })
+    return rows
+
+
+def create_table(path: str, indexed: bool):
+    """Engine on a new database holding an empty financial_reports."""
+    engine = create_engine(f"sqlite:///{path}")
+    table = FinancialReport.__table__
+    Base.metadata.create_all(engine, tables=[table])
+    if not indexed:
+        with engine.begin() as conn:
+            for index in table.indexes:
+                conn.exec_driver_sql(f"DROP INDEX {index.name}")
+    return engine
+
+
+def time_lookups(
+    engine, symbols: int, lookups: int, seed: int
+) -> Dict[str, Any]:
+    """Median seconds and results of each lookup over random symbols."""
+    rng = random.Random(seed)
+    keys = [
+        (f"s{rng.randrange(symbols):05d}", rng.randrange(2014, 2026))
+        for _ in range(lookups)
+    ]
+    measured = {}
+    with Session(bind=engine) as session:
+        repository = ReportRepository(session)
+        for name, lookup in LOOKUPS.items():
+            timings = []
+            results = []
+            for symbol, year in keys:
+                started = time.perf_counter()
+                results.append(lookup(repository, symbol, year))
+                timings.append(time.perf_counter() - started)
+                session.expunge_all()
+            measured[name] = (statistics.median(timings), results)
+    return measured
+
+
+def main() -> None:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,300000")
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    # QueryPlanCheck logs each plan at INFO
+    logging.basicConfig(level=logging.WARNING, force=True)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engines = {
+            name: create_table(f"{workdir}/{name}.db", name == "indexed")
+            for name in ("no_index", "indexed")
+        }
+        if not QueryPlanCheck(engines["indexed"]).run():
+            raise SystemExit("indexed schema does not seek")
+
+        loaded = 0
+        for size in sizes:
+            symbols = max(size // REPORTS_PER_SYMBOL, 1)
+            rows = report_rows(loaded, symbols)
+            loaded = max(loaded, symbols)
+            results = {}
+            for name, engine in engines.items():
+                if rows:
+                    with engine.begin() as conn:
+                        conn.execute(insert(FinancialReport), rows)
+                results[name] = time_lookups(
+                    engine, symbols, args.lookups, seed=size
+                )
+
+            baseline, indexed = results["no_index"], results["indexed"]
+            for lookup in LOOKUPS:
+                if baseline[lookup][1] != indexed[lookup][1]:
+                    raise SystemExit(f"{lookup} results differ")
+                print(
+                    f"{symbols * REPORTS_PER_SYMBOL:>8} rows  "
+                    f"{lookup:<16} "
+                    f"no_index {baseline[lookup][0] * 1000:8.3f} ms  "
+                    f"indexed {indexed[lookup][0] * 1000:6.3f} ms"
+                )
+
+        for engine in engines.values():
+            engine.dispose()
+    print("results identical")
+
+
+if __name__ == "__main__":
+    main()
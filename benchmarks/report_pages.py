@@ -0,0 +1,132 @@
+"""
+Report listing pagination benchmark.
+
+Fills a SQLite financial_reports table (default 300,000 rows) and times
+pages of GET /financial/reports in the default order at increasing
+depth, in two ways:
+
+- ``offset``: ``OFFSET``/``LIMIT``, which reads and discards every row
+  before the page
+- ``cursor``: the keyset cursor of the previous page, which seeks to the
+  page's first row
+
+Both must return the same rows for every page timed, and walking the
+whole table by cursor must visit every row once, in offset order.
+Counting is left out (``with_total=False``); it costs the same at every
+depth.
+
+Usage:
+    python -m benchmarks.report_pages [--rows 300000] [--limit 100]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from backend.database.models import FinancialReport
+from backend.database.repositories import ReportRepository
+from backend.database.repositories.report import (
+    DEFAULT_SORT,
+    encode_cursor
+)
+from benchmarks.report_lookups import (
+    REPORTS_PER_SYMBOL,
+    create_table,
+    report_rows
+)
+
+PAGES = (1, 10, 100, 1000, 2999)
+
+
+def page(
+    repository: ReportRepository,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> Tuple[List[int], Optional[str]]:
+    """IDs on one page and the cursor of the next."""
+    reports, _, next_cursor = repository.search(
+        limit=limit, offset=offset, cursor=cursor, with_total=False
+    )
+    return [report.id for report in reports], next_cursor
+
+
+def walk(repository: ReportRepository, limit: int) -> List[int]:
+    """IDs of every report, following cursors from the first page."""
+    ids, cursor = page(repository, limit)
+    while cursor:
+        more, cursor = page(repository, limit, cursor=cursor)
+        ids.extend(more)
+    return ids
+
+
+def main() -> None:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=300000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_table(f"{workdir}/reports.db", indexed=True)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(FinancialReport),
+                report_rows(0, max(args.rows // REPORTS_PER_SYMBOL, 1))
+            )
+
+        with Session(bind=engine) as session:
+            repository = ReportRepository(session)
+            order = [
+                report.id for report in repository.sort_query(
+                    session.query(FinancialReport.id), DEFAULT_SORT
+                )
+            ]
+            if walk(repository, args.limit) != order:
+                raise SystemExit("cursor walk differs from offset order")
+            print(f"{len(order)} rows, cursor walk matches offset order")
+
+            for number in PAGES:
+                offset = (number - 1) * args.limit
+                if offset >= len(order):
+                    break
+                # The cursor a client holds after the previous page
+                cursor = None
+                if offset:
+                    cursor = encode_cursor(
+                        session.get(FinancialReport, order[offset - 1])
+                    )
+
+                timings: Dict[str, List[float]] = {"offset": [], "cursor": []}
+                results = {}
+                for _ in range(args.repeat):
+                    for name, kwargs in (
+                        ("offset", {"offset": offset}),
+                        ("cursor", {"cursor": cursor}),
+                    ):
+                        session.expunge_all()
+                        started = time.perf_counter()
+                        results[name] = page(repository, args.limit, **kwargs)
+                        timings[name].append(time.perf_counter() - started)
+
+                if results["offset"] != results["cursor"]:
+                    raise SystemExit(f"page {number} differs")
+                by_offset, by_cursor = (
+                    statistics.median(timings[name]) * 1000
+                    for name in ("offset", "cursor")
+                )
+                print(
+                    f"page {number:>5}  offset {by_offset:8.2f} ms  "
+                    f"cursor {by_cursor:6.2f} ms"
+                )
+
+        engine.dispose()
+    print("pages identical")
+
+
+if __name__ == "__main__":
+    main()
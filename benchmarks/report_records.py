@@ -0,0 +1,250 @@
+"""
+Report record memory benchmark.
+
+Runs the scrape -> process -> validate path over a full-universe crawl
+(default 1,600 symbols of 60 rows) twice: with the previous dict rows,
+where every stage built new dicts, and with the ``RawReport`` and
+``ReportRecord`` named tuples used now. Both start from the same
+extracted (name, time, href) rows and must produce equal reports.
+
+For each stage the benchmark prints the median time of a few untraced
+runs and, from one run under tracemalloc, the memory the stage's output
+still holds per row (``retained``). Intermediate rows that a stage
+allocates and frees again show up in its time.
+
+Usage:
+    python -m benchmarks.report_records [--symbols 1600] [--repeat 3]
+"""
+
+import argparse
+import gc
+import logging
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from pydantic import ValidationError
+from backend.schemas import FinancialReportCreate
+from backend.services.processors.metadata_parser import (
+    _priority,
+    classify_report_name,
+    parse_report_time,
+    process_reports
+)
+from backend.services.scrappers.parsing import build_reports
+from benchmarks.fixtures import synthetic_reports
+
+Rows = Tuple[str, Optional[str], List[Tuple[Any, Any, Any]]]
+
+
+def build_reports_dicts(
+    symbol: str,
+    company_name: Optional[str],
+    rows: Sequence[Tuple[Any, Any, Any]]
+) -> List[Dict[str, Any]]:
+    """Previous ``build_reports``: one dict per row."""
+    symbol_lower = symbol.lower()
+    reports = []
+    for report_name, report_time, report_url in rows:
+        if report_url is not None and report_url.startswith("//"):
+            report_url = f"https:{report_url}"
+        reports.append({
+            "symbol": symbol_lower,
+            "company_name": company_name,
+            "report_time": (
+                report_time.lower() if report_time is not None else None
+            ),
+            "report_name": (
+                report_name.lower() if report_name is not None else None
+            ),
+            "report_url": report_url
+        })
+    return reports
+
+
+def _sort_key_dicts(entry: Tuple[int, int, Dict[str, Any]]) -> Tuple:
+    """Previous output order over dict rows."""
+    priority, index, report = entry
+    symbol = report["symbol"]
+    year = report["report_year"]
+    quarter = report["report_quarter"]
+    return (
+        symbol is None, symbol or "",
+        year is None, -(year or 0),
+        quarter is None, quarter or 0,
+        -priority, index
+    )
+
+
+def process_reports_dicts(
+    reports: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Previous ``process_reports``: a working dict and an output dict."""
+    best: Dict[Tuple[Any, ...], Tuple[int, int, Dict[str, Any]]] = {}
+    for index, raw in enumerate(reports):
+        report_name = raw.get("report_name", "")
+        if not report_name:
+            continue
+        info = classify_report_name(report_name)
+        if info.is_parent_company:
+            continue
+
+        report = {
+            "symbol": raw.get("symbol"),
+            "company_name": raw.get("company_name"),
+            "report_name": info.cleaned_name,
+            "report_url": raw.get("report_url"),
+            "is_audited": info.is_audited,
+            "is_reviewed": info.is_reviewed,
+            **parse_report_time(raw.get("report_time", ""))
+        }
+        priority = _priority(report["is_audited"], report["is_reviewed"])
+        key = (
+            report["symbol"], report["report_type"],
+            report["report_year"], report["report_quarter"]
+        )
+        current = best.get(key)
+        if current is None or priority > current[0]:
+            best[key] = (priority, index, report)
+
+    columns = (
+        "symbol", "company_name", "report_name", "report_type",
+        "report_year", "report_quarter", "is_audited", "is_reviewed",
+        "report_url"
+    )
+    return [
+        {column: report[column] for column in columns}
+        for _, _, report in sorted(best.values(), key=_sort_key_dicts)
+    ]
+
+
+def _validate(build: Callable[[Any], Any], processed: List) -> List:
+    """Validate rows one by one, skipping invalid ones like the API."""
+    validated = []
+    for report in processed:
+        try:
+            validated.append(build(report))
+        except ValidationError:
+            pass
+    return validated
+
+
+def validate_dicts(processed: List[Dict[str, Any]]) -> List:
+    """Previous validation: keyword expansion of every row."""
+    return _validate(
+        lambda report: FinancialReportCreate(**report), processed
+    )
+
+
+def validate_records(processed: List[Any]) -> List:
+    """Validation of each record converted to a dict at the boundary."""
+    return _validate(
+        lambda report: FinancialReportCreate.model_validate(
+            report._asdict()
+        ),
+        processed
+    )
+
+
+PIPELINES: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    "dicts": (build_reports_dicts, process_reports_dicts, validate_dicts),
+    "records": (build_reports, process_reports, validate_records),
+}
+
+
+def extracted_rows(symbols: int) -> List[Rows]:
+    """(name, time, href) rows per symbol, as the page extraction yields."""
+    listings = []
+    for index in range(symbols):
+        reports = synthetic_reports(f"U{index:04d}", seed=index)
+        listings.append((
+            f"U{index:04d}",
+            reports[0].company_name,
+            [
+                (report.report_name, report.report_time, report.report_url)
+                for report in reports
+            ]
+        ))
+    return listings
+
+
+def measure(
+    stage: Callable[[List], List], inputs: List, repeat: int
+) -> Tuple[List, int, float]:
+    """Time a stage, then run it once more under tracemalloc.
+
+    Returns:
+        Tuple[List, int, float]: Output of the traced run, bytes it
+        retained and the median seconds of the untraced runs
+    """
+    # The cyclic collector is paused while timing, so the figures do not
+    # depend on how much an earlier pipeline left alive
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            stage(inputs)
+            timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    output = stage(inputs)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return output, retained, statistics.median(timings)
+
+
+def run(
+    name: str, listings: List[Rows], repeat: int
+) -> List[List[Dict[str, Any]]]:
+    """Run one pipeline over all listings and print per-stage figures."""
+    build, process, validate = PIPELINES[name]
+    stages = (
+        ("scrape", lambda rows: [build(*listing) for listing in rows]),
+        ("process", lambda raw: [process(reports) for reports in raw]),
+        ("validate", lambda done: [validate(reports) for reports in done]),
+    )
+
+    output: List = listings
+    for stage_name, stage in stages:
+        output, retained, elapsed = measure(stage, output, repeat)
+        rows = sum(len(reports) for reports in output) or 1
+        print(
+            f"{name:<8} {stage_name:<9} {elapsed:7.3f} s  "
+            f"retained {retained / rows:7.1f} B/row"
+        )
+
+    return [
+        [report.model_dump() for report in reports] for reports in output
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print per-stage memory and timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=1600)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Malformed periods are logged by parse_report_time on every pass
+    logging.basicConfig(level=logging.ERROR)
+
+    listings = extracted_rows(args.symbols)
+    rows = sum(len(listing[2]) for listing in listings)
+    print(f"{len(listings)} symbols, {rows} rows")
+
+    # Warm the report name cache so both pipelines see the same state
+    process_reports_dicts(build_reports_dicts(*listings[0]))
+
+    results = [run(name, listings, args.repeat) for name in PIPELINES]
+    if results[0] != results[1]:
+        raise SystemExit("records pipeline output differs")
+    print("outputs identical")
+
+
+if __name__ == "__main__":
+    main()
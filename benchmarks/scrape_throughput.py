@@ -0,0 +1,326 @@
+"""
+End-to-end scraper throughput benchmark.
+
+Starts the offline CafeF stand-in (``benchmarks.cafef_server``), points
+the scraper at it and runs fetch -> ``process_reports`` -> validation ->
+``ReportRepository`` storage (on a temporary SQLite database) for many
+symbols with the bulk engine. Reports symbols per second, p50/p95 latency
+per stage and peak RSS, and stores the results as JSON under
+``benchmarks/results`` so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.scrape_throughput [--symbols 40] [--concurrency 4]
+        [--fetch-mode http|browser|auto] [--latency-ms 150]
+        [--error-rate 0.05] [--download] [--compare latest]
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from benchmarks.cafef_server import start_server
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+STAGES = ("fetch", "process", "validate", "store", "download")
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(share * len(ordered)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb() -> Dict[str, float]:
+    """Peak resident set size of this process and its children (Chrome)."""
+    # ru_maxrss is in bytes on macOS and KiB on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return {
+        "self": round(own / divisor, 1),
+        "children": round(children / divisor, 1),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, if run inside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def configure_environment(origin: str, state_dir: str, args) -> None:
+    """Point the backend settings at the stand-in.
+
+    Must run before any ``backend`` import, because settings are read
+    when the package is first imported.
+    """
+    os.environ["CAFEF_BASE_URL"] = origin
+    os.environ["STATE_DIR"] = state_dir
+    os.environ["HTTP_CACHE_ENABLED"] = "false"
+    os.environ["SCRAPER_HOST_RATE"] = str(args.host_rate)
+    os.environ["SCRAPER_HOST_BURST"] = str(max(1, args.concurrency))
+    os.environ["SCRAPER_POOL_SIZE"] = str(max(1, args.concurrency))
+    os.environ["SCRAPER_POOL_WARMUP"] = "0"
+
+
+def run(args) -> Dict[str, Any]:
+    """Run the benchmark and return the result document."""
+    server = start_server(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    workdir = tempfile.mkdtemp(prefix="scrape-bench-")
+    configure_environment(server.state.origin, workdir, args)
+
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from backend.database.base import Base
+    from backend.database.models import FinancialReport
+    from backend.database.repositories import ReportRepository
+    from backend.schemas import dump_reports, validate_reports
+    from backend.services.processors import ImageConverter, process_reports
+    from backend.services.scrappers import (
+        BulkScrapeEngine,
+        close_driver_pools,
+        close_http_client,
+        fetch_reports
+    )
+
+    engine = create_engine(
+        f"sqlite:///{workdir}/reports.db",
+        connect_args={"check_same_thread": False, "timeout": 60}
+    )
+    Base.metadata.create_all(engine, tables=[FinancialReport.__table__])
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    converter = ImageConverter()
+
+    def task(symbol: str) -> Dict[str, Any]:
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        try:
+            raw, source = fetch_reports(symbol, fetch_mode=args.fetch_mode)
+            timings["fetch"] = time.perf_counter() - started
+
+            mark = time.perf_counter()
+            processed = process_reports(raw)
+            timings["process"] = time.perf_counter() - mark
+
+            mark = time.perf_counter()
+            valid, _ = validate_reports(
+                [report._asdict() for report in processed]
+            )
+            validated = dump_reports(valid)
+            timings["validate"] = time.perf_counter() - mark
+
+            mark = time.perf_counter()
+            session = session_factory()
+            try:
+                ReportRepository(session).upsert_bulk(validated)
+            finally:
+                session.close()
+            timings["store"] = time.perf_counter() - mark
+
+            if args.download and validated:
+                mark = time.perf_counter()
+                converter.get_file_bytes(validated[0]["report_url"])
+                timings["download"] = time.perf_counter() - mark
+
+            return {
+                "ok": True,
+                "source": source,
+                "reports": len(validated),
+                "timings": timings,
+                "total": time.perf_counter() - started,
+            }
+        except Exception as error:  # pylint: disable=broad-except
+            return {
+                "ok": False,
+                "error": f"{type(error).__name__}: {error}",
+                "timings": timings,
+                "total": time.perf_counter() - started,
+            }
+
+    symbols = [f"B{index:03d}" for index in range(args.symbols)]
+    started = time.perf_counter()
+    outcomes = dict(
+        BulkScrapeEngine(max_workers=args.concurrency).run(symbols, task)
+    )
+    elapsed = time.perf_counter() - started
+    rss = peak_rss_mb()
+
+    close_driver_pools()
+    close_http_client()
+    server.shutdown()
+
+    succeeded = [outcome for outcome in outcomes.values() if outcome["ok"]]
+    stages = {}
+    for stage in STAGES + ("total",):
+        values = [
+            outcome["total"] if stage == "total"
+            else outcome["timings"].get(stage)
+            for outcome in succeeded
+        ]
+        values = [value * 1000 for value in values if value is not None]
+        if values:
+            stages[stage] = {
+                "p50_ms": round(percentile(values, 0.50), 2),
+                "p95_ms": round(percentile(values, 0.95), 2),
+            }
+
+    errors = sorted({
+        outcome["error"] for outcome in outcomes.values()
+        if not outcome["ok"]
+    })
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "symbols": args.symbols,
+            "concurrency": args.concurrency,
+            "fetch_mode": args.fetch_mode,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "host_rate": args.host_rate,
+            "download": args.download,
+        },
+        "results": {
+            "elapsed_s": round(elapsed, 3),
+            "symbols_per_s": round(len(succeeded) / elapsed, 3),
+            "succeeded": len(succeeded),
+            "failed": len(outcomes) - len(succeeded),
+            "reports": sum(outcome["reports"] for outcome in succeeded),
+            "sources": {
+                source: sum(
+                    1 for outcome in succeeded
+                    if outcome["source"] == source
+                )
+                for source in {outcome["source"] for outcome in succeeded}
+            },
+            "stages": stages,
+            "peak_rss_mb": rss,
+            "server": {
+                "requests": server.state.requests,
+                "errors": server.state.errors,
+            },
+            "errors": errors[:10],
+        },
+    }
+
+
+def save(document: Dict[str, Any]) -> Path:
+    """Write a result document to ``benchmarks/results``."""
+    RESULTS_DIR.mkdir(exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = RESULTS_DIR / f"{stamp}-{document['commit'] or 'nogit'}.json"
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    return path
+
+
+def load_baseline(spec: str, exclude: Path) -> Optional[Dict[str, Any]]:
+    """Load a stored result: a path, or 'latest' for the previous run."""
+    if spec == "latest":
+        candidates = sorted(
+            path for path in RESULTS_DIR.glob("*.json") if path != exclude
+        )
+        if not candidates:
+            return None
+        return json.loads(candidates[-1].read_text(encoding="utf-8"))
+    return json.loads(Path(spec).read_text(encoding="utf-8"))
+
+
+def report(document: Dict[str, Any], baseline: Optional[Dict]) -> None:
+    """Print a result summary, with deltas against a baseline."""
+    results = document["results"]
+    base = baseline["results"] if baseline else None
+
+    def delta(current: float, previous: Optional[float]) -> str:
+        if not previous:
+            return ""
+        return f" ({(current - previous) / previous * 100:+.1f}%)"
+
+    print(
+        f"commit {document['commit']}: {results['succeeded']} ok, "
+        f"{results['failed']} failed in {results['elapsed_s']} s"
+    )
+    print(
+        f"throughput      {results['symbols_per_s']:8.2f} symbols/s"
+        + delta(
+            results["symbols_per_s"], base and base["symbols_per_s"]
+        )
+    )
+    for stage, values in results["stages"].items():
+        previous = base and base["stages"].get(stage, {})
+        print(
+            f"{stage:<15} p50 {values['p50_ms']:9.2f} ms"
+            + delta(values["p50_ms"], previous and previous.get("p50_ms"))
+            + f"  p95 {values['p95_ms']:9.2f} ms"
+            + delta(values["p95_ms"], previous and previous.get("p95_ms"))
+        )
+    rss = results["peak_rss_mb"]
+    print(
+        f"peak RSS        {rss['self']} MiB (children {rss['children']} MiB)"
+    )
+    if baseline:
+        print(f"compared with commit {baseline['commit']}")
+    for error in results["errors"]:
+        print(f"error: {error}")
+
+
+def main() -> None:
+    """Parse arguments, run, store and print the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--fetch-mode", choices=("http", "browser", "auto"), default="http"
+    )
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--host-rate", type=float, default=1000.0,
+        help="Per-host request rate cap applied to the stand-in"
+    )
+    parser.add_argument("--download", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--compare", default=None,
+        help="Result file to compare with, or 'latest'"
+    )
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    document = run(args)
+    path = None if args.no_save else save(document)
+    baseline = load_baseline(args.compare, path) if args.compare else None
+    report(document, baseline)
+    if path:
+        print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
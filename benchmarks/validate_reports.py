@@ -0,0 +1,150 @@
+"""
+Report validation benchmark.
+
+Validates processed reports (default 100 symbols x 60 reports, a few of
+them invalid) and builds the API responses for the stored rows, in two
+ways:
+
+- ``per_row``: the previous endpoint code, one ``FinancialReportCreate``
+  per row inside try/except, one ``model_dump`` per row for the
+  repository and one ``FinancialReportResponse.model_validate`` per
+  stored ORM row
+- ``batch``: ``validate_reports``, ``dump_reports`` and
+  ``report_responses``, one ``TypeAdapter`` call each per symbol
+
+Both must accept the same rows, reject the same indices and return equal
+responses. Storing is not timed; the ORM rows a repository would return
+are built up front.
+
+Usage:
+    python -m benchmarks.validate_reports [--symbols 100] [--repeat 5]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Dict, List, Tuple
+from pydantic import ValidationError
+from backend.database.models import FinancialReport
+from backend.schemas import (
+    FinancialReportCreate,
+    FinancialReportResponse,
+    dump_reports,
+    report_responses,
+    validate_reports
+)
+from backend.services.records import ReportRecord
+
+Listing = Tuple[List[Dict[str, Any]], List[FinancialReport]]
+
+
+def processed_listing(
+    symbol: str, reports: int = 60, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Processed report rows of one symbol, about 3% of them invalid."""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(reports):
+        year = 2025 - index // 5
+        quarter = index % 5 + 1 if index % 5 < 4 else None
+        record = ReportRecord(
+            symbol=symbol.lower(),
+            company_name=f"công ty cổ phần {symbol.lower()}",
+            report_name="báo cáo tài chính hợp nhất",
+            report_type="quarterly" if quarter else "annual",
+            report_year=year,
+            report_quarter=quarter,
+            is_audited=rng.random() < 0.3,
+            is_reviewed=rng.random() < 0.3,
+            report_url=f"https://cafef1.mediacdn.vn/bctc/{symbol}_{index}.pdf"
+        )
+        if rng.random() < 0.03:
+            record = record._replace(report_type=None)
+        rows.append(record._asdict())
+    return rows
+
+
+def stored_rows(rows: List[Dict[str, Any]]) -> List[FinancialReport]:
+    """ORM rows as the repository returns them after an upsert."""
+    stored = []
+    for index, row in enumerate(rows):
+        try:
+            data = FinancialReportCreate(**row).model_dump()
+        except ValidationError:
+            continue
+        data["id"] = index + 1
+        stored.append(FinancialReport(**data))
+    return stored
+
+
+def per_row(listing: Listing) -> Tuple[List, List[int]]:
+    """Previous endpoint code."""
+    rows, stored = listing
+    validated = []
+    failed = []
+    for index, row in enumerate(rows):
+        try:
+            validated.append(FinancialReportCreate(**row))
+        except ValidationError:
+            failed.append(index)
+
+    dumped = [report.model_dump() for report in validated]
+    assert len(dumped) == len(stored)
+    return (
+        [FinancialReportResponse.model_validate(row) for row in stored],
+        failed
+    )
+
+
+def batch(listing: Listing) -> Tuple[List, List[int]]:
+    """Current endpoint code."""
+    rows, stored = listing
+    validated, errors = validate_reports(rows)
+    dumped = dump_reports(validated)
+    return (
+        report_responses(dumped, [row.id for row in stored]),
+        [error.index for error in errors]
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--reports", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    listings: List[Listing] = []
+    for index in range(args.symbols):
+        rows = processed_listing(f"S{index:03d}", args.reports, seed=index)
+        listings.append((rows, stored_rows(rows)))
+    total = sum(len(rows) for rows, _ in listings)
+    invalid = total - sum(len(stored) for _, stored in listings)
+    print(f"{len(listings)} symbols, {total} reports, {invalid} invalid")
+
+    for listing in listings:
+        if per_row(listing) != batch(listing):
+            raise SystemExit("batch output differs")
+    print("outputs identical")
+
+    baseline = None
+    for name, run in (("per_row", per_row), ("batch", batch)):
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            for listing in listings:
+                run(listing)
+            timings.append(time.perf_counter() - started)
+
+        median = statistics.median(timings)
+        baseline = baseline or median
+        print(
+            f"{name:<8} median {median * 1000:8.2f} ms "
+            f"({baseline / median:5.1f}x vs per_row)"
+        )
+
+
+if __name__ == "__main__":
+    main()
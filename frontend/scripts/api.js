@@ -48,7 +48,7 @@ class APIClient {
                 throw new Error(data.detail || `HTTP error! status: ${response.status}`);
             }
 
-            return { success: true, data };
+            return { success: true, data, headers: response.headers };
         } catch (error) {
             console.error('API Request Error:', error);
             return { success: false, error: error.message };
@@ -76,20 +76,85 @@ class APIClient {
         });
     }
 
+    // Streams one record per finished symbol, then a summary record.
+    // onRecord is called with each parsed record as it arrives.
+    async scrapeBulkStream(symbols, headless = true, onRecord = () => {}) {
+        if (!configLoaded) {
+            await configPromise;
+        }
+
+        try {
+            const response = await fetch(`${API_BASE_URL}/scrapper/scrape-bulk/stream?format=ndjson`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    symbols,
+                    headless
+                }),
+            });
+
+            if (!response.ok) {
+                const data = await response.json();
+                throw new Error(data.detail || `HTTP error! status: ${response.status}`);
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            let summary = null;
+
+            const handleLine = (line) => {
+                if (!line.trim()) return;
+                const record = JSON.parse(line);
+                if (record.type === 'summary') summary = record.summary;
+                if (record.type === 'error') throw new Error(record.error);
+                onRecord(record);
+            };
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                lines.forEach(handleLine);
+            }
+            handleLine(buffer + decoder.decode());
+
+            return { success: true, data: summary };
+        } catch (error) {
+            console.error('API Stream Error:', error);
+            return { success: false, error: error.message };
+        }
+    }
+
     // Financial Data Endpoints
+    // data is the page of reports; total and nextCursor come from the
+    // X-Total-Count and X-Next-Cursor response headers
     async getReports(params = {}) {
         const queryParams = new URLSearchParams();
         
         if (params.symbol) queryParams.append('symbol', params.symbol);
         if (params.report_type) queryParams.append('report_type', params.report_type);
         if (params.report_year) queryParams.append('report_year', params.report_year);
+        if (params.report_quarter) queryParams.append('report_quarter', params.report_quarter);
+        if (params.is_audited != null) queryParams.append('is_audited', params.is_audited);
+        if (params.is_reviewed != null) queryParams.append('is_reviewed', params.is_reviewed);
+        if (params.sort) queryParams.append('sort', params.sort);
         if (params.limit) queryParams.append('limit', params.limit);
         if (params.offset) queryParams.append('offset', params.offset);
+        if (params.cursor) queryParams.append('cursor', params.cursor);
 
         const queryString = queryParams.toString();
         const endpoint = `/financial/reports${queryString ? '?' + queryString : ''}`;
-        
-        return this.request(endpoint);
+
+        const result = await this.request(endpoint);
+        if (result.success) {
+            result.total = parseInt(result.headers.get('X-Total-Count')) || 0;
+            result.nextCursor = result.headers.get('X-Next-Cursor');
+        }
+        return result;
     }
 
     async getReportById(id) {
@@ -221,21 +221,27 @@ async function handleStartScrape() {
             const symbols = symbolsData.map(s => s.symbol);
             logger.info(`Bulk scraping ${symbols.length} symbols...`);
             
-            const result = await api.scrapeBulk(symbols, headless);
-            
-            logger.info(`Bulk scrape completed: ${result.successful_symbols}/${result.total_symbols} successful`);
-            
-            if (result.results) {
-                result.results.forEach(r => {
-                    if (r.success) {
-                        logger.success(`✓ ${r.symbol}: ${r.reports_count} reports (${r.created_count} created, ${r.updated_count} updated)`);
-                    } else {
-                        logger.error(`✗ ${r.symbol}: ${r.message}`);
-                    }
-                });
+            // Results arrive one symbol at a time as they finish
+            const result = await api.scrapeBulkStream(symbols, headless, record => {
+                if (record.type !== 'result') return;
+
+                const r = record.result;
+                const progress = `[${record.done}/${record.total}]`;
+                if (r.success) {
+                    logger.success(`✓ ${progress} ${r.symbol}: ${r.reports_count} reports (${r.created_count} created, ${r.updated_count} updated)`);
+                } else {
+                    logger.error(`✗ ${progress} ${r.symbol}: ${r.message}`);
+                }
+            });
+
+            if (result.success) {
+                const summary = result.data;
+                logger.info(`Bulk scrape completed: ${summary.successful_symbols}/${summary.total_symbols} successful`);
+                showToast('success', `Completed: ${summary.successful_symbols}/${summary.total_symbols} symbols`);
+            } else {
+                logger.error(`Bulk scrape failed: ${result.error}`);
+                showToast('error', 'Bulk scrape failed');
             }
-            
-            showToast('success', `Completed: ${result.successful_symbols}/${result.total_symbols} symbols`);
         }
     } catch (error) {
         logger.error(`Scraping failed: ${error.message}`);
@@ -3,8 +3,16 @@
 // State
 let currentData = [];
 let filteredData = [];
+let totalCount = 0;
 let deleteTargetId = null;
 
+// Assurance filter values as API flags
+const ASSURANCE_FILTERS = {
+    audited: { is_audited: true },
+    reviewed: { is_reviewed: true },
+    both: { is_audited: true, is_reviewed: true },
+};
+
 // DOM Elements
 const filterSymbol = document.getElementById('filterSymbol');
 const filterType = document.getElementById('filterType');
@@ -54,10 +62,13 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 
 async function loadData() {
+    // Every filter is applied by the server
     const params = {
         symbol: filterSymbol.value.trim(),
         report_type: filterType.value,
         report_year: filterYear.value ? parseInt(filterYear.value) : null,
+        report_quarter: parseInt(filterQuarter.value) || null,
+        ...(ASSURANCE_FILTERS[filterAssurance.value] || {}),
         limit: parseInt(filterLimit.value),
     };
 
@@ -68,9 +79,10 @@ async function loadData() {
     if (result.success) {
         currentData = result.data;
         filteredData = currentData;
+        totalCount = result.total;
         renderTable();
         updateTableInfo();
-        showToast(`Loaded ${currentData.length} reports`, 'success');
+        showToast(`Loaded ${currentData.length} of ${totalCount} reports`, 'success');
     } else {
         showTableError(result.error);
         showToast('Failed to load data', 'error');
@@ -84,18 +96,18 @@ async function loadStats() {
         document.getElementById('totalReports').textContent = result.data.total_reports || 0;
     }
 
-    // Load detailed stats
-    const allResult = await api.getReports({ limit: 1000 });
-    if (allResult.success) {
-        const data = allResult.data;
-        const quarterly = data.filter(r => r.report_type === 'quarterly').length;
-        const annual = data.filter(r => r.report_type === 'annual').length;
-        const audited = data.filter(r => r.is_audited).length;
-
-        document.getElementById('quarterlyReports').textContent = quarterly;
-        document.getElementById('annualReports').textContent = annual;
-        document.getElementById('auditedReports').textContent = audited;
-    }
+    // Load detailed stats: only the totals are needed, so fetch one row each
+    const counts = {
+        quarterlyReports: { report_type: 'quarterly' },
+        annualReports: { report_type: 'annual' },
+        auditedReports: { is_audited: true },
+    };
+    await Promise.all(Object.entries(counts).map(async ([elementId, params]) => {
+        const countResult = await api.getReports({ ...params, limit: 1 });
+        if (countResult.success) {
+            document.getElementById(elementId).textContent = countResult.total;
+        }
+    }));
 }
 
 function renderTable() {
@@ -126,6 +138,7 @@ function renderTable() {
 
 function updateTableInfo() {
     document.getElementById('showingCount').textContent = filteredData.length;
+    document.getElementById('totalCount').textContent = totalCount;
 }
 
 function showTableLoading() {
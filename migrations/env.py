@@ -5,6 +5,10 @@ from sqlalchemy import pool
 
 from alembic import context
 
+from backend.core.config import settings
+from backend.database import models  # noqa: F401  (registers the tables)
+from backend.database.base import Base
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -14,11 +18,17 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+# The database is the one the application uses; '%' is escaped for the
+# ini-style interpolation of config options
+config.set_main_option(
+    "sqlalchemy.url", settings.get_database_url().replace("%", "%%")
+)
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-target_metadata = None
+target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -0,0 +1,98 @@
+"""financial_reports natural key and listing indexes
+
+Revision ID: ef7963b85dc8
+Revises:
+Create Date: 2026-10-16 21:10:00.000000
+
+Databases created before these indexes may hold several rows for the
+same (symbol, report_type, report_year, report_quarter). The unique index
+cannot be built over them, so duplicates are removed first, keeping the
+audited, then reviewed, then oldest row of each period (the rule the
+scraper applies within a listing). Statement items of removed rows are
+deleted with them, as the ORM cascade would.
+
+Databases created from the current models already have the indexes;
+they are skipped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef7963b85dc8'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NATURAL_KEY_INDEX = 'ux_financial_reports_natural_key'
+LISTING_INDEX = 'ix_financial_reports_listing'
+
+STATEMENT_TABLES = (
+    'balance_sheet_items',
+    'income_statement_items',
+    'cash_flow_statement_items',
+)
+
+COLLECT_DUPLICATES_SQL = """
+SELECT id INTO #duplicate_reports
+FROM (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY symbol, report_type, report_year, report_quarter
+        ORDER BY is_audited DESC, is_reviewed DESC, id
+    ) AS priority_rank
+    FROM financial_reports
+) AS ranked
+WHERE priority_rank > 1
+"""
+
+
+def _existing_indexes() -> set:
+    """Names of the indexes already on financial_reports."""
+    inspector = sa.inspect(op.get_bind())
+    return {
+        index['name'] for index in inspector.get_indexes('financial_reports')
+    }
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = _existing_indexes()
+
+    if NATURAL_KEY_INDEX not in existing:
+        op.execute(COLLECT_DUPLICATES_SQL)
+        for table in STATEMENT_TABLES:
+            op.execute(
+                f"DELETE FROM {table} "
+                "WHERE report_id IN (SELECT id FROM #duplicate_reports)"
+            )
+        op.execute(
+            "DELETE FROM financial_reports "
+            "WHERE id IN (SELECT id FROM #duplicate_reports)"
+        )
+        op.execute("DROP TABLE #duplicate_reports")
+
+        op.create_index(
+            NATURAL_KEY_INDEX,
+            'financial_reports',
+            ['symbol', 'report_type', 'report_year', 'report_quarter'],
+            unique=True
+        )
+
+    if LISTING_INDEX not in existing:
+        op.create_index(
+            LISTING_INDEX,
+            'financial_reports',
+            ['symbol', sa.text('report_year DESC'), 'report_quarter'],
+            mssql_include=[
+                'company_name', 'report_name', 'report_type',
+                'is_audited', 'is_reviewed', 'report_url'
+            ]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(LISTING_INDEX, table_name='financial_reports')
+    op.drop_index(NATURAL_KEY_INDEX, table_name='financial_reports')
@@ -0,0 +1,54 @@
+"""
+Shared test setup.
+
+The backend loads its settings on import and requires a few values that
+only matter to a deployment. Placeholders are set here unless the
+environment (or a ``.env`` file) already provides them.
+"""
+
+import os
+import pytest
+
+REQUIRED_SETTINGS = (
+    "APP_NAME",
+    "APP_VER",
+    "DB_NAME",
+    "DB_HOST",
+    "DB_USER",
+    "DB_PASSWORD",
+    "SECRET_KEY",
+    "GEMINI_API",
+    "GEMINI_MODEL",
+    "LM_STUDIO_URL",
+    "LM_STUDIO_MODEL",
+)
+
+for name in REQUIRED_SETTINGS:
+    os.environ.setdefault(name, "test")
+
+
+@pytest.fixture
+def scraper_state(tmp_path, monkeypatch):
+    """Fresh scraper caches and breakers kept under a temporary directory.
+
+    The HTTP cache is disabled, and the exchange resolver, no-data cache
+    and circuit breakers are replaced by empty ones for the test.
+    """
+    from backend.core import settings
+    from backend.services.cache import KeyValueStore
+    from backend.services.scrappers import exchange, resilience
+
+    monkeypatch.setattr(settings, "STATE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "HTTP_CACHE_ENABLED", False)
+    monkeypatch.setattr(
+        exchange, "_resolver", exchange.ExchangeResolver(
+            KeyValueStore(tmp_path / "state.db", "exchange_resolution")
+        )
+    )
+    monkeypatch.setattr(
+        resilience, "_no_data", resilience.NoDataCache(
+            KeyValueStore(tmp_path / "state.db", "no_data_symbols")
+        )
+    )
+    monkeypatch.setattr(resilience, "_breakers", {})
+    return tmp_path
@@ -0,0 +1,56 @@
+"""Handing work from a producer to the bulk engine's workers."""
+
+import threading
+import pytest
+from backend.services.scrappers.bulk import BulkScrapeEngine
+
+
+def test_slow_tasks_do_not_hold_up_the_source():
+    release = threading.Event()
+    produced = []
+
+    def source():
+        for symbol in ("FPT", "SHS", "ACV"):
+            produced.append(symbol)
+            yield symbol, symbol.lower()
+        # Every item was drawn while the first task was still storing
+        release.set()
+
+    def task(symbol, item):
+        assert release.wait(timeout=5)
+        return item
+
+    results = dict(BulkScrapeEngine(max_workers=1).process(source(), task))
+
+    assert produced == ["FPT", "SHS", "ACV"]
+    assert results == {"FPT": "fpt", "SHS": "shs", "ACV": "acv"}
+
+
+def test_source_error_is_raised():
+    def source():
+        yield "FPT", 1
+        raise RuntimeError("browser crashed")
+
+    with pytest.raises(RuntimeError, match="browser crashed"):
+        list(BulkScrapeEngine(max_workers=2).process(
+            source(), lambda symbol, item: item
+        ))
+
+
+def test_stopping_early_closes_the_source():
+    closed = threading.Event()
+
+    def source():
+        try:
+            for index in range(100):
+                yield f"S{index}", index
+        finally:
+            closed.set()
+
+    results = BulkScrapeEngine(max_workers=2).process(
+        source(), lambda symbol, item: item
+    )
+    next(results)
+    results.close()
+
+    assert closed.is_set()
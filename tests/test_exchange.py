@@ -0,0 +1,140 @@
+"""Exchange learning and negative caching of unresolved symbols."""
+
+import time
+from types import SimpleNamespace
+import pytest
+from backend.core import settings
+from backend.services.cache import KeyValueStore
+from backend.services.scrappers import cafef, fetch
+from backend.services.scrappers.exchange import ExchangeResolver
+from backend.services.scrappers.http_client import Page
+from backend.services.scrappers.resilience import (
+    NoDataError,
+    cafef_breaker
+)
+from backend.services.scrappers.tabs import TabbedCafeFScraper
+
+HOME = "https://cafef.vn/"
+
+
+def listing(exchange: str, symbol: str) -> str:
+    """CafeF listing URL of a symbol."""
+    return f"{HOME}du-lieu/{exchange}/{symbol}-bao-cao-tai-chinh.chn"
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CAFEF_BASE_URL", "https://cafef.vn")
+    return ExchangeResolver(
+        KeyValueStore(tmp_path / "state.db", "exchange_resolution"),
+        negative_ttl=60
+    )
+
+
+def test_learned_exchange_is_used(resolver):
+    resolver.learn("SHS", listing("hnx", "shs"))
+
+    assert resolver.resolve("shs") == "hnx"
+    assert resolver.listing_url("SHS") == listing("hnx", "shs")
+    resolver.check("SHS")
+
+
+def test_listing_without_exchange_is_cached_as_unresolved(resolver):
+    resolver.learn("XXX", HOME)
+
+    assert resolver.resolve("XXX") is None
+    with pytest.raises(NoDataError):
+        resolver.check("XXX")
+    stats = resolver.stats()
+    assert stats["unresolved"] == 1
+    assert stats["negative_hits"] == 2
+
+    # A later listing under an exchange replaces the negative entry
+    resolver.learn("XXX", listing("upcom", "xxx"))
+    resolver.check("XXX")
+    assert resolver.resolve("XXX") == "upcom"
+
+
+def test_unresolved_entry_is_persisted(resolver, tmp_path):
+    resolver.learn("XXX", HOME)
+
+    reopened = ExchangeResolver(
+        KeyValueStore(tmp_path / "state.db", "exchange_resolution")
+    )
+    with pytest.raises(NoDataError):
+        reopened.check("XXX")
+
+
+def test_unresolved_entry_expires(resolver):
+    resolver.negative_ttl = 0.05
+    resolver.learn("XXX", HOME)
+    time.sleep(0.1)
+
+    resolver.check("XXX")
+    assert resolver.resolve("XXX") is None
+
+
+@pytest.mark.parametrize("url", [None, "", "about:blank", "https://x.vn/"])
+def test_urls_off_cafef_are_ignored(resolver, url):
+    resolver.learn("FPT", url)
+
+    resolver.check("FPT")
+    assert resolver.stats()["unresolved"] == 0
+
+
+class RedirectingClient:
+    """HttpClient whose listings all land on the CafeF home page."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def get_page(self, url, ttl=None, before_request=None):
+        before_request()
+        self.requests += 1
+        return Page("<html><body>Trang chủ</body></html>", HOME, 200, False)
+
+
+def test_fetch_skips_unresolved_symbol(scraper_state, monkeypatch):
+    monkeypatch.setattr(settings, "CAFEF_BASE_URL", "https://cafef.vn")
+    client = RedirectingClient()
+    monkeypatch.setattr(cafef, "get_http_client", lambda: client)
+
+    with pytest.raises(NoDataError):
+        fetch.fetch_reports("XXX", fetch_mode="auto")
+    assert client.requests == 1
+
+    with pytest.raises(NoDataError):
+        fetch.fetch_reports("XXX", fetch_mode="auto")
+    assert client.requests == 1
+
+
+class RedirectingDriver:
+    """WebDriver whose listings all land on the CafeF home page."""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.current_window_handle = "tab-0"
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+
+    def execute_script(self, script, *args):
+        if script == TabbedCafeFScraper.NAVIGATE_SCRIPT:
+            previous, self.current_url = self.current_url, HOME
+            return previous
+        if script == TabbedCafeFScraper.TAB_READY_SCRIPT:
+            return [self.current_url, True, None]
+        raise AssertionError(f"Unexpected script: {script}")
+
+
+def test_tab_redirected_off_listing_is_unresolved(scraper_state, monkeypatch):
+    monkeypatch.setattr(settings, "CAFEF_BASE_URL", "https://cafef.vn")
+    scraper = TabbedCafeFScraper(tabs=1)
+    scraper.EMPTY_GRACE = 0.05
+    scraper.driver = RedirectingDriver()
+
+    (symbol, reports, error), = scraper.iter_symbols(["XXX"])
+    assert (symbol, reports) == ("XXX", None)
+    assert isinstance(error, ValueError)
+    assert cafef_breaker().stats()["failures"] == 0
+
+    (_, _, error), = scraper.iter_symbols(["XXX"])
+    assert isinstance(error, NoDataError)
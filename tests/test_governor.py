@@ -0,0 +1,96 @@
+"""Cleanup of browser processes left behind by failed scrapes."""
+
+import os
+import subprocess
+import sys
+import time
+import psutil
+import pytest
+from backend.services.scrappers import governor
+from backend.services.scrappers.base import BaseScraper
+from backend.services.scrappers.governor import (
+    kill_process_tree,
+    marker_argument,
+    reap_orphans,
+    track_driver,
+    untrack_driver
+)
+
+SLEEP = "import time; time.sleep(60)"
+
+# A "chromedriver" starting a child "browser" and waiting on it
+PARENT = (
+    "import subprocess, sys; "
+    f"subprocess.Popen([sys.executable, '-c', {SLEEP!r}]).wait()"
+)
+
+
+@pytest.fixture
+def spawn():
+    started = []
+
+    def run(code: str, *arguments: str) -> subprocess.Popen:
+        process = subprocess.Popen([sys.executable, "-c", code, *arguments])
+        started.append(process)
+        return process
+
+    yield run
+    for process in started:
+        kill_process_tree(process.pid, timeout=1)
+        process.wait()
+
+
+@pytest.fixture
+def no_grace(monkeypatch):
+    monkeypatch.setattr(governor, "ORPHAN_GRACE", 0.0)
+
+
+def test_untracked_browser_of_this_process_is_reaped(spawn, no_grace):
+    browser = spawn(SLEEP, marker_argument())
+
+    assert reap_orphans() == 1
+    assert browser.wait(timeout=5) is not None
+
+
+def test_tracked_browser_is_kept(spawn, no_grace):
+    # The test process stands in for the browser's chromedriver
+    browser = spawn(SLEEP, marker_argument())
+    track_driver(os.getpid())
+    try:
+        assert reap_orphans() == 0
+        assert browser.poll() is None
+    finally:
+        untrack_driver(os.getpid())
+
+
+def test_starting_browser_is_kept(spawn):
+    browser = spawn(SLEEP, marker_argument())
+
+    assert reap_orphans() == 0
+    assert browser.poll() is None
+
+
+class FailingDriver:
+    """WebDriver whose quit fails and leaves its processes running."""
+
+    def quit(self):
+        raise RuntimeError("chromedriver is not responding")
+
+
+def test_failed_quit_kills_the_driver_tree(spawn):
+    driver = spawn(PARENT)
+    deadline = time.monotonic() + 5
+    while not psutil.Process(driver.pid).children():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    browser, = psutil.Process(driver.pid).children()
+
+    scraper = BaseScraper()
+    scraper.driver = FailingDriver()
+    scraper.driver_pid = driver.pid
+    track_driver(driver.pid)
+    scraper.quit()
+
+    assert driver.wait(timeout=5) is not None
+    assert not browser.is_running()
+    assert driver.pid not in governor._tracked
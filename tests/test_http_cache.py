@@ -0,0 +1,51 @@
+"""Eviction of the content-addressed HTTP cache."""
+
+from backend.services.cache import HttpCache
+
+
+def blobs(cache: HttpCache) -> list:
+    """Blob files on disk."""
+    return [path for path in cache.blob_dir.rglob("*") if path.is_file()]
+
+
+def test_shared_blob_freed_with_its_last_entry(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes=10**6)
+    shared = b"s" * 400
+    cache.put("https://a/1", shared, ttl=60)
+    cache.put("https://a/2", shared, ttl=60)
+    cache.put("https://a/3", b"u" * 400, ttl=60)
+    assert cache.total_bytes() == 800
+
+    # Dropping the oldest entry frees nothing: its blob is still shared
+    cache.max_bytes = 799
+    assert cache.evict() == 2
+    assert cache.get("https://a/1") is None
+    assert cache.get("https://a/2") is None
+    assert cache.get("https://a/3").content == b"u" * 400
+    assert len(blobs(cache)) == 1
+    assert cache.total_bytes() == 400
+
+
+def test_evict_keeps_blob_of_remaining_entry(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes=10**6)
+    shared = b"s" * 400
+    cache.put("https://a/1", shared, ttl=60)
+    cache.put("https://a/2", b"u" * 400, ttl=60)
+    cache.put("https://a/3", shared, ttl=60)
+
+    cache.max_bytes = 799
+    assert cache.evict() == 2
+    assert cache.get("https://a/3").content == shared
+    assert len(blobs(cache)) == 1
+
+
+def test_evict_stops_once_under_limit(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes=10**6)
+    for index in range(5):
+        cache.put(f"https://a/{index}", bytes([index]) * 100, ttl=60)
+
+    cache.max_bytes = 250
+    assert cache.evict() == 3
+    assert cache.total_bytes() == 200
+    assert len(blobs(cache)) == 2
+    assert cache.stats()["evictions"] == 3
@@ -0,0 +1,83 @@
+"""CafeF circuit breaker around browser-less listing fetches."""
+
+import time
+import pytest
+from backend.core import settings
+from backend.services.cache import HttpCache
+from backend.services.scrappers.cafef import CafeFScraper
+from backend.services.scrappers.http_client import HttpClient
+from backend.services.scrappers.resilience import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitOpenError,
+    cafef_breaker
+)
+from benchmarks.fixtures import load_listing_pages
+
+
+class OfflineClient(HttpClient):
+    """HttpClient that must be served from its cache."""
+
+    def __init__(self, cache: HttpCache):
+        super().__init__(cache=cache)
+        self.requests = 0
+
+    def _fetch(self, url, headers):
+        self.requests += 1
+        raise AssertionError(f"Unexpected request to {url}")
+
+
+@pytest.fixture
+def client(scraper_state, monkeypatch):
+    """Client whose cache holds a fresh copy of FPT's listing."""
+    monkeypatch.setattr(settings, "CAFEF_BASE_URL", "https://cafef.vn")
+    monkeypatch.setattr(settings, "SCRAPER_BREAKER_MIN_CALLS", 1)
+    monkeypatch.setattr(settings, "SCRAPER_BREAKER_COOLDOWN", 0.05)
+
+    cache = HttpCache(scraper_state / "http", max_bytes=10**7)
+    cache.put(
+        CafeFScraper.listing_url("FPT"),
+        load_listing_pages()["FPT"].encode("utf-8"),
+        ttl=60,
+        content_type="text/html; charset=utf-8",
+        encoding="utf-8"
+    )
+    return OfflineClient(cache)
+
+
+def test_cached_listing_is_served_while_circuit_is_open(client):
+    breaker = cafef_breaker()
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+
+    reports = CafeFScraper().fetch_listing_http("FPT", client=client)
+
+    assert reports
+    assert client.requests == 0
+    assert breaker.stats()["rejected"] == 0
+    assert breaker.state == STATE_OPEN
+
+
+def test_cached_listing_does_not_use_up_the_trial(client):
+    breaker = cafef_breaker()
+    breaker.record_failure()
+    time.sleep(0.1)
+    assert breaker.state == STATE_HALF_OPEN
+
+    assert CafeFScraper().fetch_listing_http("FPT", client=client)
+
+    # The breaker is untouched: still half-open, trial still available
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.stats()["successes"] == 0
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+
+
+def test_uncached_listing_is_rejected_while_circuit_is_open(client):
+    cafef_breaker().record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        CafeFScraper().fetch_listing_http("SHS", client=client)
+    assert client.requests == 0
@@ -0,0 +1,209 @@
+"""Equivalence of ``process_reports`` with the previous pandas version.
+
+The oracle is the baseline code itself (``tests/pandas_baseline.py``).
+Its priority sort is pandas' default quicksort, which is not stable, so
+which of two equally ranked duplicates it keeps is arbitrary. Listings
+compared row for row therefore contain no equally ranked rows of one
+period; listings with such ties are compared on everything but the
+choice among them, which ``process_reports`` makes by listing order.
+"""
+
+import random
+from typing import List, Optional, Sequence, Tuple
+import pytest
+from backend.services.processors import process_reports
+from backend.services.records import RawReport
+from backend.services.scrappers.parsing import build_reports
+from tests import pandas_baseline
+
+NAMES = (
+    "Báo cáo tài chính hợp nhất",
+    "Báo cáo tài chính hợp nhất (đã kiểm toán)",
+    "Báo cáo tài chính hợp nhất (đã soát xét)",
+    "Báo cáo tài chính hợp nhất đã kiểm toán và soát xét",
+    "Báo cáo tài chính công ty mẹ",
+    "Báo cáo thường niên",
+    "",
+    None,
+)
+
+PERIODS = (
+    "Q1/2024", "Q2/2024", "Q3/2024", "Q4/2024", "CN/2024", "NAM/2023",
+    "YEAR/2022", "Q5/2024", "X/2023", "Q1/abcd", "2024", "", None,
+)
+
+Row = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def baseline(reports: List[RawReport]) -> List[dict]:
+    """Output of the pandas version on the same rows."""
+    return pandas_baseline.process_reports(
+        [report._asdict() for report in reports]
+    )
+
+
+def processed(reports: List[RawReport]) -> List[dict]:
+    """Output of ``process_reports`` as dicts, checking integer periods."""
+    records = process_reports(reports)
+    for record in records:
+        for value in (record.report_year, record.report_quarter):
+            assert value is None or isinstance(value, int)
+    return [record._asdict() for record in records]
+
+
+def _rank(report_name: str) -> Tuple[bool, bool]:
+    """Audit and review flags the baseline gives a name."""
+    status = pandas_baseline.determine_audit_status(report_name)
+    return status["is_audited"], status["is_reviewed"]
+
+
+def without_ties(rows: Sequence[Row]) -> List[Row]:
+    """Drop rows ranked equally with an earlier row of the same period.
+
+    Rows of one (year, quarter) are ordered by rank alone in the baseline,
+    whatever their report type, so the period is taken as year and quarter.
+    """
+    seen = set()
+    kept = []
+    for name, report_time, url in rows:
+        if name and "mẹ" not in name.lower():
+            period = pandas_baseline.parse_report_time(report_time)
+            key = (
+                period["report_year"], period["report_quarter"],
+                _rank(name)
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append((name, report_time, url))
+    return kept
+
+
+def outline(rows: List[dict]) -> List[Tuple]:
+    """Rows without the fields that differ between tied duplicates."""
+    return sorted(
+        (
+            row["report_type"] or "", row["report_year"] or 0,
+            row["report_quarter"] or 0, row["is_audited"], row["is_reviewed"]
+        )
+        for row in rows
+    )
+
+
+def test_duplicates_keep_audited_then_reviewed():
+    reports = build_reports("FPT", "cty fpt", [
+        ("BCTC hợp nhất", "Q1/2024", "//cdn/plain.pdf"),
+        ("BCTC hợp nhất (đã soát xét)", "Q1/2024", "//cdn/rev.pdf"),
+        ("BCTC hợp nhất (đã kiểm toán)", "Q1/2024", "//cdn/aud.pdf"),
+        ("BCTC hợp nhất (đã soát xét)", "Q2/2024", "//cdn/rev2.pdf"),
+        ("BCTC hợp nhất", "Q2/2024", "//cdn/plain2.pdf"),
+        ("BCTC hợp nhất", "CN/2023", "//cdn/annual.pdf"),
+    ])
+
+    assert processed(reports) == baseline(reports)
+    urls = [report.report_url for report in process_reports(reports)]
+    assert urls == [
+        "https://cdn/aud.pdf", "https://cdn/rev2.pdf", "https://cdn/annual.pdf"
+    ]
+
+
+def test_equal_duplicates_keep_the_first_listed():
+    reports = build_reports("HPG", "cty hpg", [
+        ("BCTC (đã soát xét)", "Q2/2024", "//cdn/rev1.pdf"),
+        ("BCTC (đã soát xét)", "Q2/2024", "//cdn/rev2.pdf"),
+        ("BCTC đã kiểm toán và soát xét", "CN/2023", "//cdn/both1.pdf"),
+        ("BCTC (đã kiểm toán)", "CN/2023", "//cdn/aud.pdf"),
+        ("BCTC đã kiểm toán và soát xét", "CN/2023", "//cdn/both2.pdf"),
+    ])
+
+    assert outline(processed(reports)) == outline(baseline(reports))
+    urls = [report.report_url for report in process_reports(reports)]
+    assert urls == ["https://cdn/rev1.pdf", "https://cdn/both1.pdf"]
+
+
+def test_annual_and_quarterly_of_one_year_are_kept_apart():
+    reports = build_reports("VCB", "cty vcb", [
+        ("BCTC", "Q4/2024", "//cdn/q4.pdf"),
+        ("BCTC (đã kiểm toán)", "CN/2024", "//cdn/cn.pdf"),
+        ("BCTC", "Q1/2024", "//cdn/q1.pdf"),
+        ("BCTC", "Q1/2025", "//cdn/q1_2025.pdf"),
+    ])
+
+    assert processed(reports) == baseline(reports)
+    periods = [
+        (report.report_type, report.report_year, report.report_quarter)
+        for report in process_reports(reports)
+    ]
+    assert periods == [
+        ("quarterly", 2025, 1),
+        ("quarterly", 2024, 1),
+        ("quarterly", 2024, 4),
+        ("annual", 2024, None),
+    ]
+
+
+def test_missing_fields_and_unknown_periods():
+    reports = build_reports("VNM", None, [
+        ("Nghị quyết đại hội cổ đông", "2024", None),
+        ("Báo cáo thường niên (đã soát xét)", "X/2023", "//cdn/a.pdf"),
+        ("Báo cáo thường niên", "Q5/2022", "//cdn/b.pdf"),
+        ("Báo cáo tài chính công ty mẹ", "Q1/2024", "//cdn/c.pdf"),
+        (None, "Q2/2024", "//cdn/d.pdf"),
+        ("", "Q3/2024", "//cdn/e.pdf"),
+        ("Báo cáo tài chính", None, "//cdn/f.pdf"),
+        ("Báo cáo tài chính (đã kiểm toán)", "Q1/abcd", None),
+    ])
+
+    assert processed(reports) == baseline(reports)
+
+
+def test_only_parent_company_reports():
+    reports = build_reports("ABC", "c", [
+        ("Báo cáo tài chính công ty mẹ", "Q1/2024", "//cdn/a.pdf"),
+        ("Báo cáo tài chính công ty mẹ (đã kiểm toán)", "Q2/2024", None),
+    ])
+
+    assert processed(reports) == baseline(reports) == []
+
+
+def test_names_without_diacritics_are_recognized():
+    # Deliberately beyond the baseline, which only matched accented names
+    reports = build_reports("SSI", "c", [
+        ("Bao cao tai chinh cong ty me", "Q1/2024", "//cdn/me.pdf"),
+        ("Bao cao tai chinh", "Q2/2024", "//cdn/plain.pdf"),
+        ("Bao cao tai chinh da kiem toan", "Q2/2024", "//cdn/aud.pdf"),
+    ])
+
+    records = process_reports(reports)
+    assert [(r.report_url, r.is_audited) for r in records] == [
+        ("https://cdn/aud.pdf", True)
+    ]
+
+
+def random_rows(seed: int) -> List[Row]:
+    """Seeded listing rows mixing names, periods and missing values."""
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(NAMES),
+            rng.choice(PERIODS),
+            rng.choice((f"//cdn/{seed}_{row}.pdf", None))
+        )
+        for row in range(rng.randint(1, 60))
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_listings(seed):
+    reports = build_reports(
+        f"S{seed:03d}", f"công ty s{seed:03d}", without_ties(random_rows(seed))
+    )
+
+    assert processed(reports) == baseline(reports)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_listings_with_ties(seed):
+    reports = build_reports(f"S{seed:03d}", None, random_rows(seed))
+
+    assert outline(processed(reports)) == outline(baseline(reports))
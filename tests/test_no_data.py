@@ -0,0 +1,158 @@
+"""Symbols without report data are cached, not retried or counted."""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+import pytest
+from backend.services.scrappers import fetch
+from backend.services.scrappers.cafef import CafeFScraper
+from backend.services.scrappers.http_client import Page
+from backend.services.scrappers.resilience import (
+    NoDataError,
+    cafef_breaker,
+    get_no_data_cache
+)
+from backend.services.scrappers.tabs import TabbedCafeFScraper
+
+
+class FakeDriver:
+    """WebDriver serving loaded listing pages with a fixed report table.
+
+    ``rows`` is None for a page without the report table, else the rows
+    of the table.
+    """
+
+    def __init__(self, rows=None):
+        self.rows = rows
+        self.current_url = "about:blank"
+        self.current_window_handle = "tab-0"
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+        self.loads = 0
+
+    def get(self, url):
+        self.current_url = url
+        self.loads += 1
+
+    def execute_script(self, script, *args):
+        rows = None if self.rows is None else len(self.rows)
+        if script == CafeFScraper.READY_SCRIPT:
+            return [True, rows]
+        if script == TabbedCafeFScraper.TAB_READY_SCRIPT:
+            return [self.current_url, True, rows]
+        if script == CafeFScraper.EXTRACT_SCRIPT:
+            if self.rows is None:
+                return None
+            return {"company": "Company", "rows": self.rows}
+        if script == TabbedCafeFScraper.NAVIGATE_SCRIPT:
+            previous = self.current_url
+            self.get(args[0])
+            return previous
+        raise AssertionError(f"Unexpected script: {script}")
+
+
+class FakeClient:
+    """HttpClient answering every listing with the same status."""
+
+    def __init__(self, status):
+        self.status = status
+
+    def get_page(self, url, ttl=None, before_request=None):
+        before_request()
+        return Page(None, None, self.status, False)
+
+
+def fake_pool(driver):
+    """Pool leasing one scraper bound to ``driver``."""
+
+    class Pool:
+        leases = 0
+
+        @contextmanager
+        def lease(self):
+            Pool.leases += 1
+            scraper = CafeFScraper()
+            scraper.EMPTY_GRACE = 0.05
+            scraper.driver = driver
+            yield scraper
+
+    return Pool()
+
+
+def test_browser_page_without_table_is_cached(scraper_state, monkeypatch):
+    driver = FakeDriver(rows=None)
+    pool = fake_pool(driver)
+    monkeypatch.setattr(fetch, "get_driver_pool", lambda headless: pool)
+
+    with pytest.raises(ValueError):
+        fetch.fetch_reports("XXX", fetch_mode="browser")
+
+    # One load, no retries, and the host is not blamed
+    assert pool.leases == 1
+    assert driver.loads == 1
+    stats = cafef_breaker().stats()
+    assert stats["failures"] == 0
+
+    with pytest.raises(NoDataError):
+        fetch.fetch_reports("XXX", fetch_mode="browser")
+    assert pool.leases == 1
+
+
+def test_browser_page_with_empty_table_is_cached(scraper_state, monkeypatch):
+    pool = fake_pool(FakeDriver(rows=[]))
+    monkeypatch.setattr(fetch, "get_driver_pool", lambda headless: pool)
+
+    with pytest.raises(ValueError):
+        fetch.fetch_reports("XXX", fetch_mode="browser")
+    assert cafef_breaker().stats()["failures"] == 0
+    with pytest.raises(NoDataError):
+        get_no_data_cache().check("XXX")
+
+
+def test_browser_page_with_rows_is_scraped(scraper_state, monkeypatch):
+    rows = [["Báo cáo tài chính", "Q1/2025", "//cdn/a.pdf"]]
+    monkeypatch.setattr(
+        fetch, "get_driver_pool", lambda headless: fake_pool(FakeDriver(rows))
+    )
+
+    reports, source = fetch.fetch_reports("FPT", fetch_mode="browser")
+    assert source == fetch.SOURCE_BROWSER
+    assert reports[0].report_url == "https://cdn/a.pdf"
+    assert cafef_breaker().stats()["successes"] == 1
+
+
+def test_tab_without_table_is_cached(scraper_state):
+    scraper = TabbedCafeFScraper(tabs=1)
+    scraper.EMPTY_GRACE = 0.05
+    scraper.driver = FakeDriver(rows=None)
+
+    results = list(scraper.iter_symbols(["XXX"]))
+
+    assert [(symbol, reports) for symbol, reports, _ in results] == [
+        ("XXX", None)
+    ]
+    assert isinstance(results[0][2], ValueError)
+    assert cafef_breaker().stats()["failures"] == 0
+    with pytest.raises(NoDataError):
+        get_no_data_cache().check("XXX")
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_http_client_error_is_cached(scraper_state, status):
+    assert CafeFScraper().fetch_listing_http(
+        "XXX", client=FakeClient(status)
+    ) is None
+
+    stats = cafef_breaker().stats()
+    assert (stats["successes"], stats["failures"]) == (1, 0)
+    with pytest.raises(NoDataError):
+        get_no_data_cache().check("XXX")
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_http_server_error_counts_as_failure(scraper_state, status):
+    assert CafeFScraper().fetch_listing_http(
+        "XXX", client=FakeClient(status)
+    ) is None
+
+    stats = cafef_breaker().stats()
+    assert (stats["successes"], stats["failures"]) == (0, 1)
+    get_no_data_cache().check("XXX")
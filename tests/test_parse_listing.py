@@ -0,0 +1,41 @@
+"""Listing parsers on the saved CafeF pages."""
+
+import pytest
+from backend.services.scrappers.parsing import parse_report_listing
+from benchmarks.fixtures import load_listing_pages
+from benchmarks.parse_listing import PARSERS, parse_full_soup
+
+PAGES = load_listing_pages()
+
+
+@pytest.mark.parametrize("symbol", ["FPT", "SHS", "ACV"])
+def test_parsers_agree_on_saved_listing(symbol):
+    html = PAGES[symbol]
+    expected = parse_full_soup(html, symbol)
+
+    assert expected
+    for name, parse in PARSERS.items():
+        rows = [
+            row if isinstance(row, dict) else row._asdict()
+            for row in parse(html, symbol)
+        ]
+        assert rows == expected, name
+
+
+def test_saved_listing_rows():
+    reports = parse_report_listing(PAGES["SHS"], "SHS")
+
+    assert reports[0].company_name == (
+        "công ty cổ phần chứng khoán sài gòn - hà nội"
+    )
+    assert {report.symbol for report in reports} == {"shs"}
+    assert all(report.report_url.startswith("https://") for report in reports)
+    assert ("báo cáo tài chính năm 2021 (điều chỉnh)", "cn/2021") in {
+        (report.report_name, report.report_time) for report in reports
+    }
+
+
+def test_listing_without_table_is_rejected():
+    for parse in PARSERS.values():
+        with pytest.raises(ValueError):
+            parse(PAGES["XXX"], "XXX")
@@ -0,0 +1,128 @@
+"""Traffic savings of browsing profiles and their Chrome options."""
+
+import json
+import pytest
+from selenium.webdriver.chrome.options import Options
+from backend.services.scrappers import profile
+from backend.services.scrappers.profile import BrowsingProfile, TrafficStats
+
+
+def event(method: str, **params) -> dict:
+    """Performance log entry of a DevTools event."""
+    return {"message": json.dumps({
+        "message": {"method": method, "params": params}
+    })}
+
+
+def loaded(request_id: str, resource_type: str, size: int) -> list:
+    """Events of a request that was sent and loaded."""
+    return [
+        event(
+            "Network.requestWillBeSent",
+            requestId=request_id, type=resource_type
+        ),
+        event(
+            "Network.loadingFinished",
+            requestId=request_id, encodedDataLength=size
+        ),
+    ]
+
+
+def blocked(request_id: str, resource_type: str) -> list:
+    """Events of a request blocked by URL pattern."""
+    return [
+        event(
+            "Network.requestWillBeSent",
+            requestId=request_id, type=resource_type
+        ),
+        event(
+            "Network.loadingFailed", requestId=request_id,
+            type=resource_type, blockedReason="inspector"
+        ),
+    ]
+
+
+class LogDriver:
+    """WebDriver returning a fixed performance log."""
+
+    def __init__(self, entries: list):
+        self.entries = entries
+
+    def get_log(self, log_type: str) -> list:
+        assert log_type == "performance"
+        return self.entries
+
+
+@pytest.fixture(autouse=True)
+def traffic(monkeypatch):
+    stats = TrafficStats()
+    monkeypatch.setattr(profile, "_traffic", stats)
+    return stats
+
+
+def test_savings_need_no_full_page_of_the_url():
+    lean = BrowsingProfile.lean(capture_traffic=True)
+    page = LogDriver(
+        loaded("1", "Document", 50_000)
+        + loaded("2", "Script", 20_000)
+        + loaded("3", "Font", 30_000)
+        + blocked("4", "Script")
+        + blocked("5", "Script")
+        + blocked("6", "Font")
+    )
+
+    traffic = lean.read_traffic(page)
+
+    assert traffic["requests"] == 3
+    assert traffic["bytes"] == 100_000
+    assert traffic["blocked_by_type"] == {"Script": 2, "Font": 1}
+    assert traffic["requests_saved"] == 3
+    assert traffic["bytes_saved"] == 2 * 20_000 + 30_000
+
+
+def test_bytes_unknown_until_a_type_was_measured(traffic):
+    lean = BrowsingProfile.lean(capture_traffic=True)
+
+    first = lean.read_traffic(LogDriver(
+        loaded("1", "Document", 50_000) + blocked("2", "Font")
+    ))
+    assert first["requests_saved"] == 1
+    assert first["bytes_saved"] is None
+
+    # Fonts measured on any page, e.g. by the full profile
+    BrowsingProfile.full(capture_traffic=True).read_traffic(LogDriver(
+        loaded("1", "Font", 10_000) + loaded("2", "Font", 30_000)
+    ))
+    second = lean.read_traffic(LogDriver(
+        loaded("1", "Document", 50_000) + blocked("2", "Font")
+    ))
+    assert second["bytes_saved"] == 20_000
+
+    stats = traffic.stats()["lean"]
+    assert stats["pages"] == 2
+    assert stats["requests_saved"] == 2
+    assert stats["bytes_saved"] == 20_000
+    assert stats["estimated_pages"] == 1
+    assert stats["blocked_by_type"] == {"Font": 2}
+
+
+def test_no_traffic_without_capture():
+    lean = BrowsingProfile.lean(capture_traffic=False)
+    assert lean.read_traffic(LogDriver(blocked("1", "Font"))) is None
+
+
+@pytest.mark.parametrize("name", ["full", "lean"])
+def test_extras_follow_the_profile(name):
+    options = Options()
+    browsing = getattr(BrowsingProfile, name)(capture_traffic=False)
+    browsing.apply_options(options)
+
+    extras = {"--disable-extensions", "--mute-audio"}
+    assert (extras <= set(options.arguments)) == (name == "lean")
+
+    # Blocking URL patterns alone does not change Chrome's flags
+    options = Options()
+    BrowsingProfile("custom", blocked_patterns=["*.woff"]).apply_options(
+        options
+    )
+    assert not extras & set(options.arguments)
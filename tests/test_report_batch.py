@@ -0,0 +1,103 @@
+"""``process_report_batch`` slices equal ``process_reports`` per symbol."""
+
+import random
+from typing import List
+import pytest
+from backend.services.processors import (
+    ReportColumns,
+    columns_from_reports,
+    process_report_batch,
+    process_reports
+)
+from backend.services.records import RawReport
+from backend.services.scrappers.parsing import build_reports
+
+NAMES = (
+    "Báo cáo tài chính hợp nhất",
+    "Báo cáo tài chính hợp nhất (đã kiểm toán)",
+    "Báo cáo tài chính hợp nhất (đã soát xét)",
+    "Bao cao tai chinh da kiem toan",
+    "Báo cáo tài chính công ty mẹ",
+    "Bao cao tai chinh cong ty me",
+    "",
+    None,
+)
+
+PERIODS = (
+    "Q1/2024", "Q2/2024", "Q4/2023", "CN/2024", "NAM/2023", "Q5/2024",
+    "X/2023", "Q1/abcd", "2024", "", None,
+)
+
+
+def random_listing(symbol: str, rng: random.Random) -> List[RawReport]:
+    """Seeded listing of one symbol with duplicates and bad values."""
+    return build_reports(symbol, rng.choice((f"cty {symbol}", None)), [
+        (
+            rng.choice(NAMES),
+            rng.choice(PERIODS),
+            rng.choice((f"//cdn/{symbol}_{row}.pdf", None))
+        )
+        for row in range(rng.randint(0, 40))
+    ])
+
+
+def assert_slices_match(listings: List[List[RawReport]]) -> None:
+    """Every symbol's slice equals ``process_reports`` on its listing."""
+    batch = process_report_batch(columns_from_reports(listings))
+
+    expected = {
+        listing[0].symbol: process_reports(listing)
+        for listing in listings if listing
+    }
+    assert batch == expected
+    assert list(batch) == list(expected)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_market(seed):
+    rng = random.Random(seed)
+    assert_slices_match([
+        random_listing(f"S{index:03d}", rng) for index in range(50)
+    ])
+
+
+def test_symbols_without_reports_get_empty_slices():
+    listings = [
+        build_reports("ABC", "c", [
+            ("Báo cáo tài chính công ty mẹ", "Q1/2024", "//cdn/a.pdf"),
+        ]),
+        build_reports("XYZ", "c", [(None, "Q1/2024", "//cdn/b.pdf")]),
+        build_reports("FPT", "c", [("BCTC", "Q1/2024", "//cdn/c.pdf")]),
+    ]
+
+    batch = process_report_batch(columns_from_reports(listings))
+    assert batch["abc"] == batch["xyz"] == []
+    assert [record.report_url for record in batch["fpt"]] == [
+        "https://cdn/c.pdf"
+    ]
+
+
+def test_duplicates_are_resolved_per_symbol():
+    # Same period in two symbols: each keeps its own best report
+    listings = [
+        build_reports("AAA", "a", [
+            ("BCTC", "Q1/2024", "//cdn/a_plain.pdf"),
+            ("BCTC (đã kiểm toán)", "Q1/2024", "//cdn/a_aud.pdf"),
+        ]),
+        build_reports("BBB", "b", [
+            ("BCTC", "Q1/2024", "//cdn/b_plain.pdf"),
+        ]),
+    ]
+
+    assert_slices_match(listings)
+    batch = process_report_batch(columns_from_reports(listings))
+    assert [record.report_url for record in batch["aaa"]] == [
+        "https://cdn/a_aud.pdf"
+    ]
+
+
+def test_empty_batch():
+    columns = columns_from_reports([[], []])
+
+    assert columns == ReportColumns([], [], [], [], [])
+    assert process_report_batch(columns) == {}
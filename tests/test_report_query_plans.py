@@ -0,0 +1,150 @@
+"""
+The report queries ``search`` and ``upsert_bulk`` run use the indexes.
+
+Every statement a repository call sends to a populated SQLite database
+is captured and explained with ``EXPLAIN QUERY PLAN``, using the same
+parameters.
+"""
+
+from typing import Any, Dict, Iterator, List, Tuple
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from backend.database import Base, QueryPlanCheck
+from backend.database.models import FinancialReport
+from backend.database.repositories import ReportRepository
+
+NATURAL_KEY_INDEX = "ux_financial_reports_natural_key"
+LISTING_INDEX = "ix_financial_reports_listing"
+
+SYMBOLS = 50
+YEARS = range(2014, 2026)
+
+
+def report(symbol: str, year: int, quarter=None) -> Dict[str, Any]:
+    """Fields of one report."""
+    return {
+        "symbol": symbol,
+        "company_name": f"công ty {symbol}",
+        "report_name": "báo cáo tài chính hợp nhất",
+        "report_type": "quarterly" if quarter else "annual",
+        "report_year": year,
+        "report_quarter": quarter,
+        "is_audited": quarter is None,
+        "is_reviewed": quarter == 2,
+        "report_url": f"https://cdn/{symbol}_{year}_{quarter}.pdf",
+    }
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A file database holding 3,000 reports of 50 symbols."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine, tables=[FinancialReport.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(FinancialReport), [
+            report(f"s{index:03d}", year, quarter)
+            for index in range(SYMBOLS)
+            for year in YEARS
+            for quarter in (None, 1, 2, 3, 4)
+        ])
+    yield engine
+    engine.dispose()
+
+
+class Statements:
+    """SELECTs sent through an engine while capturing."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.captured: List[Tuple[str, Any]] = []
+        event.listen(engine, "before_cursor_execute", self.capture)
+
+    def capture(self, conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.captured.append((statement, parameters))
+
+    def plans(self) -> Iterator[Tuple[str, List[str]]]:
+        """Each captured statement with its plan steps."""
+        event.remove(self.engine, "before_cursor_execute", self.capture)
+        with self.engine.connect() as conn:
+            for statement, parameters in self.captured:
+                yield statement, [
+                    row[-1] for row in conn.exec_driver_sql(
+                        f"EXPLAIN QUERY PLAN {statement}", parameters
+                    )
+                ]
+
+
+def run(engine, call) -> List[Tuple[str, List[str]]]:
+    """Plans of the SELECTs a repository call runs."""
+    statements = Statements(engine)
+    with Session(bind=engine) as session:
+        call(ReportRepository(session))
+    plans = list(statements.plans())
+    assert plans, "the call ran no SELECT"
+    return plans
+
+
+def uses(index: str, steps: List[str]) -> bool:
+    """Whether a plan reads financial_reports through an index."""
+    return any(
+        step.startswith("SEARCH financial_reports") and index in step
+        for step in steps
+    )
+
+
+def test_upsert_bulk_finds_periods_by_natural_key(engine):
+    reports = [
+        report("s001", 2024, 1),
+        report("s001", 2024, None),
+        report("new", 2025, 3),
+        report("new", 2025, None),
+    ]
+
+    plans = run(engine, lambda repository: repository.upsert_bulk(reports))
+
+    # One lookup per period; the rest reload written rows by primary key
+    lookups = [
+        steps for statement, steps in plans if "report_type" in statement
+        and "WHERE financial_reports.id" not in statement
+    ]
+    assert len(lookups) == len(reports)
+    for steps in lookups:
+        assert uses(NATURAL_KEY_INDEX, steps), steps
+    for statement, steps in plans:
+        assert not QueryPlanCheck.full_passes(steps), (statement, steps)
+
+
+@pytest.mark.parametrize("filters", [
+    {"symbol": "s007"},
+    {"symbol": "s007", "report_year": 2020},
+    {"symbol": "s007", "is_audited": True},
+])
+def test_search_by_symbol_seeks_listing_index(engine, filters):
+    plans = run(
+        engine, lambda repository: repository.search(limit=10, **filters)
+    )
+
+    page, _ = plans[0]
+    for statement, steps in plans:
+        if statement == page:
+            assert uses(LISTING_INDEX, steps), steps
+        assert not QueryPlanCheck.full_passes(steps), (statement, steps)
+
+
+def test_search_cursor_page_seeks_listing_index(engine):
+    def walk(repository: ReportRepository):
+        _, _, cursor = repository.search(limit=100, with_total=False)
+        repository.search(limit=100, cursor=cursor, with_total=False)
+
+    first, second = run(engine, walk)
+
+    # The first page reads the index from its start, in order
+    assert first[1] == [f"SCAN financial_reports USING INDEX {LISTING_INDEX}"]
+    assert uses(LISTING_INDEX, second[1]), second[1]
+    assert not QueryPlanCheck.full_passes(second[1]), second[1]
+
+
+def test_plan_check_passes_on_current_schema(engine):
+    assert QueryPlanCheck(engine).run()
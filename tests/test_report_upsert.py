@@ -0,0 +1,77 @@
+"""``upsert_bulk`` never downgrades a stored report."""
+
+from typing import Any, Dict
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from backend.database import Base
+from backend.database.models import FinancialReport
+from backend.database.repositories import ReportRepository
+
+
+def report(version: str, **fields) -> Dict[str, Any]:
+    """Q2/2024 report of FPT in one version: plain, reviewed or audited."""
+    return {
+        "symbol": "FPT",
+        "company_name": "công ty fpt",
+        "report_name": f"báo cáo tài chính {version}",
+        "report_type": "quarterly",
+        "report_year": 2024,
+        "report_quarter": 2,
+        "is_audited": version == "audited",
+        "is_reviewed": version == "reviewed",
+        "report_url": f"https://cdn/fpt_{version}.pdf",
+        **fields,
+    }
+
+
+@pytest.fixture
+def repository(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine, tables=[FinancialReport.__table__])
+    with Session(engine) as session:
+        yield ReportRepository(session)
+    engine.dispose()
+
+
+def stored(repository: ReportRepository) -> FinancialReport:
+    """The only stored report."""
+    reports = repository.get_by_symbol("fpt")
+    assert len(reports) == 1
+    return reports[0]
+
+
+def test_audited_report_survives_plain_reimport(repository):
+    first = repository.upsert_bulk([report("audited")])
+
+    result = repository.upsert_bulk([report("plain"), report("reviewed")])
+
+    assert (result["created"], result["updated"]) == (0, 0)
+    assert result["ids"] == first["ids"] * 2
+    kept = stored(repository)
+    assert (kept.is_audited, kept.is_reviewed) == (True, False)
+    assert kept.report_url == "https://cdn/fpt_audited.pdf"
+
+
+def test_reviewed_report_survives_plain_reimport(repository):
+    repository.upsert_bulk([report("reviewed")])
+
+    assert repository.upsert_bulk([report("plain")])["updated"] == 0
+    assert stored(repository).is_reviewed
+
+
+@pytest.mark.parametrize("old, new", [
+    ("plain", "plain"),
+    ("plain", "reviewed"),
+    ("reviewed", "audited"),
+    ("audited", "audited"),
+])
+def test_equal_or_higher_priority_replaces(repository, old, new):
+    repository.upsert_bulk([report(old)])
+
+    result = repository.upsert_bulk([report(new, company_name="fpt corp")])
+
+    assert (result["created"], result["updated"]) == (0, 1)
+    kept = stored(repository)
+    assert kept.report_url == f"https://cdn/fpt_{new}.pdf"
+    assert kept.company_name == "fpt corp"